@@ -17,7 +17,7 @@ import structlog
 from prometheus_client import Counter, Histogram, Gauge, generate_latest
 from starlette.responses import Response
 
-from ..config.settings import get_settings
+from ..config.settings import configure_logging, get_settings
 from ..core.video_processing_engine import VideoProcessingEngine, VideoProcessingConfig, VideoFormat
 from ..services.youtube_api_service import YouTubeAPIService, UploadMetadata
 from ..services.content_generation_service import (
@@ -33,6 +33,7 @@ from ..models.api_models import (
 
 logger = structlog.get_logger()
 settings = get_settings()
+configure_logging(settings.debug)
 
 # Prometheus metrics
 REQUEST_COUNT = Counter(
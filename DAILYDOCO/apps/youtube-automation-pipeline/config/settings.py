@@ -1,7 +1,10 @@
 """Configuration management for YouTube Automation Pipeline."""
 
+import logging
 import os
+import sys
 from typing import Dict, List, Any, Optional
+import orjson
 from pydantic import BaseSettings, Field, validator
 from pydantic_settings import BaseSettings as PydanticBaseSettings
 import structlog
@@ -86,6 +89,9 @@ class VideoProcessingSettings(BaseSettings):
     ffmpeg_path: str = Field(default="ffmpeg", env="FFMPEG_PATH")
     gpu_acceleration: bool = Field(default=True, env="GPU_ACCELERATION")
     hardware_encoder: str = Field(default="nvenc", env="HARDWARE_ENCODER")  # nvenc, vaapi, videotoolbox
+    nvenc_max_sessions: int = Field(default=3, env="NVENC_MAX_SESSIONS")  # per host; consumer GPUs cap these
+    nvenc_acquire_timeout_seconds: float = Field(default=600.0, env="NVENC_ACQUIRE_TIMEOUT_SECONDS")
+    nvenc_lock_dir: str = Field(default="/app/temp/nvenc-sessions", env="NVENC_LOCK_DIR")  # shared by all workers on a host
     
     # Video quality settings
     output_resolution: str = Field(default="1920x1080", env="OUTPUT_RESOLUTION")
@@ -237,6 +243,30 @@ class Settings(PydanticBaseSettings):
         return v
 
 
+def configure_logging(debug: bool = False) -> None:
+    """Configure structlog to emit orjson-rendered JSON lines.
+    
+    Events below the configured level are dropped by the bound logger
+    itself, before any processor runs. Lines go to the process's real
+    stdout: Celery workers replace ``sys.stdout`` with a logging proxy
+    that has no binary buffer. Called by the API and worker entry points.
+    """
+    structlog.configure(
+        processors=[
+            structlog.contextvars.merge_contextvars,
+            structlog.processors.add_log_level,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            structlog.processors.format_exc_info,
+            structlog.processors.JSONRenderer(serializer=orjson.dumps),
+        ],
+        wrapper_class=structlog.make_filtering_bound_logger(
+            logging.DEBUG if debug else logging.INFO
+        ),
+        logger_factory=structlog.BytesLoggerFactory(file=sys.__stdout__.buffer),
+        cache_logger_on_first_use=True,
+    )
+
+
 # Global settings instance
 settings = Settings()
 
@@ -5,10 +5,11 @@ import subprocess
 import tempfile
 import os
 import json
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
 from pathlib import Path
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntEnum
 import cv2
 import numpy as np
 from PIL import Image, ImageDraw, ImageFont
@@ -22,6 +23,7 @@ from ..config.settings import get_settings
 from ..models.video_models import VideoProcessingJob, VideoMetadata, ProcessingStatus
 from ..services.ai_narration_service import AInarrationService
 from ..services.aegnt27_service import Aegnt27Service
+from ..utils.gpu_sessions import NvencSessionTimeout, nvenc_session_async
 from ..utils.gpu_utils import get_gpu_info, select_optimal_gpu
 from ..utils.performance_monitor import PerformanceMonitor
 
@@ -38,6 +40,12 @@ class VideoFormat(Enum):
     TWITTER = "twitter"  # 16:9, 1080p, optimized for Twitter
 
 
+@lru_cache(maxsize=None)
+def _video_format(value: str) -> VideoFormat:
+    """Look up a ``VideoFormat`` by value, memoised per distinct value."""
+    return VideoFormat(value)
+
+
 class ProcessingStage(Enum):
     """Video processing stages."""
     ANALYSIS = "analysis"
@@ -54,7 +62,36 @@ class ProcessingStage(Enum):
     METADATA_EXTRACTION = "metadata_extraction"
 
 
-@dataclass
+class ProcessingErrorCode(IntEnum):
+    """Failure categories reported on ``ProcessingResult.error_code``."""
+    GPU_OOM = 1
+    HOST_OOM = 2
+    INPUT_MISSING = 3
+    INVALID_INPUT = 4
+    STAGE_FAILED = 5
+    GPU_BUSY = 6
+
+
+# Keyed by exception type; subclasses resolve through their MRO
+ERROR_CODES_BY_EXCEPTION = {
+    torch.cuda.OutOfMemoryError: ProcessingErrorCode.GPU_OOM,
+    MemoryError: ProcessingErrorCode.HOST_OOM,
+    NvencSessionTimeout: ProcessingErrorCode.GPU_BUSY,
+    FileNotFoundError: ProcessingErrorCode.INPUT_MISSING,
+    ValueError: ProcessingErrorCode.INVALID_INPUT,
+}
+
+
+def error_code_for(exc: BaseException) -> ProcessingErrorCode:
+    """Classify a processing exception by its type."""
+    for exc_type in type(exc).__mro__:
+        code = ERROR_CODES_BY_EXCEPTION.get(exc_type)
+        if code is not None:
+            return code
+    return ProcessingErrorCode.STAGE_FAILED
+
+
+@dataclass(slots=True, frozen=True)
 class VideoProcessingConfig:
     """Configuration for video processing."""
     input_path: str
@@ -75,6 +112,20 @@ class VideoProcessingConfig:
     thumbnail_count: int = 5
     chapters_enabled: bool = True
     
+    @classmethod
+    def from_job_data(cls, job_data: Dict[str, Any]) -> "VideoProcessingConfig":
+        """Build the configuration for a queued processing job."""
+        return cls(
+            input_path=job_data['input_path'],
+            output_path=job_data['output_path'],
+            format=_video_format(job_data.get('format', 'youtube_long')),
+            quality_preset=job_data.get('quality_preset', 'high'),
+            enable_gpu=job_data.get('enable_gpu', True),
+            enable_ai_narration=job_data.get('enable_ai_narration', True),
+            enable_authenticity_injection=job_data.get('enable_authenticity_injection', True),
+            enable_thumbnail_generation=job_data.get('enable_thumbnail_generation', True)
+        )
+
 
 @dataclass
 class ProcessingResult:
@@ -85,6 +136,7 @@ class ProcessingResult:
     thumbnails: List[str] = None
     processing_time_seconds: float = 0.0
     error_message: Optional[str] = None
+    error_code: Optional[ProcessingErrorCode] = None
     performance_metrics: Optional[Dict[str, Any]] = None
     authenticity_score: Optional[float] = None
     
@@ -201,6 +253,7 @@ class VideoProcessingEngine:
             return ProcessingResult(
                 success=False,
                 error_message=str(e),
+                error_code=error_code_for(e),
                 processing_time_seconds=processing_time
             )
     
@@ -516,7 +569,7 @@ class VideoProcessingEngine:
             ffmpeg_args = self._get_ffmpeg_args(config)
             
             # Render video with optimal settings
-            (
+            render = (
                 ffmpeg
                 .input(input_path)
                 .output(
@@ -524,8 +577,13 @@ class VideoProcessingEngine:
                     **ffmpeg_args
                 )
                 .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
             )
+            if ffmpeg_args["vcodec"] == "h264_nvenc":
+                # NVENC sessions are capped per GPU; share the host-wide slots
+                async with nvenc_session_async():
+                    render.run(capture_stdout=True, capture_stderr=True)
+            else:
+                render.run(capture_stdout=True, capture_stderr=True)
             
             if not Path(config.output_path).exists():
                 raise RuntimeError("Video rendering failed")
@@ -29,6 +29,10 @@ from ..utils.engagement_predictor import EngagementPredictor
 logger = structlog.get_logger()
 settings = get_settings()
 
+# Gaps between sampled frames longer than a typical GOP are crossed with a
+# keyframe seek rather than by decoding every frame in between
+VISUAL_SAMPLE_SEEK_FRAMES = 250
+
 
 class ContentType(Enum):
     """Types of content that can be generated."""
@@ -266,19 +270,35 @@ class ContentGenerationService:
             visual_complexity_scores = []
             motion_scores = []
             
+            # Decode targets are reused across samples: OpenCV writes into a
+            # destination array of matching shape instead of allocating one
+            frame = None
+            edges = None
+            spare_gray = None
             prev_frame = None
             frame_idx = 0
+            next_sample = 0
             
             while True:
-                ret, frame = cap.read()
-                if not ret:
+                if next_sample - frame_idx > VISUAL_SAMPLE_SEEK_FRAMES:
+                    cap.set(cv2.CAP_PROP_POS_FRAMES, next_sample)
+                    frame_idx = next_sample
+                
+                # grab() demuxes and decodes only; skipped frames never pay
+                # for the YUV->BGR conversion that read() does
+                if not cap.grab():
                     break
                 
-                if frame_idx % sample_interval == 0:
+                if frame_idx == next_sample:
+                    ret, frame = cap.retrieve(frame)
+                    if not ret:
+                        break
+                    next_sample += sample_interval
+                    
                     # Calculate visual complexity (edge density)
-                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-                    edges = cv2.Canny(gray, 50, 150)
-                    complexity = np.sum(edges > 0) / (edges.shape[0] * edges.shape[1])
+                    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=spare_gray)
+                    edges = cv2.Canny(gray, 50, 150, edges=edges)
+                    complexity = cv2.countNonZero(edges) / (edges.shape[0] * edges.shape[1])
                     visual_complexity_scores.append(complexity)
                     
                     # Calculate motion if we have a previous frame
@@ -290,7 +310,8 @@ class ContentGenerationService:
                         motion_score = 0.1  # Placeholder
                         motion_scores.append(motion_score)
                     
-                    prev_frame = gray.copy()
+                    # Double-buffer the grayscale frames instead of copying
+                    spare_gray, prev_frame = prev_frame, gray
                 
                 frame_idx += 1
             
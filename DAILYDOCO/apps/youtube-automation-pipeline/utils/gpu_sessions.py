@@ -0,0 +1,86 @@
+"""Host-wide limits on concurrent hardware encoder sessions."""
+
+import asyncio
+import fcntl
+import os
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncIterator, Iterator, Tuple
+
+from ..config.settings import get_settings
+
+# How long a caller waits between scans for a free session slot
+SESSION_POLL_INTERVAL_SECONDS = 0.25
+
+
+class NvencSessionTimeout(TimeoutError):
+    """No NVENC session slot became free within the acquire timeout."""
+
+
+def _acquire_slot() -> Tuple[int, int]:
+    """Lock a free session slot, returning ``(slot, fd)``.
+
+    Polls until a slot is free, raising ``NvencSessionTimeout`` once
+    ``nvenc_acquire_timeout_seconds`` have passed.
+    """
+    video_settings = get_settings().video_processing
+    lock_dir = video_settings.nvenc_lock_dir
+    # Private to the service user, so no other local user can hold the slots
+    os.makedirs(lock_dir, mode=0o700, exist_ok=True)
+    deadline = time.monotonic() + video_settings.nvenc_acquire_timeout_seconds
+
+    while True:
+        for slot in range(video_settings.nvenc_max_sessions):
+            fd = os.open(
+                os.path.join(lock_dir, f"nvenc-session-{slot}.lock"),
+                os.O_RDWR | os.O_CREAT,
+                0o600
+            )
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                os.close(fd)
+                continue
+            return slot, fd
+
+        if time.monotonic() >= deadline:
+            raise NvencSessionTimeout(
+                f"No NVENC session slot free after "
+                f"{video_settings.nvenc_acquire_timeout_seconds:g}s"
+            )
+        time.sleep(SESSION_POLL_INTERVAL_SECONDS)
+
+
+def _release_slot(fd: int) -> None:
+    """Unlock and close a slot taken by ``_acquire_slot``."""
+    fcntl.flock(fd, fcntl.LOCK_UN)
+    os.close(fd)
+
+
+@contextmanager
+def nvenc_session() -> Iterator[int]:
+    """Hold one of the host's NVENC session slots for the duration of the block.
+
+    Slots are ``flock``-ed files shared by every worker process on the host,
+    so the cap holds across prefork children and threads alike, and the
+    kernel frees a slot if its holder dies mid-encode. Waits until a slot
+    is free and yields its index, or raises ``NvencSessionTimeout``.
+    """
+    slot, fd = _acquire_slot()
+    try:
+        yield slot
+    finally:
+        _release_slot(fd)
+
+
+@asynccontextmanager
+async def nvenc_session_async() -> AsyncIterator[int]:
+    """``nvenc_session`` for coroutines: waits for a slot in a thread.
+
+    Other tasks on the event loop keep running while this one waits.
+    """
+    slot, fd = await asyncio.to_thread(_acquire_slot)
+    try:
+        yield slot
+    finally:
+        _release_slot(fd)
@@ -1,16 +1,25 @@
 """Security manager for authentication, authorization, and content compliance."""
 
 import asyncio
+import functools
 import hashlib
+import heapq
+import os
 import secrets
 import time
-from typing import Dict, List, Optional, Any, Tuple
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, FrozenSet, Iterator, List, Optional, Any, Tuple
 from datetime import datetime, timedelta, timezone
-from dataclasses import dataclass
-from enum import Enum
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+import ahocorasick
 import jwt
-from cryptography.fernet import Fernet
+from cryptography.exceptions import InvalidTag
+from cryptography.fernet import Fernet, InvalidToken
 from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
 import re
@@ -27,14 +36,55 @@ from ..models.security_models import (
 logger = structlog.get_logger()
 settings = get_settings()
 
+JWT_ISSUER = 'dailydoco-youtube-pipeline'
 
-class SecurityLevel(Enum):
-    """Security access levels."""
-    PUBLIC = "public"
-    AUTHENTICATED = "authenticated"
-    CHANNEL_OWNER = "channel_owner"
-    ADMIN = "admin"
-    SUPER_ADMIN = "super_admin"
+# Version prefix for AES-GCM envelopes (Fernet tokens always start with b'g')
+AEAD_VERSION = b'\x02'
+AEAD_NONCE_SIZE = 12
+AEAD_TAG_SIZE = 16
+
+# Short-lived cache of successful password verifications
+AUTH_CACHE_TTL_SECONDS = 30
+AUTH_CACHE_MAX_SIZE = 1024
+
+# Number of stripes for session and rate-limit maps (power of two)
+STATE_SHARD_COUNT = 16
+
+# Characters case-folded at a time when scanning text for banned keywords
+KEYWORD_SCAN_CHUNK_SIZE = 64 * 1024
+
+# Retained security events and per-minute metrics window
+SECURITY_EVENT_BUFFER_SIZE = 10_000
+EVENT_BUCKET_COUNT = 60
+
+# Text scanning patterns, compiled once at import
+PROFANITY_PATTERNS = [
+    re.compile(r'\b(fuck|shit|damn|bitch)\b', re.IGNORECASE),
+    re.compile(r'\b(asshole|bastard)\b', re.IGNORECASE)
+]
+SPAM_PATTERNS = [
+    re.compile(r'(click here|buy now|limited time)', re.IGNORECASE),
+    re.compile(r'(\$\d+|free money|get rich)', re.IGNORECASE),
+    re.compile(r'(subscribe|like and subscribe){3,}', re.IGNORECASE)
+]
+COPYRIGHT_PATTERNS = [
+    re.compile(r'(?i)(copyright|©|trademark|®)'),
+    re.compile(r'(?i)(all rights reserved|proprietary)')
+]
+
+
+class SecurityLevel(IntEnum):
+    """Security access levels, ordered by privilege."""
+    PUBLIC = 1
+    AUTHENTICATED = 2
+    CHANNEL_OWNER = 3
+    ADMIN = 4
+    SUPER_ADMIN = 5
+    
+    @property
+    def label(self) -> str:
+        """External string form (e.g. ``"super_admin"``)."""
+        return self.name.lower()
 
 
 class PermissionType(Enum):
@@ -48,26 +98,44 @@ class PermissionType(Enum):
     ADMIN_ACCESS = "admin_access"
 
 
-class ThreatLevel(Enum):
-    """Threat levels for security events."""
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
+class ThreatLevel(IntEnum):
+    """Threat levels for security events, ordered by severity."""
+    LOW = 1
+    MEDIUM = 2
+    HIGH = 3
+    CRITICAL = 4
+    
+    @property
+    def label(self) -> str:
+        """External string form (e.g. ``"high"``)."""
+        return self.name.lower()
+
+
+# Permissions granted implicitly on resources the user owns
+RESOURCE_PERMISSIONS = frozenset({
+    PermissionType.READ, PermissionType.WRITE, PermissionType.DELETE
+})
 
 
 @dataclass
 class SecurityContext:
     """Security context for requests."""
     user_id: Optional[str]
-    channel_ids: List[str]
-    permissions: List[str]
+    channel_ids: FrozenSet[str]
+    permissions: FrozenSet[str]
     security_level: SecurityLevel
     session_id: str
     ip_address: str
     user_agent: str
     authenticated_at: datetime
     expires_at: datetime
+    expires_at_ts: float = field(init=False)
+    is_super_admin: bool = field(init=False)
+    
+    def __post_init__(self) -> None:
+        # POSIX timestamp for cheap expiry checks on the request path
+        self.expires_at_ts = self.expires_at.timestamp()
+        self.is_super_admin = self.security_level is SecurityLevel.SUPER_ADMIN
 
 
 @dataclass
@@ -83,6 +151,57 @@ class ContentScanConfig:
     enable_adult_content_detection: bool = True
 
 
+@dataclass(slots=True, frozen=True)
+class ContentViolation:
+    """A single compliance violation found while scanning content."""
+    type: str
+    severity_score: float
+    description: str
+    location: Optional[int] = None
+    count: Optional[int] = None
+
+
+@functools.lru_cache(maxsize=32)
+def _build_keyword_automaton(
+    keywords: Tuple[str, ...]
+) -> Tuple[ahocorasick.Automaton, int]:
+    """Compile banned keywords into an Aho-Corasick automaton.
+    
+    Returns the automaton and the length of the longest folded keyword.
+    """
+    
+    automaton = ahocorasick.Automaton()
+    max_length = 0
+    for index, keyword in enumerate(keywords):
+        folded = keyword.lower()
+        if folded:
+            automaton.add_word(folded, (index, keyword, len(folded)))
+            max_length = max(max_length, len(folded))
+    if max_length:
+        automaton.make_automaton()
+    return automaton, max_length
+
+
+def _iter_keyword_matches(
+    text: str,
+    keywords: Tuple[str, ...]
+) -> Iterator[Tuple[int, int, str]]:
+    """Yield ``(location, index, keyword)`` for case-insensitive keyword hits.
+    
+    The text is lower-cased in overlapping chunks rather than copied whole,
+    so matches inside the overlap may be yielded twice.
+    """
+    
+    automaton, max_length = _build_keyword_automaton(keywords)
+    if not max_length:
+        return
+    
+    for chunk_start in range(0, len(text), KEYWORD_SCAN_CHUNK_SIZE):
+        chunk = text[chunk_start:chunk_start + KEYWORD_SCAN_CHUNK_SIZE + max_length - 1].lower()
+        for end_index, (index, keyword, length) in automaton.iter(chunk):
+            yield chunk_start + end_index - length + 1, index, keyword
+
+
 class SecurityManager:
     """Comprehensive security manager for authentication and authorization."""
     
@@ -93,17 +212,53 @@ class SecurityManager:
             deprecated="auto"
         )
         
+        # bcrypt releases the GIL, so hash on a dedicated pool off the event loop
+        self._bcrypt_pool = ThreadPoolExecutor(
+            max_workers=max(2, os.cpu_count() or 1),
+            thread_name_prefix="bcrypt"
+        )
+        
+        # JWT signing configuration, resolved once
+        self._jwt_secret = self.settings.security.jwt_secret_key.encode()
+        self._jwt_algorithm = self.settings.security.jwt_algorithm
+        self._jwt_algorithms = [self._jwt_algorithm]
+        self._jwt = jwt.PyJWT(options={
+            'require': ['exp', 'iat', 'iss', 'session_id'],
+            'verify_exp': True,
+            'verify_iss': True
+        })
+        
         # Initialize encryption
         self._init_encryption()
         
-        # Rate limiting
-        self.rate_limits: Dict[str, List[float]] = {}
+        # Recently verified credentials: keyed-BLAKE2b(user:pass) -> (user_id, verified_at)
+        self._auth_cache: OrderedDict[bytes, Tuple[str, float]] = OrderedDict()
+        self._auth_cache_key = hashlib.blake2b(
+            self._jwt_secret, person=b'dd_auth_cache', digest_size=32
+        ).digest()
+        
+        # Rate limiting (striped by identifier)
+        self._rate_limit_shards: List[Dict[str, List[float]]] = [
+            {} for _ in range(STATE_SHARD_COUNT)
+        ]
+        
+        # Active sessions (striped by session id)
+        self._session_shards: List[Dict[str, SecurityContext]] = [
+            {} for _ in range(STATE_SHARD_COUNT)
+        ]
+        
+        # Session expiries as a min-heap of (expires_at_ts, session_id)
+        self._expiry_heap: List[Tuple[float, str]] = []
         
-        # Active sessions
-        self.active_sessions: Dict[str, SecurityContext] = {}
+        # Security event buffer (most recent events only)
+        self.security_events: deque[SecurityEvent] = deque(maxlen=SECURITY_EVENT_BUFFER_SIZE)
         
-        # Security event buffer
-        self.security_events: List[SecurityEvent] = []
+        # Per-minute event counts by threat level for the last hour
+        self._threat_levels = list(ThreatLevel)
+        self._event_buckets: List[List[int]] = [
+            [0] * len(self._threat_levels) for _ in range(EVENT_BUCKET_COUNT)
+        ]
+        self._event_bucket_minutes: List[int] = [-1] * EVENT_BUCKET_COUNT
         
         logger.info("Security manager initialized")
     
@@ -113,17 +268,42 @@ class SecurityManager:
         # Generate or load encryption key
         key_material = self.settings.security.jwt_secret_key.encode()
         
-        # Derive key for Fernet encryption
+        # Derive key for Fernet encryption (cached per process)
+        key = self._derive_fernet_key(
+            key_material,
+            b'dailydoco_salt'  # In production, use random salt
+        )
+        self.fernet = Fernet(key)
+        
+        # AES-GCM for bulk encryption, keyed off the same KDF output
+        self.aead = AESGCM(self._derive_aead_key(key))
+        
+        logger.info("Encryption initialized")
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _derive_fernet_key(key_material: bytes, salt: bytes) -> bytes:
+        """Derive a Fernet key from key material, memoized per (key, salt)."""
+        
         kdf = PBKDF2HMAC(
             algorithm=hashes.SHA256(),
             length=32,
-            salt=b'dailydoco_salt',  # In production, use random salt
+            salt=salt,
             iterations=100000,
         )
-        key = base64.urlsafe_b64encode(kdf.derive(key_material))
-        self.fernet = Fernet(key)
+        return base64.urlsafe_b64encode(kdf.derive(key_material))
+    
+    @staticmethod
+    def _derive_aead_key(fernet_key: bytes) -> bytes:
+        """Derive a separate 32-byte AES-GCM key from the Fernet key."""
         
-        logger.info("Encryption initialized")
+        hkdf = HKDF(
+            algorithm=hashes.SHA256(),
+            length=32,
+            salt=None,
+            info=b'dailydoco_aead',
+        )
+        return hkdf.derive(base64.urlsafe_b64decode(fernet_key))
     
     # Authentication Methods
     
@@ -149,7 +329,7 @@ class SecurityManager:
             # Find user (this would query your database)
             user = await self._get_user_by_username(username)
             
-            if not user or not self.password_context.verify(password, user.password_hash):
+            if not user or not await self._verify_password(username, password, user):
                 await self._log_security_event(
                     "authentication_failure",
                     ThreatLevel.LOW,
@@ -176,8 +356,8 @@ class SecurityManager:
             
             security_context = SecurityContext(
                 user_id=user.id,
-                channel_ids=[ch.id for ch in channels],
-                permissions=[p.name for p in permissions],
+                channel_ids=frozenset(ch.id for ch in channels),
+                permissions=frozenset(p.name for p in permissions),
                 security_level=self._determine_security_level(permissions),
                 session_id=session_id,
                 ip_address=ip_address,
@@ -187,7 +367,8 @@ class SecurityManager:
             )
             
             # Store active session
-            self.active_sessions[session_id] = security_context
+            self._session_shard(session_id)[session_id] = security_context
+            heapq.heappush(self._expiry_heap, (security_context.expires_at_ts, session_id))
             
             await self._log_security_event(
                 "authentication_success",
@@ -207,6 +388,52 @@ class SecurityManager:
             logger.error("Authentication error", error=str(e))
             return None
     
+    @staticmethod
+    def _shard(key: str) -> int:
+        """Map a key to its shard index."""
+        return hash(key) & (STATE_SHARD_COUNT - 1)
+    
+    def _session_shard(self, session_id: str) -> Dict[str, SecurityContext]:
+        """Get the session shard owning a session id."""
+        return self._session_shards[self._shard(session_id)]
+    
+    def _rate_limit_shard(self, identifier: str) -> Dict[str, List[float]]:
+        """Get the rate-limit shard owning an identifier."""
+        return self._rate_limit_shards[self._shard(identifier)]
+    
+    async def _verify_password(self, username: str, password: str, user: Any) -> bool:
+        """Verify password, skipping bcrypt for recently verified credentials."""
+        
+        cache_key = hashlib.blake2b(
+            f"{username}:{password}".encode(),
+            key=self._auth_cache_key,
+            digest_size=16
+        ).digest()
+        
+        cached = self._auth_cache.get(cache_key)
+        if cached is not None:
+            user_id, verified_at = cached
+            if user_id == user.id and time.time() - verified_at < AUTH_CACHE_TTL_SECONDS:
+                self._auth_cache.move_to_end(cache_key)
+                return True
+            del self._auth_cache[cache_key]
+        
+        loop = asyncio.get_running_loop()
+        verified = await loop.run_in_executor(
+            self._bcrypt_pool,
+            self.password_context.verify,
+            password,
+            user.password_hash
+        )
+        if not verified:
+            return False
+        
+        self._auth_cache[cache_key] = (user.id, time.time())
+        if len(self._auth_cache) > AUTH_CACHE_MAX_SIZE:
+            self._auth_cache.popitem(last=False)
+        
+        return True
+    
     async def generate_access_token(
         self,
         security_context: SecurityContext
@@ -217,17 +444,17 @@ class SecurityManager:
             payload = {
                 'user_id': security_context.user_id,
                 'session_id': security_context.session_id,
-                'permissions': security_context.permissions,
-                'channel_ids': security_context.channel_ids,
+                'permissions': sorted(security_context.permissions),
+                'channel_ids': sorted(security_context.channel_ids),
                 'iat': int(time.time()),
                 'exp': int(security_context.expires_at.timestamp()),
-                'iss': 'dailydoco-youtube-pipeline'
+                'iss': JWT_ISSUER
             }
             
-            token = jwt.encode(
+            token = self._jwt.encode(
                 payload,
-                self.settings.security.jwt_secret_key,
-                algorithm=self.settings.security.jwt_algorithm
+                self._jwt_secret,
+                algorithm=self._jwt_algorithm
             )
             
             return token
@@ -245,17 +472,19 @@ class SecurityManager:
         
         try:
             # Decode token
-            payload = jwt.decode(
+            payload = self._jwt.decode(
                 token,
-                self.settings.security.jwt_secret_key,
-                algorithms=[self.settings.security.jwt_algorithm]
+                self._jwt_secret,
+                algorithms=self._jwt_algorithms,
+                issuer=JWT_ISSUER
             )
             
             session_id = payload.get('session_id')
             user_id = payload.get('user_id')
             
             # Check if session is still active
-            if session_id not in self.active_sessions:
+            sessions = self._session_shard(session_id)
+            if session_id not in sessions:
                 await self._log_security_event(
                     "invalid_session_token",
                     ThreatLevel.MEDIUM,
@@ -263,7 +492,7 @@ class SecurityManager:
                 )
                 return None
             
-            security_context = self.active_sessions[session_id]
+            security_context = sessions[session_id]
             
             # Verify IP address consistency (optional security measure)
             if self.settings.security.enable_ip_validation and security_context.ip_address != ip_address:
@@ -279,7 +508,7 @@ class SecurityManager:
                 return None
             
             # Check expiration
-            if security_context.expires_at <= datetime.now(timezone.utc):
+            if security_context.expires_at_ts <= time.time():
                 await self._invalidate_session(session_id)
                 return None
             
@@ -299,9 +528,6 @@ class SecurityManager:
                 {"ip_address": ip_address}
             )
             return None
-        except Exception as e:
-            logger.error("Token validation error", error=str(e))
-            return None
     
     # Authorization Methods
     
@@ -313,26 +539,20 @@ class SecurityManager:
     ) -> bool:
         """Check if user has specific permission."""
         
-        try:
-            # Super admins have all permissions
-            if security_context.security_level == SecurityLevel.SUPER_ADMIN:
-                return True
-            
-            # Check direct permission
-            if permission.value in security_context.permissions:
-                return True
-            
-            # Check resource-specific permissions
-            if resource_id and permission in [PermissionType.READ, PermissionType.WRITE, PermissionType.DELETE]:
-                # Check if user owns the channel/resource
-                if resource_id in security_context.channel_ids:
-                    return True
-            
-            return False
-            
-        except Exception as e:
-            logger.error("Permission check error", error=str(e))
-            return False
+        # Super admins have all permissions
+        if security_context.is_super_admin:
+            return True
+        
+        # Check direct permission
+        if permission.value in security_context.permissions:
+            return True
+        
+        # Check resource-specific permissions (user owns the channel/resource)
+        return bool(
+            resource_id
+            and permission in RESOURCE_PERMISSIONS
+            and resource_id in security_context.channel_ids
+        )
     
     async def check_channel_access(
         self,
@@ -342,24 +562,13 @@ class SecurityManager:
     ) -> bool:
         """Check if user can perform action on specific channel."""
         
-        try:
-            # Super admins have access to all channels
-            if security_context.security_level == SecurityLevel.SUPER_ADMIN:
-                return True
-            
-            # Check if user owns the channel
-            if channel_id in security_context.channel_ids:
-                return True
-            
-            # Check if user has global permission for this action
-            if action.value in security_context.permissions:
-                return True
-            
-            return False
-            
-        except Exception as e:
-            logger.error("Channel access check error", error=str(e))
-            return False
+        # Super admins have access to all channels; otherwise the user must
+        # own the channel or hold a global permission for this action
+        return (
+            security_context.is_super_admin
+            or channel_id in security_context.channel_ids
+            or action.value in security_context.permissions
+        )
     
     # Content Compliance Methods
     
@@ -379,26 +588,27 @@ class SecurityManager:
                 approved=True
             )
             
-            # Text content scanning
+            # Text, audio and video scans are independent; run them concurrently
+            scans = []
             if config.scan_text and 'text' in content:
-                text_violations = await self._scan_text_content(
-                    content['text'], config
-                )
-                scan_result.violations.extend(text_violations)
-            
-            # Audio content scanning
+                scans.append(self._scan_text_content(content['text'], config))
             if config.scan_audio and 'audio_path' in content:
-                audio_violations = await self._scan_audio_content(
-                    content['audio_path'], config
-                )
-                scan_result.violations.extend(audio_violations)
-            
-            # Video content scanning
+                scans.append(self._scan_audio_content(content['audio_path'], config))
             if config.scan_video and 'video_path' in content:
-                video_violations = await self._scan_video_content(
-                    content['video_path'], config
-                )
-                scan_result.violations.extend(video_violations)
+                scans.append(self._scan_video_content(content['video_path'], config))
+            
+            # A scan that failed leaves the content unverified, so it can't be approved
+            results = await asyncio.gather(*scans, return_exceptions=True)
+            for result in results:
+                if isinstance(result, BaseException):
+                    logger.error(
+                        "Content scan step failed",
+                        content_id=scan_result.content_id,
+                        error=str(result)
+                    )
+                    scan_result.approved = False
+                else:
+                    scan_result.violations.extend(result)
             
             # Calculate overall risk score
             if scan_result.violations:
@@ -407,7 +617,7 @@ class SecurityManager:
                 ) / len(scan_result.violations)
                 
                 # Determine if content is approved
-                scan_result.approved = scan_result.risk_score < 0.7
+                scan_result.approved = scan_result.approved and scan_result.risk_score < 0.7
             
             logger.info(
                 "Content scan completed",
@@ -435,68 +645,69 @@ class SecurityManager:
         self,
         text: str,
         config: ContentScanConfig
-    ) -> List[Dict[str, Any]]:
-        """Scan text content for violations."""
+    ) -> List[ContentViolation]:
+        """Scan text content for violations.
+        
+        Keyword and pattern matching is CPU-bound, so it runs on the default
+        executor and the event loop stays free for the other scans.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._scan_text_violations, text, config)
+    
+    def _scan_text_violations(
+        self,
+        text: str,
+        config: ContentScanConfig
+    ) -> List[ContentViolation]:
+        """Match ``text`` against the banned keywords and content patterns."""
         
         violations = []
         
         try:
             # Check banned keywords
             if config.banned_keywords:
-                text_lower = text.lower()
-                for keyword in config.banned_keywords:
-                    if keyword.lower() in text_lower:
-                        violations.append({
-                            'type': 'banned_keyword',
-                            'severity_score': 0.8,
-                            'description': f"Banned keyword detected: {keyword}",
-                            'location': text_lower.find(keyword.lower())
-                        })
+                keywords = tuple(config.banned_keywords)
+                # Report the first occurrence of each keyword in one pass
+                seen = set()
+                for location, index, keyword in _iter_keyword_matches(text, keywords):
+                    if index in seen:
+                        continue
+                    seen.add(index)
+                    violations.append(ContentViolation(
+                        type='banned_keyword',
+                        severity_score=0.8,
+                        description=f"Banned keyword detected: {keyword}",
+                        location=location
+                    ))
             
             # Check for profanity (simplified)
-            profanity_patterns = [
-                r'\b(fuck|shit|damn|bitch)\b',
-                r'\b(asshole|bastard)\b'
-            ]
-            
-            for pattern in profanity_patterns:
-                matches = re.findall(pattern, text, re.IGNORECASE)
+            for pattern in PROFANITY_PATTERNS:
+                matches = pattern.findall(text)
                 if matches:
-                    violations.append({
-                        'type': 'profanity',
-                        'severity_score': 0.6,
-                        'description': f"Profanity detected: {', '.join(matches)}",
-                        'count': len(matches)
-                    })
+                    violations.append(ContentViolation(
+                        type='profanity',
+                        severity_score=0.6,
+                        description=f"Profanity detected: {', '.join(matches)}",
+                        count=len(matches)
+                    ))
             
             # Check for spam patterns
-            spam_indicators = [
-                r'(click here|buy now|limited time)',
-                r'(\$\d+|free money|get rich)',
-                r'(subscribe|like and subscribe){3,}'
-            ]
-            
-            for pattern in spam_indicators:
-                if re.search(pattern, text, re.IGNORECASE):
-                    violations.append({
-                        'type': 'spam_indicator',
-                        'severity_score': 0.4,
-                        'description': 'Potential spam content detected'
-                    })
+            for pattern in SPAM_PATTERNS:
+                if pattern.search(text):
+                    violations.append(ContentViolation(
+                        type='spam_indicator',
+                        severity_score=0.4,
+                        description='Potential spam content detected'
+                    ))
             
             # Check for copyright mentions
-            copyright_patterns = [
-                r'(?i)(copyright|©|trademark|®)',
-                r'(?i)(all rights reserved|proprietary)'
-            ]
-            
-            for pattern in copyright_patterns:
-                if re.search(pattern, text):
-                    violations.append({
-                        'type': 'copyright_mention',
-                        'severity_score': 0.3,
-                        'description': 'Copyright-related content detected'
-                    })
+            for pattern in COPYRIGHT_PATTERNS:
+                if pattern.search(text):
+                    violations.append(ContentViolation(
+                        type='copyright_mention',
+                        severity_score=0.3,
+                        description='Copyright-related content detected'
+                    ))
             
         except Exception as e:
             logger.error("Text content scanning failed", error=str(e))
@@ -507,7 +718,7 @@ class SecurityManager:
         self,
         audio_path: str,
         config: ContentScanConfig
-    ) -> List[Dict[str, Any]]:
+    ) -> List[ContentViolation]:
         """Scan audio content for violations."""
         
         violations = []
@@ -531,7 +742,7 @@ class SecurityManager:
         self,
         video_path: str,
         config: ContentScanConfig
-    ) -> List[Dict[str, Any]]:
+    ) -> List[ContentViolation]:
         """Scan video content for violations."""
         
         violations = []
@@ -561,47 +772,61 @@ class SecurityManager:
     ) -> bool:
         """Check if request is within rate limits."""
         
-        try:
-            now = time.time()
-            window_start = now - window_seconds
-            
-            # Clean old entries
-            if identifier in self.rate_limits:
-                self.rate_limits[identifier] = [
-                    timestamp for timestamp in self.rate_limits[identifier]
-                    if timestamp > window_start
-                ]
-            else:
-                self.rate_limits[identifier] = []
-            
-            # Check if within limit
-            if len(self.rate_limits[identifier]) >= limit:
-                return False
-            
-            # Add current request
-            self.rate_limits[identifier].append(now)
-            return True
-            
-        except Exception as e:
-            logger.error("Rate limit check failed", error=str(e))
-            return True  # Allow on error
+        now = time.time()
+        window_start = now - window_seconds
+        rate_limits = self._rate_limit_shard(identifier)
+        
+        # Clean old entries
+        timestamps = [
+            timestamp for timestamp in rate_limits.get(identifier, ())
+            if timestamp > window_start
+        ]
+        rate_limits[identifier] = timestamps
+        
+        # Check if within limit
+        if len(timestamps) >= limit:
+            return False
+        
+        # Add current request
+        timestamps.append(now)
+        return True
     
     # Encryption/Decryption
     
     def encrypt_sensitive_data(self, data: str) -> str:
         """Encrypt sensitive data."""
-        try:
-            return self.fernet.encrypt(data.encode()).decode()
-        except Exception as e:
-            logger.error("Encryption failed", error=str(e))
-            raise
+        return self.fernet.encrypt(data.encode()).decode()
     
     def decrypt_sensitive_data(self, encrypted_data: str) -> str:
         """Decrypt sensitive data."""
         try:
             return self.fernet.decrypt(encrypted_data.encode()).decode()
-        except Exception as e:
-            logger.error("Decryption failed", error=str(e))
+        except InvalidToken:
+            logger.error("Decryption failed", error="invalid token")
+            raise
+    
+    def encrypt_sensitive_data_v2(self, data: bytes, aad: bytes = b"") -> bytes:
+        """Encrypt sensitive data with AES-GCM.
+        
+        Returns ``version(1) || nonce(12) || ciphertext || tag``.
+        """
+        nonce = secrets.token_bytes(AEAD_NONCE_SIZE)
+        return AEAD_VERSION + nonce + self.aead.encrypt(nonce, data, aad)
+    
+    def decrypt_sensitive_data_v2(self, encrypted_data: bytes, aad: bytes = b"") -> bytes:
+        """Decrypt AES-GCM data, falling back to Fernet for legacy tokens."""
+        try:
+            if encrypted_data[:1] != AEAD_VERSION:
+                return self.fernet.decrypt(encrypted_data)
+            
+            # Too short to hold a nonce and tag: AESGCM would raise ValueError
+            if len(encrypted_data) < 1 + AEAD_NONCE_SIZE + AEAD_TAG_SIZE:
+                raise InvalidTag()
+            
+            nonce = encrypted_data[1:1 + AEAD_NONCE_SIZE]
+            return self.aead.decrypt(nonce, encrypted_data[1 + AEAD_NONCE_SIZE:], aad)
+        except (InvalidToken, InvalidTag):
+            logger.error("Decryption failed", error="invalid token")
             raise
     
     # Security Event Logging
@@ -625,21 +850,34 @@ class SecurityManager:
             )
             
             self.security_events.append(event)
+            self._count_security_event(threat_level)
             
             # Alert on high/critical threats
-            if threat_level in [ThreatLevel.HIGH, ThreatLevel.CRITICAL]:
+            if threat_level >= ThreatLevel.HIGH:
                 await self._send_security_alert(event)
             
             logger.warning(
                 "Security event logged",
                 event_type=event_type,
-                threat_level=threat_level.value,
+                threat_level=threat_level.label,
                 details=details
             )
             
         except Exception as e:
             logger.error("Security event logging failed", error=str(e))
     
+    def _count_security_event(self, threat_level: ThreatLevel) -> None:
+        """Increment the current minute's bucket for a threat level."""
+        
+        minute = int(time.time() // 60)
+        slot = minute % EVENT_BUCKET_COUNT
+        
+        if self._event_bucket_minutes[slot] != minute:
+            self._event_bucket_minutes[slot] = minute
+            self._event_buckets[slot] = [0] * len(self._threat_levels)
+        
+        self._event_buckets[slot][threat_level - ThreatLevel.LOW] += 1
+    
     async def _send_security_alert(self, event: SecurityEvent) -> None:
         """Send security alert for high-priority events."""
         
@@ -650,7 +888,7 @@ class SecurityManager:
             logger.critical(
                 "SECURITY ALERT",
                 event_type=event.event_type,
-                threat_level=event.threat_level.value,
+                threat_level=event.threat_level.label,
                 details=event.details
             )
             
@@ -663,10 +901,8 @@ class SecurityManager:
         """Invalidate user session."""
         
         try:
-            if session_id in self.active_sessions:
-                security_context = self.active_sessions[session_id]
-                del self.active_sessions[session_id]
-                
+            security_context = self._session_shard(session_id).pop(session_id, None)
+            if security_context is not None:
                 await self._log_security_event(
                     "session_invalidated",
                     ThreatLevel.LOW,
@@ -685,11 +921,16 @@ class SecurityManager:
         """Clean up expired sessions."""
         
         try:
-            now = datetime.now(timezone.utc)
-            expired_sessions = [
-                session_id for session_id, context in self.active_sessions.items()
-                if context.expires_at <= now
-            ]
+            now_ts = time.time()
+            expired_sessions = []
+            
+            # Pop only the sessions due to expire; entries for sessions that
+            # were already invalidated are discarded on the way
+            while self._expiry_heap and self._expiry_heap[0][0] <= now_ts:
+                _, session_id = heapq.heappop(self._expiry_heap)
+                context = self._session_shard(session_id).get(session_id)
+                if context is not None and context.expires_at_ts <= now_ts:
+                    expired_sessions.append(session_id)
             
             for session_id in expired_sessions:
                 await self._invalidate_session(session_id)
@@ -727,24 +968,23 @@ class SecurityManager:
         
         try:
             now = datetime.now(timezone.utc)
-            last_hour = now - timedelta(hours=1)
+            oldest_minute = int(now.timestamp() // 60) - EVENT_BUCKET_COUNT
             
-            recent_events = [
-                event for event in self.security_events
-                if event.timestamp >= last_hour
-            ]
+            # Sum the per-minute buckets that fall within the last hour
+            threat_counts = [0] * len(self._threat_levels)
+            for minute, counts in zip(self._event_bucket_minutes, self._event_buckets):
+                if minute > oldest_minute:
+                    for i, count in enumerate(counts):
+                        threat_counts[i] += count
             
             return {
-                'active_sessions': len(self.active_sessions),
-                'recent_security_events': len(recent_events),
+                'active_sessions': sum(len(shard) for shard in self._session_shards),
+                'recent_security_events': sum(threat_counts),
                 'threat_levels': {
-                    level.value: len([
-                        event for event in recent_events
-                        if event.threat_level == level
-                    ])
-                    for level in ThreatLevel
+                    level.label: count
+                    for level, count in zip(self._threat_levels, threat_counts)
                 },
-                'rate_limit_keys': len(self.rate_limits),
+                'rate_limit_keys': sum(len(shard) for shard in self._rate_limit_shards),
                 'timestamp': now.isoformat()
             }
             
@@ -757,7 +997,12 @@ class SecurityManager:
         logger.info("Shutting down security manager")
         
         # Clear sensitive data
-        self.active_sessions.clear()
-        self.rate_limits.clear()
+        for shard in self._session_shards:
+            shard.clear()
+        for shard in self._rate_limit_shards:
+            shard.clear()
+        self._expiry_heap.clear()
+        self._auth_cache.clear()
+        self._bcrypt_pool.shutdown(wait=False, cancel_futures=True)
         
         logger.info("Security manager shutdown complete")
@@ -4,7 +4,10 @@ Utilities for generating realistic human timing patterns, delays,
 and scheduling variations for the YouTube automation pipeline.
 """
 
-import random
+import bisect
+import functools
+import itertools
+import math
 import numpy as np
 from datetime import datetime, timedelta, time
 from typing import List, Dict, Tuple, Optional, Any
@@ -39,6 +42,328 @@ class TimeOfDay(Enum):
     NIGHT = "night"                  # 9 PM-12 AM
     LATE_NIGHT = "late_night"        # 12-5 AM
 
+# Time period for each hour of the day (index = hour)
+HOUR_TO_PERIOD = (
+    (TimeOfDay.LATE_NIGHT,) * 5 +       # 0-5
+    (TimeOfDay.EARLY_MORNING,) * 3 +    # 5-8
+    (TimeOfDay.MORNING,) * 4 +          # 8-12
+    (TimeOfDay.LUNCH,) * 2 +            # 12-14
+    (TimeOfDay.AFTERNOON,) * 4 +        # 14-18
+    (TimeOfDay.EVENING,) * 3 +          # 18-21
+    (TimeOfDay.NIGHT,) * 3              # 21-24
+)
+
+# Day names in datetime.weekday() order
+WEEKDAY_NAMES = (
+    "monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"
+)
+
+# Delay duration bounds (minutes) by time period
+DELAY_DISTRIBUTIONS = {
+    TimeOfDay.EARLY_MORNING: (15, 45),   # Shorter delays early
+    TimeOfDay.MORNING: (20, 60),
+    TimeOfDay.LUNCH: (30, 90),           # Longer delays during lunch
+    TimeOfDay.AFTERNOON: (25, 75),
+    TimeOfDay.EVENING: (20, 80),
+    TimeOfDay.NIGHT: (30, 120),          # Variable delays at night
+    TimeOfDay.LATE_NIGHT: (45, 180)      # Longest delays late night
+}
+
+# Log-normal location parameter for each period's delay distribution
+DELAY_LOG_MU = {
+    period: math.log(min_delay + 10)
+    for period, (min_delay, _) in DELAY_DISTRIBUTIONS.items()
+}
+DELAY_LOG_SIGMA = 0.8
+
+# Random draws buffered per refill for single generate_realistic_delay calls
+DELAY_DRAW_BLOCK_SIZE = 256
+
+# The above, indexed directly by hour of the day for the scalar path
+DELAY_BOUNDS_BY_HOUR = tuple(DELAY_DISTRIBUTIONS[p] for p in HOUR_TO_PERIOD)
+DELAY_LOG_MU_BY_HOUR = tuple(DELAY_LOG_MU[p] for p in HOUR_TO_PERIOD)
+
+# Delay probability multipliers by creator type
+CREATOR_DELAY_FACTORS = {
+    "professional": 0.7,
+    "casual": 1.0,
+    "beginner": 1.3,
+    "perfectionist": 1.4
+}
+
+# Base reason probabilities for short (<15 min), medium (<60 min) and long delays
+REASON_PROBABILITIES_BY_BUCKET = (
+    [
+        (DelayReason.LAST_MINUTE_EDITS, 0.4),
+        (DelayReason.CONTENT_REVIEW, 0.3),
+        (DelayReason.TECHNICAL_ISSUES, 0.2),
+        (DelayReason.EARLY_PREPARATION, 0.1)
+    ],
+    [
+        (DelayReason.TECHNICAL_ISSUES, 0.25),
+        (DelayReason.CONTENT_REVIEW, 0.25),
+        (DelayReason.LAST_MINUTE_EDITS, 0.20),
+        (DelayReason.RENDER_PROBLEMS, 0.15),
+        (DelayReason.INTERNET_ISSUES, 0.10),
+        (DelayReason.QUALITY_CONCERNS, 0.05)
+    ],
+    [
+        (DelayReason.QUALITY_CONCERNS, 0.30),
+        (DelayReason.TECHNICAL_ISSUES, 0.25),
+        (DelayReason.PERSONAL_INTERRUPTION, 0.20),
+        (DelayReason.RENDER_PROBLEMS, 0.15),
+        (DelayReason.PLATFORM_ISSUES, 0.10)
+    ]
+)
+
+# Creator types that reweight delay reasons (None = no adjustment)
+REASON_CREATOR_KEYS = (None, "perfectionist", "beginner")
+
+# Authenticity score adjustments by delay reason
+REASON_AUTHENTICITY_ADJUSTMENTS = {
+    DelayReason.ON_TIME: 0.01,
+    DelayReason.EARLY_PREPARATION: 0.015,
+    DelayReason.LAST_MINUTE_EDITS: 0.005,
+    DelayReason.CONTENT_REVIEW: 0.005,
+    DelayReason.QUALITY_CONCERNS: 0.002,
+    DelayReason.TECHNICAL_ISSUES: 0.0,
+    DelayReason.RENDER_PROBLEMS: 0.0,
+    DelayReason.INTERNET_ISSUES: -0.005,
+    DelayReason.PERSONAL_INTERRUPTION: 0.0,
+    DelayReason.PLATFORM_ISSUES: -0.01,
+    DelayReason.SCHEDULE_CHANGE: -0.005
+}
+
+# Enum orderings used as integer codes in columnar (struct-of-arrays) output
+DELAY_REASONS = tuple(DelayReason)
+TIME_PERIODS = tuple(TimeOfDay)
+SEVERITY_LEVELS = ("minor", "moderate", "major")
+REASON_CODES = {reason: np.int8(code) for code, reason in enumerate(DELAY_REASONS)}
+SEVERITY_CODES = {severity: np.int8(code) for code, severity in enumerate(SEVERITY_LEVELS)}
+
+# Per-period / per-reason tables in code order for the vectorized path
+HOUR_TO_PERIOD_INDEX = np.array([TIME_PERIODS.index(p) for p in HOUR_TO_PERIOD])
+DELAY_MIN_BY_PERIOD = np.array([DELAY_DISTRIBUTIONS[p][0] for p in TIME_PERIODS], dtype=float)
+DELAY_MAX_BY_PERIOD = np.array([DELAY_DISTRIBUTIONS[p][1] for p in TIME_PERIODS], dtype=float)
+DELAY_LOG_MU_BY_PERIOD = np.array([DELAY_LOG_MU[p] for p in TIME_PERIODS])
+# Bin edges for branchless classification (np.digitize) in the vectorized path
+REASON_BUCKET_BINS = np.array([15, 60])                   # <15, <60, longer
+SEVERITY_BINS = np.array([30, 90])                        # minor, moderate, major
+IMPACT_BINS = np.array([5, 30, 90, 180])                  # upper edges, inclusive
+IMPACT_VALUES = np.array([0.02, 0.01, 0.0, -0.01, -0.02])
+REASON_ADJUSTMENT_BY_CODE = np.array(
+    [REASON_AUTHENTICITY_ADJUSTMENTS.get(r, 0.0) for r in DELAY_REASONS]
+)
+
+# Human-likeness score for uploads at each hour of the day (index = hour)
+HOUR_AUTHENTICITY_SCORES = np.array(
+    [0.3] * 6 +       # 0-6 AM
+    [0.8] * 2 +       # 6-8 AM
+    [1.0] * 15 +      # 8 AM-10 PM, reasonable hours
+    [0.8]             # 11 PM
+)
+
+# Delay likelihood by time of day / day of week, plus seasonal multipliers
+TIME_PATTERNS = {
+    "upload_delays": {
+        "early_morning": 0.15,  # Low delay probability
+        "morning": 0.20,
+        "lunch": 0.35,         # Higher delays during lunch
+        "afternoon": 0.30,
+        "evening": 0.25,
+        "night": 0.40,         # Higher delays at night
+        "late_night": 0.50     # Highest delay probability
+    },
+    "day_of_week": {
+        "monday": 1.0,          # Baseline
+        "tuesday": 0.9,
+        "wednesday": 0.95,
+        "thursday": 1.1,
+        "friday": 1.3,          # More delays on Friday
+        "saturday": 0.8,        # Weekend - more flexible
+        "sunday": 0.7
+    },
+    "seasonal": {
+        "holiday_week": 1.5,    # More delays during holidays
+        "summer": 1.1,          # Slight increase in summer
+        "winter": 0.9,          # Slightly more consistent in winter
+        "back_to_school": 1.2   # Busy period
+    }
+}
+
+# Day-of-week delay factors indexed by datetime.weekday()
+WEEKDAY_DELAY_FACTORS = tuple(
+    TIME_PATTERNS["day_of_week"].get(day, 1.0) for day in WEEKDAY_NAMES
+)
+
+# Base delay probability indexed by hour of the day
+HOUR_DELAY_PROBABILITIES = tuple(
+    TIME_PATTERNS["upload_delays"][period.value] for period in HOUR_TO_PERIOD
+)
+
+# Array forms of the above for the vectorized sampling path
+PERIOD_DELAY_PROBABILITIES = np.array(
+    [TIME_PATTERNS["upload_delays"][p.value] for p in TIME_PERIODS]
+)
+WEEKDAY_DELAY_FACTOR_ARRAY = np.array(WEEKDAY_DELAY_FACTORS)
+
+def _adjust_reason_probabilities(reasons: List[Tuple[DelayReason, float]],
+                                 time_period: TimeOfDay,
+                                 creator_type: Optional[str]) -> List[Tuple[DelayReason, float]]:
+    """Apply time-period and creator-type weighting to reason probabilities"""
+    
+    # Adjust probabilities based on time period
+    if time_period == TimeOfDay.LUNCH:
+        # More personal interruptions during lunch
+        reasons = [(r, p*1.5 if r == DelayReason.PERSONAL_INTERRUPTION else p*0.9) 
+                  for r, p in reasons]
+    elif time_period in [TimeOfDay.NIGHT, TimeOfDay.LATE_NIGHT]:
+        # More technical issues at night
+        reasons = [(r, p*1.3 if r == DelayReason.TECHNICAL_ISSUES else p*0.95) 
+                  for r, p in reasons]
+    
+    # Adjust for creator type
+    if creator_type == "perfectionist":
+        reasons = [(r, p*1.5 if r == DelayReason.QUALITY_CONCERNS else p*0.9) 
+                  for r, p in reasons]
+    elif creator_type == "beginner":
+        reasons = [(r, p*1.3 if r == DelayReason.TECHNICAL_ISSUES else p*0.95) 
+                  for r, p in reasons]
+    
+    return reasons
+
+def _build_reason_tables() -> Dict[Tuple[int, TimeOfDay, Optional[str]],
+                                  Tuple[Tuple[DelayReason, ...], List[float]]]:
+    """Precompute normalized cumulative reason probabilities for every context"""
+    
+    tables = {}
+    for bucket in range(len(REASON_PROBABILITIES_BY_BUCKET)):
+        for time_period in TimeOfDay:
+            for creator_key in REASON_CREATOR_KEYS:
+                reasons = _adjust_reason_probabilities(
+                    REASON_PROBABILITIES_BY_BUCKET[bucket], time_period, creator_key
+                )
+    
+                # Normalize probabilities into a cumulative distribution; pin
+                # the last entry to 1.0 so every roll in [0, 1) finds a reason
+                total_prob = sum(p for _, p in reasons)
+                cumulative = list(itertools.accumulate(p / total_prob for _, p in reasons))
+                cumulative[-1] = 1.0
+    
+                tables[(bucket, time_period, creator_key)] = (
+                    tuple(r for r, _ in reasons), cumulative
+                )
+    return tables
+
+def _build_reason_code_table(creator_key: Optional[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Pack one creator's reason CDFs into padded (bucket, period, reason) arrays"""
+    
+    width = max(len(reasons) for reasons in REASON_PROBABILITIES_BY_BUCKET)
+    shape = (len(REASON_PROBABILITIES_BY_BUCKET), len(TIME_PERIODS), width)
+    cdfs = np.full(shape, np.inf)
+    codes = np.zeros(shape, dtype=np.int8)
+    
+    for bucket in range(shape[0]):
+        for period_index, time_period in enumerate(TIME_PERIODS):
+            reasons, cumulative = REASON_TABLES[(bucket, time_period, creator_key)]
+            cdfs[bucket, period_index, :len(cumulative)] = cumulative
+            codes[bucket, period_index, :len(reasons)] = [REASON_CODES[r] for r in reasons]
+    
+    return cdfs, codes
+
+# Cumulative reason distributions keyed by (bucket, period, creator)
+REASON_TABLES = _build_reason_tables()
+
+# Padded CDF/code arrays per creator key for the vectorized path
+REASON_CODE_TABLES = {
+    creator_key: _build_reason_code_table(creator_key)
+    for creator_key in REASON_CREATOR_KEYS
+}
+
+def _to_wall_clock_seconds(times: List[datetime]) -> np.ndarray:
+    """Convert datetimes to float seconds since the epoch in their own wall-clock time"""
+    if times[0].tzinfo is not None:
+        times = [t.replace(tzinfo=None) for t in times]
+    return np.array(times, dtype="datetime64[us]").astype(np.int64) / 1e6
+
+def _from_wall_clock_seconds(seconds: np.ndarray, tzinfo: Optional[Any] = None) -> List[datetime]:
+    """Convert wall-clock epoch seconds back to datetimes"""
+    times = np.rint(seconds * 1e6).astype(np.int64).astype("datetime64[us]").tolist()
+    if tzinfo is not None:
+        times = [t.replace(tzinfo=tzinfo) for t in times]
+    return times
+
+def _score_wall_clock_seconds(seconds: np.ndarray) -> Dict[str, Any]:
+    """Score upload-time authenticity along the last axis of ``seconds``
+    
+    Accepts a single sorted schedule of shape ``(N,)`` or a batch of
+    schedules of shape ``(K, N)``; every metric has the leading shape.
+    """
+    
+    # Split every timestamp once into whole days and second-of-day; the
+    # interval, hour and weekday metrics all derive from these
+    days, second_of_day = np.divmod(seconds, 86400)
+    
+    # Calculate intervals between uploads
+    intervals = np.diff(seconds, axis=-1) / 3600  # hours
+        
+    # Analyze consistency
+    mean_interval = np.mean(intervals, axis=-1)
+    std_interval = np.std(intervals, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        consistency = np.where(
+            mean_interval > 0, 1.0 - np.minimum(1.0, std_interval / mean_interval), 0.0
+        )
+    
+    # Analyze variance (too consistent = suspicious)
+    variance_score = np.minimum(1.0, std_interval / 12.0)  # Normalize to 12-hour standard
+    
+    # Check for human-like patterns (hour -> score lookup)
+    hours = (second_of_day // 3600).astype(np.intp)
+    time_of_day_authenticity = np.mean(HOUR_AUTHENTICITY_SCORES[hours], axis=-1)
+    
+    # Day of week analysis (1970-01-01 was a Thursday, weekday() == 3)
+    weekdays = ((days + 3) % 7).astype(np.intp)
+    
+    # Count weekdays per schedule with one bincount over row-offset bins
+    batch_shape = weekdays.shape[:-1]
+    row_offsets = 7 * np.arange(math.prod(batch_shape)).reshape(batch_shape + (1,))
+    day_distribution = np.bincount(
+        (weekdays + row_offsets).ravel(), minlength=7 * row_offsets.size
+    ).reshape(batch_shape + (7,))
+        
+    # Calculate day distribution entropy (higher = more realistic); empty
+    # days contribute 0, so take the log only where p > 0
+    p = day_distribution / seconds.shape[-1]
+    log_p = np.log2(p, out=np.zeros_like(p), where=p > 0)
+    day_entropy = -np.sum(p * log_p, axis=-1)
+            
+    # Normalize entropy (max entropy for 7 days is log2(7) ≈ 2.807)
+    day_diversity = day_entropy / 2.807
+    
+    # Overall authenticity score
+    authenticity_score = (
+        consistency * 0.3 +           # Consistency is important
+        variance_score * 0.2 +        # Some variance is human
+        time_of_day_authenticity * 0.3 +  # Reasonable hours
+        day_diversity * 0.2           # Varied days
+    )
+    
+    return {
+        "authenticity_score": authenticity_score,
+        "consistency": consistency,
+        "variance": variance_score,
+        "time_of_day_authenticity": time_of_day_authenticity,
+        "day_diversity": day_diversity,
+        "mean_interval_hours": mean_interval,
+        "interval_std_hours": std_interval
+    }
+
+@functools.lru_cache(maxsize=None)
+def get_timezone(name: str) -> pytz.BaseTzInfo:
+    """Get a pytz timezone, memoized by name"""
+    return pytz.timezone(name)
+
 @dataclass
 class TimingPattern:
     """Represents a timing pattern with natural variations"""
@@ -59,42 +384,37 @@ class UploadDelay:
     severity: str  # "minor", "moderate", "major"
     authenticity_impact: float  # How this affects authenticity score
     
+def upload_delays_from_columns(columns: Dict[str, np.ndarray]) -> List[UploadDelay]:
+    """Decode columnar schedule output into UploadDelay objects"""
+    return [
+        UploadDelay(
+            scheduled_time=scheduled,
+            actual_time=actual,
+            delay_minutes=float(delay_minutes),
+            reason=DELAY_REASONS[reason_code],
+            severity=SEVERITY_LEVELS[severity_code],
+            authenticity_impact=float(impact)
+        )
+        for scheduled, actual, delay_minutes, reason_code, severity_code, impact in zip(
+            columns["scheduled_ts"].tolist(),
+            columns["actual_ts"].tolist(),
+            columns["delay_minutes"].tolist(),
+            columns["reason_code"].tolist(),
+            columns["severity_code"].tolist(),
+            columns["authenticity_impact"].tolist()
+        )
+    ]
+
 class HumanTimingGenerator:
     """Generates realistic human timing patterns with natural variations"""
     
-    def __init__(self, timezone: str = "UTC"):
-        self.timezone = pytz.timezone(timezone)
+    def __init__(self, timezone: str = "UTC", seed: Optional[int] = None):
+        self.timezone = get_timezone(timezone)
+        self._rng = np.random.default_rng(seed)
         self.delay_probability_cache = {}
-        self.time_patterns = self._initialize_time_patterns()
         
-    def _initialize_time_patterns(self) -> Dict[str, Dict[str, float]]:
-        """Initialize realistic time patterns for different scenarios"""
-        return {
-            "upload_delays": {
-                "early_morning": 0.15,  # Low delay probability
-                "morning": 0.20,
-                "lunch": 0.35,         # Higher delays during lunch
-                "afternoon": 0.30,
-                "evening": 0.25,
-                "night": 0.40,         # Higher delays at night
-                "late_night": 0.50     # Highest delay probability
-            },
-            "day_of_week": {
-                "monday": 1.0,          # Baseline
-                "tuesday": 0.9,
-                "wednesday": 0.95,
-                "thursday": 1.1,
-                "friday": 1.3,          # More delays on Friday
-                "saturday": 0.8,        # Weekend - more flexible
-                "sunday": 0.7
-            },
-            "seasonal": {
-                "holiday_week": 1.5,    # More delays during holidays
-                "summer": 1.1,          # Slight increase in summer
-                "winter": 0.9,          # Slightly more consistent in winter
-                "back_to_school": 1.2   # Busy period
-            }
-        }
+        # Buffered (delay, variation, reason, normal) draws for single delays
+        self._delay_draws = iter(())
         
     def generate_realistic_delay(self, 
                                scheduled_time: datetime,
@@ -102,102 +422,142 @@ class HumanTimingGenerator:
                                creator_type: str = "casual") -> UploadDelay:
         """Generate a realistic upload delay with human-like characteristics"""
         
-        # Determine time of day
-        time_period = self._get_time_period(scheduled_time.hour)
-        
-        # Calculate base delay probability
-        base_delay_prob = self.time_patterns["upload_delays"][time_period.value]
+        delay_roll, variation_roll, reason_roll, normal_draw = self._next_delay_draws()
         
-        # Adjust for consistency score (higher consistency = lower delay probability)
-        consistency_factor = 1.0 - consistency_score
-        delay_probability = base_delay_prob * (1.0 + consistency_factor)
+        return self._resolve_delay(
+            scheduled_time, consistency_score, creator_type,
+            delay_roll=delay_roll,
+            variation_roll=variation_roll,
+            normal_draw=normal_draw,
+            reason_roll=reason_roll
+        )
         
-        # Adjust for day of week
-        day_name = scheduled_time.strftime("%A").lower()
-        day_factor = self.time_patterns["day_of_week"].get(day_name, 1.0)
-        delay_probability *= day_factor
+    def _next_delay_draws(self) -> List[float]:
+        """Next pre-drawn ``[delay, variation, reason, normal]`` row
+        
+        Generator calls cost about a microsecond each regardless of size, so
+        single-delay callers take rows from a block refilled every
+        ``DELAY_DRAW_BLOCK_SIZE`` calls instead of drawing per call.
+        """
+        
+        draws = next(self._delay_draws, None)
+        if draws is None:
+            block = np.empty((DELAY_DRAW_BLOCK_SIZE, 4))
+            block[:, :3] = self._rng.random((DELAY_DRAW_BLOCK_SIZE, 3))
+            block[:, 3] = self._rng.standard_normal(DELAY_DRAW_BLOCK_SIZE)
+            self._delay_draws = iter(block.tolist())
+            draws = next(self._delay_draws)
+        return draws
+        
+    def _resolve_delay(self,
+                      scheduled_time: datetime,
+                      consistency_score: float,
+                      creator_type: str,
+                      delay_roll: float,
+                      variation_roll: float,
+                      normal_draw: float,
+                      reason_roll: float) -> UploadDelay:
+        """Build an UploadDelay from pre-drawn random values.
+        
+        ``delay_roll``, ``variation_roll`` and ``reason_roll`` are uniform on
+        [0, 1); ``normal_draw`` is a standard normal sample. Drawing them up
+        front lets batch generators sample everything in one NumPy call.
+        """
+        
+        delay_minutes, reason, severity, authenticity_impact = self._resolve_delay_fields(
+            scheduled_time.hour, scheduled_time.weekday(), consistency_score, creator_type,
+            delay_roll, variation_roll, normal_draw, reason_roll
+        )
         
-        # Adjust for creator type
-        creator_factors = {
-            "professional": 0.7,
-            "casual": 1.0,
-            "beginner": 1.3,
-            "perfectionist": 1.4
-        }
-        delay_probability *= creator_factors.get(creator_type, 1.0)
+        return UploadDelay(
+            scheduled_time=scheduled_time,
+            actual_time=scheduled_time + timedelta(minutes=delay_minutes),
+            delay_minutes=delay_minutes,
+            reason=reason,
+            severity=severity,
+            authenticity_impact=authenticity_impact
+        )
         
-        # Determine if there will be a delay
-        will_delay = random.random() < delay_probability
+    def _resolve_delay_fields(self,
+                            hour: int,
+                            weekday: int,
+                            consistency_score: float,
+                            creator_type: str,
+                            delay_roll: float,
+                            variation_roll: float,
+                            normal_draw: float,
+                            reason_roll: float) -> Tuple[float, DelayReason, str, float]:
+        """Delay minutes, reason, severity and authenticity impact for one upload"""
+        
+        will_delay, delay_minutes = self._sample_delay_minutes(
+            hour, weekday, consistency_score, creator_type,
+            delay_roll, variation_roll, normal_draw
+        )
         
         if not will_delay:
             # Small variation even when "on time"
-            variation = random.uniform(-5, 15)  # -5 to +15 minutes
-            actual_time = scheduled_time + timedelta(minutes=variation)
-            delay_minutes = variation
-            reason = DelayReason.ON_TIME if variation <= 5 else DelayReason.LAST_MINUTE_EDITS
+            reason = DelayReason.ON_TIME if delay_minutes <= 5 else DelayReason.LAST_MINUTE_EDITS
             severity = "minor"
         else:
-            # Generate realistic delay
-            delay_minutes, reason, severity = self._generate_delay_details(time_period, creator_type)
-            actual_time = scheduled_time + timedelta(minutes=delay_minutes)
+            # Classify the realistic delay
+            reason, severity = self._classify_delay(
+                delay_minutes, self._get_time_period(hour), creator_type, reason_roll
+            )
             
         # Calculate authenticity impact
         authenticity_impact = self._calculate_authenticity_impact(delay_minutes, reason)
         
-        return UploadDelay(
-            scheduled_time=scheduled_time,
-            actual_time=actual_time,
-            delay_minutes=delay_minutes,
-            reason=reason,
-            severity=severity,
-            authenticity_impact=authenticity_impact
-        )
+        return delay_minutes, reason, severity, authenticity_impact
         
     def _get_time_period(self, hour: int) -> TimeOfDay:
         """Determine time period from hour"""
-        if 5 <= hour < 8:
-            return TimeOfDay.EARLY_MORNING
-        elif 8 <= hour < 12:
-            return TimeOfDay.MORNING
-        elif 12 <= hour < 14:
-            return TimeOfDay.LUNCH
-        elif 14 <= hour < 18:
-            return TimeOfDay.AFTERNOON
-        elif 18 <= hour < 21:
-            return TimeOfDay.EVENING
-        elif 21 <= hour < 24:
-            return TimeOfDay.NIGHT
-        else:  # 0-5
-            return TimeOfDay.LATE_NIGHT
-            
-    def _generate_delay_details(self, 
-                              time_period: TimeOfDay, 
-                              creator_type: str) -> Tuple[float, DelayReason, str]:
-        """Generate realistic delay duration, reason, and severity"""
-        
-        # Delay duration distributions by time period
-        delay_distributions = {
-            TimeOfDay.EARLY_MORNING: (15, 45),   # Shorter delays early
-            TimeOfDay.MORNING: (20, 60),
-            TimeOfDay.LUNCH: (30, 90),           # Longer delays during lunch
-            TimeOfDay.AFTERNOON: (25, 75),
-            TimeOfDay.EVENING: (20, 80),
-            TimeOfDay.NIGHT: (30, 120),          # Variable delays at night
-            TimeOfDay.LATE_NIGHT: (45, 180)     # Longest delays late night
-        }
+        return HOUR_TO_PERIOD[hour]
+            
+    def _sample_delay_minutes(self,
+                            hour: int,
+                            weekday: int,
+                            consistency_score: float,
+                            creator_type: str,
+                            delay_roll: float,
+                            variation_roll: float,
+                            normal_draw: float) -> Tuple[bool, float]:
+        """Decide whether an upload is delayed and by how many minutes"""
+        
+        # Calculate base delay probability
+        base_delay_prob = HOUR_DELAY_PROBABILITIES[hour]
+        
+        # Adjust for consistency score (higher consistency = lower delay probability)
+        consistency_factor = 1.0 - consistency_score
+        delay_probability = base_delay_prob * (1.0 + consistency_factor)
+        
+        # Adjust for day of week
+        delay_probability *= WEEKDAY_DELAY_FACTORS[weekday]
         
-        min_delay, max_delay = delay_distributions[time_period]
+        # Adjust for creator type
+        delay_probability *= CREATOR_DELAY_FACTORS.get(creator_type, 1.0)
+        
+        # Determine if there will be a delay
+        if delay_roll >= delay_probability:
+            return False, -5 + 20 * variation_roll  # -5 to +15 minutes
+        
+        min_delay, max_delay = DELAY_BOUNDS_BY_HOUR[hour]
         
         # Generate delay with log-normal distribution (more realistic)
-        mu = np.log(min_delay + 10)
-        sigma = 0.8
-        delay_minutes = np.random.lognormal(mu, sigma)
+        mu = DELAY_LOG_MU_BY_HOUR[hour]
+        delay_minutes = math.exp(mu + DELAY_LOG_SIGMA * normal_draw)
         
         # Clamp to reasonable bounds
-        delay_minutes = max(min_delay, min(max_delay, delay_minutes))
+        return True, max(min_delay, min(max_delay, delay_minutes))
+        
+    def _classify_delay(self,
+                      delay_minutes: float,
+                      time_period: TimeOfDay,
+                      creator_type: str,
+                      reason_roll: float) -> Tuple[DelayReason, str]:
+        """Choose a realistic reason and severity for a delay"""
         
         # Determine reason based on delay duration and time
-        reason = self._select_delay_reason(delay_minutes, time_period, creator_type)
+        reason = self._select_delay_reason(delay_minutes, time_period, creator_type, reason_roll)
         
         # Determine severity
         if delay_minutes < 30:
@@ -207,72 +567,28 @@ class HumanTimingGenerator:
         else:
             severity = "major"
             
-        return delay_minutes, reason, severity
+        return reason, severity
         
     def _select_delay_reason(self, 
                            delay_minutes: float, 
                            time_period: TimeOfDay, 
-                           creator_type: str) -> DelayReason:
+                           creator_type: str,
+                           reason_roll: float) -> DelayReason:
         """Select appropriate delay reason based on context"""
         
         # Reason probabilities by delay duration
         if delay_minutes < 15:
-            reasons = [
-                (DelayReason.LAST_MINUTE_EDITS, 0.4),
-                (DelayReason.CONTENT_REVIEW, 0.3),
-                (DelayReason.TECHNICAL_ISSUES, 0.2),
-                (DelayReason.EARLY_PREPARATION, 0.1)
-            ]
+            bucket = 0
         elif delay_minutes < 60:
-            reasons = [
-                (DelayReason.TECHNICAL_ISSUES, 0.25),
-                (DelayReason.CONTENT_REVIEW, 0.25),
-                (DelayReason.LAST_MINUTE_EDITS, 0.20),
-                (DelayReason.RENDER_PROBLEMS, 0.15),
-                (DelayReason.INTERNET_ISSUES, 0.10),
-                (DelayReason.QUALITY_CONCERNS, 0.05)
-            ]
+            bucket = 1
         else:  # Long delays
-            reasons = [
-                (DelayReason.QUALITY_CONCERNS, 0.30),
-                (DelayReason.TECHNICAL_ISSUES, 0.25),
-                (DelayReason.PERSONAL_INTERRUPTION, 0.20),
-                (DelayReason.RENDER_PROBLEMS, 0.15),
-                (DelayReason.PLATFORM_ISSUES, 0.10)
-            ]
-            
-        # Adjust probabilities based on time period
-        if time_period == TimeOfDay.LUNCH:
-            # More personal interruptions during lunch
-            reasons = [(r, p*1.5 if r == DelayReason.PERSONAL_INTERRUPTION else p*0.9) 
-                      for r, p in reasons]
-        elif time_period in [TimeOfDay.NIGHT, TimeOfDay.LATE_NIGHT]:
-            # More technical issues at night
-            reasons = [(r, p*1.3 if r == DelayReason.TECHNICAL_ISSUES else p*0.95) 
-                      for r, p in reasons]
-                      
-        # Adjust for creator type
-        if creator_type == "perfectionist":
-            reasons = [(r, p*1.5 if r == DelayReason.QUALITY_CONCERNS else p*0.9) 
-                      for r, p in reasons]
-        elif creator_type == "beginner":
-            reasons = [(r, p*1.3 if r == DelayReason.TECHNICAL_ISSUES else p*0.95) 
-                      for r, p in reasons]
-                      
-        # Normalize probabilities
-        total_prob = sum(p for _, p in reasons)
-        reasons = [(r, p/total_prob) for r, p in reasons]
+            bucket = 2
         
-        # Select reason based on probabilities
-        rand_val = random.random()
-        cumulative = 0
+        creator_key = creator_type if creator_type in REASON_CREATOR_KEYS else None
+        reasons, cumulative = REASON_TABLES[(bucket, time_period, creator_key)]
         
-        for reason, prob in reasons:
-            cumulative += prob
-            if rand_val <= cumulative:
-                return reason
-                
-        return reasons[0][0]  # Fallback
+        # Select reason based on probabilities
+        return reasons[bisect.bisect_left(cumulative, reason_roll)]
         
     def _calculate_authenticity_impact(self, delay_minutes: float, reason: DelayReason) -> float:
         """Calculate how delay affects authenticity score"""
@@ -290,21 +606,7 @@ class HumanTimingGenerator:
             base_impact = -0.02   # Negative impact (too unrealistic)
             
         # Reason-based adjustments
-        reason_adjustments = {
-            DelayReason.ON_TIME: 0.01,
-            DelayReason.EARLY_PREPARATION: 0.015,
-            DelayReason.LAST_MINUTE_EDITS: 0.005,
-            DelayReason.CONTENT_REVIEW: 0.005,
-            DelayReason.QUALITY_CONCERNS: 0.002,
-            DelayReason.TECHNICAL_ISSUES: 0.0,
-            DelayReason.RENDER_PROBLEMS: 0.0,
-            DelayReason.INTERNET_ISSUES: -0.005,
-            DelayReason.PERSONAL_INTERRUPTION: 0.0,
-            DelayReason.PLATFORM_ISSUES: -0.01,
-            DelayReason.SCHEDULE_CHANGE: -0.005
-        }
-        
-        adjustment = reason_adjustments.get(reason, 0.0)
+        adjustment = REASON_AUTHENTICITY_ADJUSTMENTS.get(reason, 0.0)
         
         return base_impact + adjustment
         
@@ -315,27 +617,41 @@ class HumanTimingGenerator:
                                     creator_type: str = "casual") -> List[datetime]:
         """Generate a batch of upload times with realistic patterns"""
         
-        upload_times = []
-        current_time = datetime.now()
+        if count <= 0:
+            return []
+        
+        # Work in wall-clock epoch seconds and only build datetimes on return
+        upload_seconds = np.empty(count)
+        current_seconds = float(_to_wall_clock_seconds([datetime.now()])[0])
+        
+        # Draw every random value for the batch up front; each upload time
+        # depends on the previous one, so only the recurrence stays in Python
+        delay_rolls, variation_rolls, interval_rolls = self._rng.random((3, count)).tolist()
+        normal_draws = self._rng.standard_normal(count).tolist()
         
         for i in range(count):
             # Calculate base next upload time
-            next_base_time = current_time + timedelta(hours=base_interval_hours)
-            
-            # Generate delay for this upload
-            delay = self.generate_realistic_delay(next_base_time, consistency_score, creator_type)
+            next_base_seconds = current_seconds + base_interval_hours * 3600
+            
+            # Generate delay for this upload (1970-01-01 was a Thursday)
+            _, delay_minutes = self._sample_delay_minutes(
+                int(next_base_seconds // 3600 % 24),
+                int((next_base_seconds // 86400 + 3) % 7),
+                consistency_score, creator_type,
+                delay_rolls[i], variation_rolls[i], normal_draws[i]
+            )
             
-            upload_times.append(delay.actual_time)
-            current_time = delay.actual_time
+            current_seconds = next_base_seconds + delay_minutes * 60
+            upload_seconds[i] = current_seconds
             
             # Add some variation to interval for next upload
-            interval_variation = random.uniform(0.8, 1.3)  # ±30% variation
+            interval_variation = 0.8 + 0.5 * interval_rolls[i]  # ±30% variation
             base_interval_hours *= interval_variation
             
             # Keep interval within reasonable bounds
             base_interval_hours = max(12, min(48, base_interval_hours))
             
-        return upload_times
+        return _from_wall_clock_seconds(upload_seconds)
         
     def simulate_creator_schedule(self, 
                                 days: int = 30,
@@ -347,143 +663,238 @@ class HumanTimingGenerator:
         if preferred_hours is None:
             preferred_hours = [14, 18, 20]  # 2 PM, 6 PM, 8 PM
             
-        schedule = []
         current_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        first_day = int(_to_wall_clock_seconds([current_date])[0] // 86400)
         
         # Calculate average days between uploads
         days_between_uploads = 7.0 / uploads_per_week
         
-        upload_date = current_date
-        
-        while upload_date <= current_date + timedelta(days=days):
-            # Choose a preferred hour with some variation
-            preferred_hour = random.choice(preferred_hours)
-            hour_variation = random.uniform(-2, 2)  # ±2 hours variation
-            actual_hour = max(6, min(23, preferred_hour + hour_variation))
-            
-            # Create scheduled time
-            scheduled_time = upload_date.replace(
-                hour=int(actual_hour),
-                minute=random.randint(0, 59),
-                second=random.randint(0, 59)
+        # Draw every random value up front; gaps are at least 0.7 intervals,
+        # which bounds the number of uploads that fit in the period
+        max_uploads = int(days / (days_between_uploads * 0.7)) + 2
+        preferred = np.asarray(preferred_hours)[self._rng.integers(len(preferred_hours), size=max_uploads)]
+        hour_variations = self._rng.uniform(-2, 2, max_uploads)  # ±2 hours variation
+        minutes, seconds = self._rng.integers(0, 60, (2, max_uploads))
+        gaps = days_between_uploads * self._rng.uniform(0.7, 1.4, max_uploads)
+        delay_rolls, variation_rolls, reason_rolls = self._rng.random((3, max_uploads)).tolist()
+        normal_draws = self._rng.standard_normal(max_uploads).tolist()
+        
+        # Upload days: cumulative jittered gaps up to the end of the period
+        offsets = np.concatenate(([0.0], np.cumsum(gaps[:-1])))
+        count = int(np.searchsorted(offsets, days, side="right"))
+        day_numbers = first_day + np.floor(offsets[:count]).astype(np.int64)
+        
+        # Scheduled times as integer wall-clock epoch seconds; hour and
+        # weekday (1970-01-01 was a Thursday) come straight from the parts
+        hours = np.clip(preferred[:count] + hour_variations[:count], 6, 23).astype(np.int64)
+        weekdays = (day_numbers + 3) % 7
+        scheduled = day_numbers * 86400 + hours * 3600 + minutes[:count] * 60 + seconds[:count]
+        
+        # Generate delay for each upload
+        fields = [
+            self._resolve_delay_fields(
+                hour, weekday, consistency_score, "casual",
+                delay_rolls[i], variation_rolls[i], normal_draws[i], reason_rolls[i]
             )
-            
-            # Generate delay for this upload
-            delay = self.generate_realistic_delay(scheduled_time, consistency_score)
-            schedule.append(delay)
-            
-            # Calculate next upload date
-            days_to_next = days_between_uploads * random.uniform(0.7, 1.4)
-            upload_date += timedelta(days=days_to_next)
-            
-        return schedule
+            for i, (hour, weekday) in enumerate(zip(hours.tolist(), weekdays.tolist()))
+        ]
+        delay_minutes = np.array([delay for delay, _, _, _ in fields])
+        
+        # Materialize datetimes only for the returned UploadDelay objects
+        scheduled_times = _from_wall_clock_seconds(scheduled.astype(np.float64))
+        actual_times = _from_wall_clock_seconds(scheduled + delay_minutes * 60)
+        
+        return [
+            UploadDelay(
+                scheduled_time=scheduled_time,
+                actual_time=actual_time,
+                delay_minutes=delay,
+                reason=reason,
+                severity=severity,
+                authenticity_impact=impact
+            )
+            for scheduled_time, actual_time, (delay, reason, severity, impact)
+            in zip(scheduled_times, actual_times, fields)
+        ]
         
-    def analyze_timing_authenticity(self, upload_times: List[datetime]) -> Dict[str, float]:
-        """Analyze how authentic a series of upload times appears"""
+    def simulate_creator_schedule_soa(self,
+                                    days: int = 30,
+                                    uploads_per_week: float = 3.5,
+                                    consistency_score: float = 0.8,
+                                    preferred_hours: List[int] = None,
+                                    creator_type: str = "casual") -> Dict[str, np.ndarray]:
+        """Simulate a creator's upload schedule as parallel NumPy columns
+        
+        Columnar counterpart of ``simulate_creator_schedule``. Returns
+        ``scheduled_ts``/``actual_ts`` (``datetime64[s]``), ``delay_minutes``
+        and ``authenticity_impact`` (``float32``), and ``reason_code`` /
+        ``severity_code`` (``int8`` indexes into ``DELAY_REASONS`` /
+        ``SEVERITY_LEVELS``). Use ``upload_delays_from_columns`` to convert
+        back to ``UploadDelay`` objects at API boundaries.
+        """
         
-        if len(upload_times) < 2:
-            return {"authenticity_score": 0.5, "consistency": 0.0, "variance": 0.0}
-            
-        # Calculate intervals between uploads
-        intervals = []
-        for i in range(1, len(upload_times)):
-            interval = (upload_times[i] - upload_times[i-1]).total_seconds() / 3600  # hours
-            intervals.append(interval)
-            
-        # Analyze consistency
-        mean_interval = np.mean(intervals)
-        std_interval = np.std(intervals)
-        consistency = 1.0 - min(1.0, std_interval / mean_interval) if mean_interval > 0 else 0.0
-        
-        # Analyze variance (too consistent = suspicious)
-        variance_score = min(1.0, std_interval / 12.0)  # Normalize to 12-hour standard
-        
-        # Check for human-like patterns
-        time_of_day_scores = []
-        for upload_time in upload_times:
-            hour = upload_time.hour
-            # Human-like hours get higher scores
-            if 8 <= hour <= 22:  # Reasonable hours
-                time_of_day_scores.append(1.0)
-            elif 6 <= hour < 8 or 22 < hour <= 24:
-                time_of_day_scores.append(0.8)
-            else:  # 0-6 AM
-                time_of_day_scores.append(0.3)
-                
-        time_of_day_authenticity = np.mean(time_of_day_scores)
+        if preferred_hours is None:
+            preferred_hours = [14, 18, 20]  # 2 PM, 6 PM, 8 PM
         
-        # Day of week analysis
-        day_distribution = {i: 0 for i in range(7)}
-        for upload_time in upload_times:
-            day_distribution[upload_time.weekday()] += 1
-            
-        # Calculate day distribution entropy (higher = more realistic)
-        total_uploads = len(upload_times)
-        day_entropy = 0
-        for count in day_distribution.values():
-            if count > 0:
-                p = count / total_uploads
-                day_entropy -= p * np.log2(p)
-                
-        # Normalize entropy (max entropy for 7 days is log2(7) ≈ 2.807)
-        day_diversity = day_entropy / 2.807
-        
-        # Overall authenticity score
-        authenticity_score = (
-            consistency * 0.3 +           # Consistency is important
-            variance_score * 0.2 +        # Some variance is human
-            time_of_day_authenticity * 0.3 +  # Reasonable hours
-            day_diversity * 0.2           # Varied days
+        current_date = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        midnight = _to_wall_clock_seconds([current_date])[0]
+        
+        # Upload day offsets: cumulative jittered gaps, bounded by an upper count
+        days_between_uploads = 7.0 / uploads_per_week
+        max_uploads = int(days / (days_between_uploads * 0.7)) + 2
+        gaps = days_between_uploads * self._rng.uniform(0.7, 1.4, max_uploads)
+        offsets = np.concatenate(([0.0], np.cumsum(gaps[:-1])))
+        offsets = offsets[offsets <= days]
+        count = len(offsets)
+        
+        # Preferred hour with ±2 hours variation, plus minute/second jitter
+        hours = np.asarray(preferred_hours)[self._rng.integers(len(preferred_hours), size=count)]
+        hours = np.clip(hours + self._rng.uniform(-2, 2, count), 6, 23).astype(np.int64)
+        minutes = self._rng.integers(0, 60, count)
+        seconds = self._rng.integers(0, 60, count)
+        
+        scheduled = (
+            midnight + np.floor(offsets) * 86400 +
+            hours * 3600 + minutes * 60 + seconds
         )
         
+        columns = self._sample_delay_columns(scheduled, consistency_score, creator_type)
+        actual = scheduled + columns["delay_minutes"] * 60
+        
+        columns["scheduled_ts"] = scheduled.astype(np.int64).astype("datetime64[s]")
+        columns["actual_ts"] = np.floor(actual).astype(np.int64).astype("datetime64[s]")
+        return columns
+        
+    def _sample_delay_columns(self,
+                            scheduled: np.ndarray,
+                            consistency_score: float,
+                            creator_type: str) -> Dict[str, np.ndarray]:
+        """Vectorized ``_resolve_delay`` over wall-clock epoch seconds"""
+        
+        count = len(scheduled)
+        delay_rolls, variation_rolls, reason_rolls = self._rng.random((3, count))
+        normal_draws = self._rng.standard_normal(count)
+        
+        # Time period and weekday of each scheduled time
+        periods = HOUR_TO_PERIOD_INDEX[(scheduled // 3600 % 24).astype(np.intp)]
+        weekdays = ((scheduled // 86400 + 3) % 7).astype(np.intp)
+        
+        # Delay probability
+        delay_probability = (
+            PERIOD_DELAY_PROBABILITIES[periods] *
+            (2.0 - consistency_score) *
+            WEEKDAY_DELAY_FACTOR_ARRAY[weekdays] *
+            CREATOR_DELAY_FACTORS.get(creator_type, 1.0)
+        )
+        will_delay = delay_rolls < delay_probability
+        
+        # On-time variation (-5 to +15 minutes) vs clamped log-normal delay
+        variation = -5 + 20 * variation_rolls
+        delayed = np.clip(
+            np.exp(DELAY_LOG_MU_BY_PERIOD[periods] + DELAY_LOG_SIGMA * normal_draws),
+            DELAY_MIN_BY_PERIOD[periods],
+            DELAY_MAX_BY_PERIOD[periods]
+        )
+        delay_minutes = np.where(will_delay, delayed, variation)
+        
+        # Reasons: on-time uploads are ON_TIME/LAST_MINUTE_EDITS, delays use the CDF tables
+        creator_key = creator_type if creator_type in REASON_CREATOR_KEYS else None
+        cdfs, codes = REASON_CODE_TABLES[creator_key]
+        buckets = np.digitize(delayed, REASON_BUCKET_BINS)
+        rows = (buckets, periods)
+        choice = (cdfs[rows] < reason_rolls[:, np.newaxis]).sum(axis=1)
+        delayed_reason = np.take_along_axis(codes[rows], choice[:, np.newaxis], axis=1)[:, 0]
+        on_time_reason = np.where(
+            variation <= 5,
+            REASON_CODES[DelayReason.ON_TIME],
+            REASON_CODES[DelayReason.LAST_MINUTE_EDITS]
+        )
+        reason_code = np.where(will_delay, delayed_reason, on_time_reason)
+        
+        # Severity: on-time uploads are always minor
+        delayed_severity = np.digitize(delayed, SEVERITY_BINS)
+        severity_code = np.where(will_delay, delayed_severity, SEVERITY_CODES["minor"])
+        
+        # Authenticity impact: duration-based base plus reason adjustment
+        base_impact = IMPACT_VALUES[np.digitize(delay_minutes, IMPACT_BINS, right=True)]
+        authenticity_impact = base_impact + REASON_ADJUSTMENT_BY_CODE[reason_code]
+        
+        # Quantize: these fields carry at most ~3 significant digits
         return {
-            "authenticity_score": authenticity_score,
-            "consistency": consistency,
-            "variance": variance_score,
-            "time_of_day_authenticity": time_of_day_authenticity,
-            "day_diversity": day_diversity,
-            "mean_interval_hours": mean_interval,
-            "interval_std_hours": std_interval,
-            "total_uploads": len(upload_times)
+            "delay_minutes": delay_minutes.astype(np.float32),
+            "reason_code": reason_code.astype(np.int8),
+            "severity_code": severity_code.astype(np.int8),
+            "authenticity_impact": authenticity_impact.astype(np.float32)
         }
         
+    def analyze_timing_authenticity(self, upload_times: List[datetime]) -> Dict[str, float]:
+        """Analyze how authentic a series of upload times appears"""
+        
+        if len(upload_times) < 2:
+            return {"authenticity_score": 0.5, "consistency": 0.0, "variance": 0.0}
+            
+        analysis = _score_wall_clock_seconds(_to_wall_clock_seconds(upload_times))
+        analysis = {name: float(value) for name, value in analysis.items()}
+        analysis["total_uploads"] = len(upload_times)
+        return analysis
+        
     def optimize_schedule_for_authenticity(self, 
                                          base_schedule: List[datetime],
-                                         target_authenticity: float = 0.90) -> List[datetime]:
-        """Optimize a schedule to achieve target authenticity score"""
+                                         target_authenticity: float = 0.90,
+                                         candidates_per_round: int = 16) -> List[datetime]:
+        """Optimize a schedule to achieve target authenticity score
+        
+        Each round perturbs ``candidates_per_round`` copies of the current
+        schedule at once, scores them in a single vectorized pass and keeps
+        the best one if it improves on the current score.
+        """
         
-        current_schedule = base_schedule.copy()
-        current_authenticity = self.analyze_timing_authenticity(current_schedule)["authenticity_score"]
+        if len(base_schedule) < 2:
+            return base_schedule.copy()
+        
+        current = _to_wall_clock_seconds(base_schedule)
+        current_authenticity = _score_wall_clock_seconds(current)["authenticity_score"]
+        improved = False
         
         iterations = 0
         max_iterations = 100
+        num_uploads = len(current)
+        num_adjustments = max(1, num_uploads // 10)
         
         while current_authenticity < target_authenticity and iterations < max_iterations:
-            # Try random adjustments
-            test_schedule = current_schedule.copy()
-            
-            # Randomly adjust some upload times
-            num_adjustments = max(1, len(test_schedule) // 10)
-            indices_to_adjust = random.sample(range(len(test_schedule)), num_adjustments)
-            
-            for idx in indices_to_adjust:
-                # Add random variation
-                variation_hours = random.uniform(-6, 6)
-                test_schedule[idx] += timedelta(hours=variation_hours)
+            # Randomly pick distinct upload times to adjust in each candidate:
+            # the k smallest of N uniform keys are a uniform k-subset, and
+            # argpartition finds them without sorting the whole row
+            keys = self._rng.random((candidates_per_round, num_uploads))
+            indices = np.argpartition(keys, num_adjustments - 1, axis=1)[:, :num_adjustments]
+            
+            # Add random variation of up to ±6 hours
+            variations = self._rng.uniform(-6, 6, size=indices.shape) * 3600
+            candidates = np.repeat(current[np.newaxis, :], candidates_per_round, axis=0)
+            np.put_along_axis(
+                candidates, indices,
+                np.take_along_axis(candidates, indices, axis=1) + variations,
+                axis=1
+            )
                 
-            # Sort the schedule
-            test_schedule.sort()
+            # Sort each candidate schedule
+            candidates.sort(axis=1)
             
-            # Check if this improves authenticity
-            test_authenticity = self.analyze_timing_authenticity(test_schedule)["authenticity_score"]
+            # Keep the best candidate if it improves authenticity
+            scores = _score_wall_clock_seconds(candidates)["authenticity_score"]
+            best = int(np.argmax(scores))
             
-            if test_authenticity > current_authenticity:
-                current_schedule = test_schedule
-                current_authenticity = test_authenticity
+            if scores[best] > current_authenticity:
+                current = candidates[best]
+                current_authenticity = scores[best]
+                improved = True
                 
             iterations += 1
+        
+        if not improved:
+            return base_schedule.copy()
             
-        return current_schedule
+        return _from_wall_clock_seconds(current, base_schedule[0].tzinfo)
         
     def get_timing_recommendations(self, 
                                  upload_history: List[datetime],
@@ -528,28 +939,27 @@ class HumanTimingGenerator:
                                        consistency_score: float = 0.7) -> List[datetime]:
         """Generate a realistic burst upload pattern (multiple uploads in short time)"""
         
-        base_time = datetime.now()
-        burst_times = []
+        if burst_size <= 0:
+            return []
         
-        # Generate times within the burst duration
-        for i in range(burst_size):
-            # Calculate position within burst (0.0 to 1.0)
-            position = i / (burst_size - 1) if burst_size > 1 else 0.0
-            
-            # Base time within burst duration
-            base_offset_hours = position * burst_duration_hours
-            
-            # Add realistic spacing (not perfectly even)
-            if i == 0:
-                spacing_variation = 0  # First upload on time
-            else:
-                # Increasing variation as burst progresses (fatigue/rushing)
-                max_variation = (1.0 - consistency_score) * 2.0 * (position + 0.5)
-                spacing_variation = random.uniform(-max_variation, max_variation)
-                
-            actual_offset_hours = base_offset_hours + spacing_variation
-            upload_time = base_time + timedelta(hours=actual_offset_hours)
-            
-            burst_times.append(upload_time)
-            
-        return sorted(burst_times)
+        base_seconds = _to_wall_clock_seconds([datetime.now()])[0]
+        
+        # Position of each upload within the burst (0.0 to 1.0)
+        if burst_size > 1:
+            positions = np.arange(burst_size) / (burst_size - 1)
+        else:
+            positions = np.zeros(1)
+        
+        # Base offset within burst duration
+        base_offset_hours = positions * burst_duration_hours
+        
+        # Add realistic spacing (not perfectly even): the first upload is on
+        # time, later ones vary more as the burst progresses (fatigue/rushing)
+        max_variation = (1.0 - consistency_score) * 2.0 * (positions[1:] + 0.5)
+        spacing_variation = np.zeros(burst_size)
+        spacing_variation[1:] = self._rng.uniform(-max_variation, max_variation)
+        
+        actual_offset_hours = base_offset_hours + spacing_variation
+        burst_seconds = np.sort(base_seconds + actual_offset_hours * 3600)
+        
+        return _from_wall_clock_seconds(burst_seconds)
@@ -2,11 +2,11 @@
 
 import os
 from celery import Celery
-from celery.signals import worker_ready, worker_shutdown
+from celery.signals import after_setup_logger, worker_ready, worker_shutdown
 from kombu import Queue
 import structlog
 
-from ..config.settings import get_settings, get_celery_config
+from ..config.settings import configure_logging, get_settings, get_celery_config
 
 logger = structlog.get_logger()
 settings = get_settings()
@@ -19,7 +19,7 @@ celery_config = get_celery_config()
 celery_app.conf.update(celery_config)
 
 # Define queues with priorities
-celery_app.conf.task_routes = {
+TASK_ROUTES = {
     # High priority tasks - critical uploads and processing
     'youtube_automation_pipeline.workers.youtube_upload.upload_video': {
         'queue': 'high_priority',
@@ -51,8 +51,34 @@ celery_app.conf.task_routes = {
     }
 }
 
+
+class TaskRouter:
+    """Route tasks by exact name from a precomputed lookup table.
+    
+    Celery's default map router also tries glob/regex patterns for every
+    dispatch; all of our routes are exact task names, so a single dict
+    lookup is enough.
+    """
+    
+    def __init__(self, routes):
+        self._table = {
+            name: (route['queue'], route['priority'])
+            for name, route in routes.items()
+        }
+    
+    def __call__(self, name, args, kwargs, options, task=None, **kw):
+        route = self._table.get(name)
+        if route is None:
+            return None
+        # Celery pops keys from the returned mapping, so hand out a fresh dict
+        queue, priority = route
+        return {'queue': queue, 'priority': priority}
+
+
+celery_app.conf.task_routes = (TaskRouter(TASK_ROUTES),)
+
 # Configure queues
-celery_app.conf.task_queues = (
+TASK_QUEUES = (
     Queue('high_priority', routing_key='high_priority', queue_arguments={'x-max-priority': 10}),
     Queue('normal_priority', routing_key='normal_priority', queue_arguments={'x-max-priority': 5}),
     Queue('low_priority', routing_key='low_priority', queue_arguments={'x-max-priority': 1}),
@@ -60,12 +86,16 @@ celery_app.conf.task_queues = (
     Queue('youtube_upload', routing_key='youtube_upload'),
     Queue('content_generation', routing_key='content_generation'),
 )
+celery_app.conf.task_queues = TASK_QUEUES
 
 # Task settings
 celery_app.conf.update(
-    task_serializer='json',
-    accept_content=['json'],
-    result_serializer='json',
+    # msgpack is more compact and faster to (de)serialize than JSON; JSON
+    # stays accepted so messages queued before a rollout still decode
+    task_serializer='msgpack',
+    accept_content=['msgpack', 'json'],
+    result_serializer='msgpack',
+    result_accept_content=['msgpack', 'json'],
     timezone='UTC',
     enable_utc=True,
     
@@ -76,6 +106,7 @@ celery_app.conf.update(
     
     # Result backend settings
     result_expires=3600,  # 1 hour
+    result_compression='gzip',
     result_backend_transport_options={
         'priority_steps': list(range(10)),
         'sep': ':',
@@ -117,6 +148,12 @@ celery_app.conf.update(
 )
 
 
+@after_setup_logger.connect
+def setup_structlog(**kwargs):
+    """Configure structlog once Celery has set up logging in a worker or beat."""
+    configure_logging(settings.debug)
+
+
 @worker_ready.connect
 def worker_ready_handler(sender=None, **kwargs):
     """Handle worker ready signal."""
@@ -136,16 +173,22 @@ def worker_shutdown_handler(sender=None, **kwargs):
     )
 
 
-# Auto-discover tasks
-celery_app.autodiscover_tasks([
+# Task modules, imported by worker and beat processes only
+TASK_MODULES = (
     'youtube_automation_pipeline.workers.video_processing',
-    'youtube_automation_pipeline.workers.youtube_upload', 
+    'youtube_automation_pipeline.workers.youtube_upload',
     'youtube_automation_pipeline.workers.content_generation',
     'youtube_automation_pipeline.workers.analytics',
     'youtube_automation_pipeline.workers.optimization',
     'youtube_automation_pipeline.workers.monitoring',
-    'youtube_automation_pipeline.workers.scheduler'
-])
+    'youtube_automation_pipeline.workers.scheduler',
+)
+
+# Auto-discover tasks lazily: with force=False the imports are deferred to
+# the import_modules signal, so producers (the API) that only send tasks by
+# name never import the worker modules. The entries are task modules
+# themselves, so skip probing for a "<module>.tasks" submodule.
+celery_app.autodiscover_tasks(TASK_MODULES, related_name=None, force=False)
 
 
 # Error handling
@@ -1,35 +1,95 @@
 """Video processing worker for distributed GPU-accelerated processing."""
 
 import asyncio
+import bisect
+import functools
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
 import time
-from typing import Dict, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
+import ffmpeg
+import psutil
 import structlog
-from celery import Task
+from celery import Task, chord, group
 from celery.exceptions import Retry, WorkerLostError
+from celery.signals import worker_process_init, worker_process_shutdown
 
 from .celery_app import celery_app
+from ..config.settings import get_settings
 from ..core.video_processing_engine import (
-    VideoProcessingEngine, VideoProcessingConfig, VideoFormat, ProcessingResult
+    VideoProcessingEngine, VideoProcessingConfig, ProcessingResult, ProcessingErrorCode
 )
 from ..services.aegnt27_service import Aegnt27Service
+from ..utils.gpu_sessions import nvenc_session
 from ..utils.performance_monitor import PerformanceMonitor
 from ..utils.error_handler import ErrorHandler
 from ..models.video_models import VideoProcessingJob, ProcessingStatus
 
 logger = structlog.get_logger()
 
+# From this many thumbnails on, one sequential decode with a select filter
+# beats a keyframe seek per thumbnail
+THUMBNAIL_SELECT_MIN_COUNT = 12
+
+# Thumbnails are JPEG-encoded inside ffmpeg (libavcodec mjpeg, SIMD DCT) as
+# part of the extraction itself; frames never round-trip through Python
+THUMBNAIL_JPEG_OPTIONS = {'format': 'image2', 'vcodec': 'mjpeg', 'qscale:v': 2}
+
+# Segment starts within this many seconds of a keyframe count as aligned
+KEYFRAME_TOLERANCE_SECONDS = 0.05
+
+# Disk usage changes slowly; health checks reuse a reading for this long
+DISK_USAGE_TTL_SECONDS = 30
+
+# Minimum spacing between progress writes to the result backend within a stage
+PROGRESS_MIN_INTERVAL_SECONDS = 0.5
+
+# Default budget for packing batch jobs into one worker task
+VIDEO_PACK_MAX_JOBS = 4
+VIDEO_PACK_MAX_BYTES = 1 << 30  # 1 GiB of input video
+
+# Engine failures worth another attempt; anything else fails the job
+RETRYABLE_ERROR_CODES = frozenset({
+    ProcessingErrorCode.GPU_OOM,
+    ProcessingErrorCode.HOST_OOM,
+    ProcessingErrorCode.GPU_BUSY,
+})
+
+# Metadata fields returned to callers through the result backend; the rest
+# of the engine's metadata stays in the worker logs
+RESULT_METADATA_FIELDS = (
+    'duration_seconds',
+    'fps',
+    'resolution',
+    'format',
+    'output_file_size_bytes',
+    'thumbnails_count',
+)
+
 # Global instances for workers
 video_engine: Optional[VideoProcessingEngine] = None
 performance_monitor: Optional[PerformanceMonitor] = None
 error_handler: Optional[ErrorHandler] = None
+worker_loop: Optional[asyncio.AbstractEventLoop] = None
+video_engine_lock = threading.Lock()
 
 
 def get_video_engine() -> VideoProcessingEngine:
-    """Get or create video processing engine instance."""
+    """Get or create video processing engine instance.
+    
+    The first caller builds the engine; concurrent callers wait for it.
+    """
     global video_engine
     if video_engine is None:
-        video_engine = VideoProcessingEngine()
+        with video_engine_lock:
+            if video_engine is None:
+                video_engine = VideoProcessingEngine()
     return video_engine
 
 
@@ -49,6 +109,396 @@ def get_error_handler() -> ErrorHandler:
     return error_handler
 
 
+def probe_video(video_path: str) -> Tuple[float, float]:
+    """Return (fps, duration_seconds) of a video's first video stream."""
+    probe = ffmpeg.probe(video_path)
+    stream = next(s for s in probe['streams'] if s['codec_type'] == 'video')
+    fps = float(Fraction(stream.get('avg_frame_rate') or stream['r_frame_rate']))
+    duration = float(probe['format'].get('duration') or stream.get('duration') or 0)
+    return fps, duration
+
+
+def probe_keyframes(video_path: str) -> List[float]:
+    """Return the sorted presentation times of the first video stream's keyframes."""
+    probe = ffmpeg.probe(
+        video_path,
+        select_streams='v:0',
+        skip_frame='nokey',
+        show_entries='frame=pts_time,pkt_pts_time'
+    )
+    keyframes = []
+    for frame in probe.get('frames', []):
+        pts_time = frame.get('pts_time', frame.get('pkt_pts_time'))
+        if pts_time not in (None, 'N/A'):
+            keyframes.append(float(pts_time))
+    return sorted(keyframes)
+
+
+@functools.lru_cache(maxsize=1)
+def cuda_pipeline_available() -> bool:
+    """Whether ffmpeg can decode with NVDEC and encode with NVENC here."""
+    video_settings = get_settings().video_processing
+    if not video_settings.gpu_acceleration or video_settings.hardware_encoder != "nvenc":
+        return False
+    
+    try:
+        hwaccels = subprocess.run(
+            [video_settings.ffmpeg_path, '-hide_banner', '-hwaccels'],
+            capture_output=True, text=True, timeout=10
+        ).stdout
+        encoders = subprocess.run(
+            [video_settings.ffmpeg_path, '-hide_banner', '-encoders'],
+            capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return False
+    
+    return 'cuda' in hwaccels.split() and 'h264_nvenc' in encoders
+
+
+def _copy_start(keyframes: List[float], start_time: float) -> float:
+    """Nearest keyframe at or before ``start_time``.
+    
+    Without keyframe data, returns ``start_time`` and lets ffmpeg's own
+    input seek snap the copy.
+    """
+    index = bisect.bisect_right(keyframes, start_time + KEYFRAME_TOLERANCE_SECONDS) - 1
+    return keyframes[index] if index >= 0 else start_time
+
+
+def _needs_reencode(keyframes: List[float], start_time: float, keyframe_snap: bool = False) -> bool:
+    """Whether a cut starts between keyframes and must be re-encoded to start there.
+    
+    With ``keyframe_snap`` the caller accepts a copy from the preceding
+    keyframe instead. Without keyframe data only the start of the file
+    counts as aligned.
+    """
+    if keyframe_snap:
+        return False
+    if not keyframes:
+        return start_time > KEYFRAME_TOLERANCE_SECONDS
+    return start_time - _copy_start(keyframes, start_time) > KEYFRAME_TOLERANCE_SECONDS
+
+
+def _run_ffmpeg(stream) -> None:
+    """Run an ffmpeg command, keeping only error-level stderr.
+    
+    Progress stats and info logging would otherwise be buffered in full
+    for every call; stdout carries nothing since outputs go to files.
+    Errors still reach ``ffmpeg.Error.stderr``.
+    """
+    (
+        stream
+        .global_args('-nostats', '-loglevel', 'error')
+        .overwrite_output()
+        .run(capture_stderr=True)
+    )
+
+
+def _extract_segments_copy(video_path: str, cuts: List[Tuple[float, float, Path]]) -> None:
+    """Stream-copy several (start, end, output_path) cuts in one ffmpeg pass.
+    
+    One demuxer reads the file once and every output keeps the packets of
+    its own window, instead of spawning and initializing ffmpeg per cut.
+    """
+    source = ffmpeg.input(video_path)
+    outputs = [
+        source.output(
+            str(output_path),
+            ss=start_time,
+            t=end_time - start_time,
+            c='copy',
+            map='0',
+            avoid_negative_ts='make_zero'
+        )
+        for start_time, end_time, output_path in cuts
+    ]
+    _run_ffmpeg(ffmpeg.merge_outputs(*outputs))
+
+
+def _extract_segment(
+    video_path: str,
+    start_time: float,
+    end_time: float,
+    output_path: Path,
+    keyframes: List[float],
+    keyframe_snap: bool = False
+) -> None:
+    """Cut one segment, stream-copying whenever the cut can start on a keyframe."""
+    keyframe_start = _copy_start(keyframes, start_time)
+    
+    if _needs_reencode(keyframes, start_time, keyframe_snap):
+        # Start falls between keyframes: only a re-encode can cut there.
+        # On NVIDIA GPUs, decode and encode stay on the device end to end.
+        if cuda_pipeline_available():
+            stream = ffmpeg.input(
+                video_path, ss=start_time, t=end_time - start_time,
+                hwaccel='cuda', hwaccel_output_format='cuda'
+            ).output(
+                str(output_path),
+                vcodec='h264_nvenc',
+                acodec='aac',
+                preset='p4',
+                tune='hq',
+                rc='vbr'
+            )
+            with nvenc_session():
+                _run_ffmpeg(stream)
+            return
+        
+        stream = ffmpeg.input(video_path, ss=start_time, t=end_time - start_time).output(
+            str(output_path),
+            vcodec='libx264',
+            acodec='aac',
+            preset='fast'
+        )
+    else:
+        # Copy packets from the keyframe, keeping the requested end time
+        stream = ffmpeg.input(video_path, ss=keyframe_start, t=end_time - keyframe_start).output(
+            str(output_path),
+            c='copy',
+            map='0',
+            avoid_negative_ts='make_zero'
+        )
+    
+    _run_ffmpeg(stream)
+
+
+def _extract_thumbnails_seek(
+    video_path: str,
+    timestamps: List[float],
+    thumbnail_paths: List[str]
+) -> None:
+    """Extract one frame per timestamp with an input-side (keyframe) seek."""
+    def extract(timestamp: float, thumbnail_path: str) -> None:
+        _run_ffmpeg(
+            ffmpeg
+            .input(video_path, ss=timestamp)
+            .output(thumbnail_path, vframes=1, **THUMBNAIL_JPEG_OPTIONS)
+        )
+    
+    # ffmpeg runs as a child process, so the seeks proceed in parallel
+    max_workers = min(len(timestamps), get_settings().video_processing.max_concurrent_processes)
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        list(executor.map(extract, timestamps, thumbnail_paths))
+
+
+def _extract_thumbnails_select(
+    video_path: str,
+    frame_numbers: List[int],
+    thumbnail_paths: List[str]
+) -> None:
+    """Extract all requested frames in a single sequential decode pass.
+    
+    Frames are decoded into a private temporary directory next to the
+    thumbnails, so concurrent tasks sharing an output directory never see
+    each other's frames, and leftovers are removed however the pass ends.
+    """
+    output_dir = Path(thumbnail_paths[0]).parent
+    selected = sorted(set(frame_numbers))
+    select_expr = '+'.join(f'eq(n\\,{n})' for n in selected)
+    
+    # The full sequential decode runs on NVDEC when available; only the
+    # selected frames are downloaded to host memory for JPEG encoding
+    if cuda_pipeline_available():
+        stream = (
+            ffmpeg
+            .input(video_path, hwaccel='cuda', hwaccel_output_format='cuda')
+            .filter('select', select_expr)
+            .filter('hwdownload')
+            .filter('format', 'nv12')
+        )
+    else:
+        stream = ffmpeg.input(video_path).filter('select', select_expr)
+    
+    frame_dir = Path(tempfile.mkdtemp(prefix='.frames_', dir=output_dir))
+    try:
+        # Stop decoding as soon as the last selected frame has been written
+        _run_ffmpeg(
+            stream.output(
+                str(frame_dir / 'frame_%d.jpg'),
+                vsync='vfr',
+                vframes=len(selected),
+                **THUMBNAIL_JPEG_OPTIONS
+            )
+        )
+        
+        # Frames come out numbered in decode order; move them to their final
+        # names, copying when several timestamps land on the same frame
+        frame_files = {n: frame_dir / f'frame_{i}.jpg' for i, n in enumerate(selected, 1)}
+        remaining = {n: frame_numbers.count(n) for n in selected}
+        for frame_number, thumbnail_path in zip(frame_numbers, thumbnail_paths):
+            frame_file = frame_files[frame_number]
+            if not frame_file.exists():
+                continue
+            remaining[frame_number] -= 1
+            if remaining[frame_number]:
+                shutil.copyfile(frame_file, thumbnail_path)
+            else:
+                frame_file.replace(thumbnail_path)
+    finally:
+        shutil.rmtree(frame_dir, ignore_errors=True)
+
+
+def get_worker_loop() -> asyncio.AbstractEventLoop:
+    """Get or create the event loop shared by tasks in this worker process."""
+    global worker_loop
+    if worker_loop is None or worker_loop.is_closed():
+        worker_loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(worker_loop)
+    return worker_loop
+
+
+@functools.lru_cache(maxsize=1)
+def _disk_usage_percent(ttl_bucket: int) -> float:
+    """Root filesystem usage, cached per ``DISK_USAGE_TTL_SECONDS`` bucket."""
+    return psutil.disk_usage('/').percent
+
+
+@worker_process_init.connect
+def init_video_worker_process(**kwargs):
+    """Create the event loop and processing engine once per worker process."""
+    get_worker_loop()
+    
+    # Prime the CPU-time baseline so the first health check reports a delta
+    psutil.cpu_percent(interval=None)
+    
+    # Loading models can take far longer than Celery waits for a new child
+    # (worker_proc_alive_timeout), so warm up in the background; tasks that
+    # arrive first wait for the engine in get_video_engine
+    threading.Thread(
+        target=_warm_up_video_worker,
+        name='video-engine-warmup',
+        daemon=True
+    ).start()
+
+
+def _warm_up_video_worker() -> None:
+    """Probe ffmpeg's NVDEC/NVENC support and build the processing engine."""
+    cuda_pipeline_available()
+    
+    try:
+        get_video_engine()
+    except Exception as e:
+        # Tasks retry the engine lazily; don't take the worker down
+        logger.error("Video processing engine initialization failed", error=str(e))
+
+
+@worker_process_shutdown.connect
+def shutdown_video_worker_process(**kwargs):
+    """Close the worker process event loop."""
+    global worker_loop
+    if worker_loop is not None and not worker_loop.is_closed():
+        worker_loop.run_until_complete(worker_loop.shutdown_asyncgens())
+        worker_loop.close()
+    worker_loop = None
+
+
+class ProgressReporter:
+    """Engine progress callback that rate-limits result backend writes.
+    
+    Each ``update_state`` is a backend write, so ticks within a stage are
+    dropped until ``PROGRESS_MIN_INTERVAL_SECONDS`` have passed. Stage
+    changes and completion are always written.
+    """
+    
+    __slots__ = ('task', 'job_id', '_last_stage', '_last_write')
+    
+    def __init__(self, task: Task, job_id: str):
+        self.task = task
+        self.job_id = job_id
+        self._last_stage: Optional[str] = None
+        self._last_write = 0.0
+    
+    async def __call__(self, stage: str, progress: float) -> None:
+        now = time.monotonic()
+        if (
+            stage == self._last_stage
+            and progress < 1.0
+            and now - self._last_write < PROGRESS_MIN_INTERVAL_SECONDS
+        ):
+            return
+        
+        self._last_stage = stage
+        self._last_write = now
+        self.task.update_state(
+            state='PROCESSING',
+            meta={
+                'progress': int(progress * 100),
+                'stage': stage,
+                'job_id': self.job_id
+            }
+        )
+
+
+def _result_metadata(metadata: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Select the ``RESULT_METADATA_FIELDS`` subset of the engine's metadata."""
+    if not metadata:
+        return {}
+    return {key: metadata[key] for key in RESULT_METADATA_FIELDS if key in metadata}
+
+
+def _fail_missing_input(task: Task, job_data: Dict[str, Any], job_id: str) -> Dict[str, Any]:
+    """Fail the job without retrying; a missing input won't reappear."""
+    return {
+        'success': False,
+        'job_id': job_id,
+        'error': f"Input file not found: {job_data['input_path']}"
+    }
+
+
+def _retry_without_gpu(task: Task, job_data: Dict[str, Any], job_id: str) -> Dict[str, Any]:
+    """Retry the job once with GPU processing disabled.
+    
+    The original arguments are resent untouched; only the ``overrides``
+    keyword argument changes.
+    """
+    kwargs = task.request.kwargs or {}
+    raise task.retry(
+        kwargs={**kwargs, 'overrides': {**(kwargs.get('overrides') or {}), 'enable_gpu': False}},
+        countdown=120,  # Wait 2 minutes
+        max_retries=1
+    )
+
+
+# Task exception handlers, keyed by exception type
+EXCEPTION_HANDLERS = {
+    FileNotFoundError: _fail_missing_input,
+    MemoryError: _retry_without_gpu,
+}
+
+
+def pack_video_jobs(
+    job_batch: List[Dict[str, Any]],
+    max_jobs: int = VIDEO_PACK_MAX_JOBS,
+    max_bytes: int = VIDEO_PACK_MAX_BYTES
+) -> List[List[Dict[str, Any]]]:
+    """Greedily pack jobs, in order, into packs within a job-count and input-size budget.
+    
+    A job larger than ``max_bytes`` on its own still gets a pack of one.
+    """
+    packs: List[List[Dict[str, Any]]] = []
+    pack: List[Dict[str, Any]] = []
+    pack_bytes = 0
+    
+    for job_data in job_batch:
+        try:
+            job_bytes = os.path.getsize(job_data['input_path'])
+        except OSError:
+            job_bytes = 0
+        
+        if pack and (len(pack) >= max_jobs or pack_bytes + job_bytes > max_bytes):
+            packs.append(pack)
+            pack, pack_bytes = [], 0
+        
+        pack.append(job_data)
+        pack_bytes += job_bytes
+    
+    if pack:
+        packs.append(pack)
+    return packs
+
+
 class VideoProcessingTask(Task):
     """Base class for video processing tasks."""
     
@@ -94,9 +544,29 @@ class VideoProcessingTask(Task):
 def process_video(
     self,
     job_data: Dict[str, Any],
-    priority: str = "normal"
+    priority: str = "normal",
+    overrides: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """Process a video through the complete pipeline."""
+    return _process_video_impl(self, job_data, priority, overrides)
+
+
+def _process_video_impl(
+    self: Task,
+    job_data: Dict[str, Any],
+    priority: str,
+    overrides: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """Run the processing pipeline for ``job_data`` within the calling task.
+    
+    Shared by ``process_video`` and ``process_urgent_video`` so neither has
+    to wrap the other in a second task invocation. ``overrides`` are job
+    settings changed by a retry, applied over ``job_data`` without
+    modifying it.
+    """
+    
+    if overrides:
+        job_data = {**job_data, **overrides}
     
     job_id = job_data.get('job_id', self.request.id)
     input_path = job_data['input_path']
@@ -121,45 +591,22 @@ def process_video(
         monitor = get_performance_monitor()
         
         # Create processing configuration
-        config = VideoProcessingConfig(
-            input_path=input_path,
-            output_path=output_path,
-            format=VideoFormat(job_data.get('format', 'youtube_long')),
-            quality_preset=job_data.get('quality_preset', 'high'),
-            enable_gpu=job_data.get('enable_gpu', True),
-            enable_ai_narration=job_data.get('enable_ai_narration', True),
-            enable_authenticity_injection=job_data.get('enable_authenticity_injection', True),
-            enable_thumbnail_generation=job_data.get('enable_thumbnail_generation', True)
-        )
+        config = VideoProcessingConfig.from_job_data(job_data)
         
         # Progress callback
-        def progress_callback(stage: str, progress: float):
-            self.update_state(
-                state='PROCESSING',
-                meta={
-                    'progress': int(progress * 100),
-                    'stage': stage,
-                    'job_id': job_id
-                }
-            )
+        progress_callback = ProgressReporter(self, job_id)
         
         # Start performance monitoring
         monitor.start_monitoring(job_id)
         
-        # Process video
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-        
-        try:
-            result = loop.run_until_complete(
-                engine.process_video(
-                    config=config,
-                    job_id=job_id,
-                    progress_callback=progress_callback
-                )
+        # Process video on the worker process's persistent loop
+        result = get_worker_loop().run_until_complete(
+            engine.process_video(
+                config=config,
+                job_id=job_id,
+                progress_callback=progress_callback
             )
-        finally:
-            loop.close()
+        )
         
         # Stop performance monitoring
         performance_metrics = monitor.stop_monitoring(job_id)
@@ -169,17 +616,17 @@ def process_video(
                 "Video processing completed successfully",
                 job_id=job_id,
                 output_path=result.output_path,
-                processing_time=result.processing_time_seconds
+                processing_time=result.processing_time_seconds,
+                performance_metrics=performance_metrics
             )
             
             return {
                 'success': True,
                 'job_id': job_id,
                 'output_path': result.output_path,
-                'metadata': result.metadata.__dict__ if result.metadata else {},
+                'metadata': _result_metadata(result.metadata),
                 'thumbnails': result.thumbnails or [],
                 'processing_time_seconds': result.processing_time_seconds,
-                'performance_metrics': performance_metrics,
                 'authenticity_score': result.authenticity_score
             }
         else:
@@ -191,7 +638,7 @@ def process_video(
             )
             
             # Retry on certain types of errors
-            if "GPU" in error_msg or "memory" in error_msg.lower():
+            if result.error_code in RETRYABLE_ERROR_CODES:
                 raise self.retry(
                     countdown=60,  # Wait 1 minute before retry
                     max_retries=2
@@ -213,24 +660,13 @@ def process_video(
         )
         
         # Handle specific exceptions
-        if isinstance(e, FileNotFoundError):
-            # Don't retry for missing files
-            return {
-                'success': False,
-                'job_id': job_id,
-                'error': f"Input file not found: {input_path}"
-            }
-        elif isinstance(e, MemoryError):
-            # Retry with different GPU settings
-            job_data['enable_gpu'] = False
-            raise self.retry(
-                args=[job_data, priority],
-                countdown=120,  # Wait 2 minutes
-                max_retries=1
-            )
-        else:
-            # Retry for other exceptions
-            raise self.retry(countdown=60 * (self.request.retries + 1))
+        for exc_type in type(e).__mro__:
+            handler = EXCEPTION_HANDLERS.get(exc_type)
+            if handler is not None:
+                return handler(self, job_data, job_id)
+        
+        # Retry for other exceptions
+        raise self.retry(countdown=60 * (self.request.retries + 1))
 
 
 @celery_app.task(
@@ -241,7 +677,8 @@ def process_video(
 )
 def process_urgent_video(
     self,
-    job_data: Dict[str, Any]
+    job_data: Dict[str, Any],
+    overrides: Optional[Dict[str, Any]] = None
 ) -> Dict[str, Any]:
     """Process urgent video with high priority."""
     
@@ -250,11 +687,7 @@ def process_urgent_video(
     job_data.setdefault('enable_ai_narration', False)   # Skip for speed
     job_data.setdefault('enable_thumbnail_generation', True)  # Keep thumbnails
     
-    return process_video.apply(
-        args=[job_data, "urgent"],
-        queue='high_priority',
-        priority=9
-    ).get()
+    return _process_video_impl(self, job_data, "urgent", overrides)
 
 
 @celery_app.task(
@@ -266,8 +699,17 @@ def batch_process_videos(
     job_batch: List[Dict[str, Any]],
     batch_settings: Dict[str, Any] = None
 ) -> Dict[str, Any]:
-    """Process multiple videos in batch with optimization."""
+    """Process multiple videos in batch with optimization.
+    
+    Jobs are packed within a job-count / input-size budget
+    (``max_pack_jobs`` / ``max_pack_bytes`` in ``batch_settings``; set
+    ``max_pack_jobs`` to 1 to disable packing) and the packs fan out
+    across all workers as a chord; this task only dispatches them and
+    returns. The batch summary is produced by ``aggregate_batch_results``
+    once every pack has finished, under the returned ``results_task_id``.
+    """
     
+    batch_settings = batch_settings or {}
     batch_id = batch_settings.get('batch_id', self.request.id)
     
     logger.info(
@@ -277,59 +719,33 @@ def batch_process_videos(
     )
     
     try:
-        results = []
-        total_jobs = len(job_batch)
+        job_ids = [
+            job_data.get('job_id', f"{batch_id}_{i}")
+            for i, job_data in enumerate(job_batch)
+        ]
         
-        for i, job_data in enumerate(job_batch):
-            try:
-                # Update batch progress
-                self.update_state(
-                    state='PROCESSING',
-                    meta={
-                        'batch_id': batch_id,
-                        'progress': int((i / total_jobs) * 100),
-                        'current_job': i + 1,
-                        'total_jobs': total_jobs
-                    }
-                )
-                
-                # Process individual video
-                result = process_video.apply(
-                    args=[job_data, "batch"],
-                    queue='normal_priority'
-                ).get()
-                
-                results.append(result)
-                
-            except Exception as e:
-                logger.error(
-                    "Batch job failed",
-                    batch_id=batch_id,
-                    job_index=i,
-                    error=str(e)
-                )
-                
-                results.append({
-                    'success': False,
-                    'job_id': job_data.get('job_id', f"{batch_id}_{i}"),
-                    'error': str(e)
-                })
-        
-        successful_jobs = sum(1 for r in results if r.get('success', False))
-        
-        logger.info(
-            "Batch processing completed",
-            batch_id=batch_id,
-            successful_jobs=successful_jobs,
-            total_jobs=total_jobs
+        packs = pack_video_jobs(
+            job_batch,
+            max_jobs=batch_settings.get('max_pack_jobs', VIDEO_PACK_MAX_JOBS),
+            max_bytes=batch_settings.get('max_pack_bytes', VIDEO_PACK_MAX_BYTES)
         )
+        # Packs are contiguous runs of the batch; hand each its slice of ids
+        pack_tasks = []
+        offset = 0
+        for pack in packs:
+            pack_job_ids = job_ids[offset:offset + len(pack)]
+            offset += len(pack)
+            pack_tasks.append(
+                process_video_pack.s(pack, batch_id, pack_job_ids).set(queue='normal_priority')
+            )
+        result = chord(group(pack_tasks))(aggregate_batch_results.s(batch_id=batch_id, job_ids=job_ids))
         
         return {
             'batch_id': batch_id,
-            'total_jobs': total_jobs,
-            'successful_jobs': successful_jobs,
-            'failed_jobs': total_jobs - successful_jobs,
-            'results': results
+            'total_jobs': len(job_batch),
+            'total_packs': len(packs),
+            'status': 'dispatched',
+            'results_task_id': result.id
         }
         
     except Exception as e:
@@ -341,6 +757,139 @@ def batch_process_videos(
         raise
 
 
+@celery_app.task(
+    bind=True,
+    queue='video_processing',
+    max_retries=2
+)
+def process_video_pack(
+    self,
+    job_pack: List[Dict[str, Any]],
+    batch_id: str,
+    job_ids: List[str],
+    completed: Optional[Dict[str, Dict[str, Any]]] = None
+) -> List[Dict[str, Any]]:
+    """Process a pack of videos concurrently in one worker.
+    
+    The pack shares the worker's warm engine (models, GPU context) and its
+    jobs run concurrently on the worker loop, overlapping their I/O and
+    GPU stages instead of paying task dispatch and engine warm-up per job.
+    
+    Jobs failing with a ``RETRYABLE_ERROR_CODES`` error are retried as a
+    smaller pack of just those jobs; results of the other jobs are carried
+    across retries in ``completed``, keyed by job id.
+    """
+    
+    engine = get_video_engine()
+    completed = dict(completed or {})
+    pending = [
+        (job_id, job_data)
+        for job_id, job_data in zip(job_ids, job_pack)
+        if job_id not in completed
+    ]
+    
+    async def run_job(job_id: str, job_data: Dict[str, Any]) -> ProcessingResult:
+        return await engine.process_video(
+            config=VideoProcessingConfig.from_job_data(job_data),
+            job_id=job_id
+        )
+    
+    async def run_pack() -> List[Any]:
+        return await asyncio.gather(
+            *(run_job(job_id, job_data) for job_id, job_data in pending),
+            return_exceptions=True
+        )
+    
+    outcomes = get_worker_loop().run_until_complete(run_pack())
+    
+    retry_ids = set()
+    for (job_id, _), outcome in zip(pending, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error("Batch job failed", batch_id=batch_id, job_id=job_id, error=str(outcome))
+            completed[job_id] = {'success': False, 'job_id': job_id, 'error': str(outcome)}
+        elif outcome.success:
+            completed[job_id] = {
+                'success': True,
+                'job_id': job_id,
+                'output_path': outcome.output_path,
+                'metadata': _result_metadata(outcome.metadata),
+                'thumbnails': outcome.thumbnails or [],
+                'processing_time_seconds': outcome.processing_time_seconds,
+                'authenticity_score': outcome.authenticity_score
+            }
+        else:
+            if outcome.error_code in RETRYABLE_ERROR_CODES:
+                retry_ids.add(job_id)
+            completed[job_id] = {
+                'success': False,
+                'job_id': job_id,
+                'error': outcome.error_message or "Unknown processing error",
+                'processing_time_seconds': outcome.processing_time_seconds
+            }
+    
+    if retry_ids and self.request.retries < self.max_retries:
+        logger.warning(
+            "Retrying batch jobs",
+            batch_id=batch_id,
+            job_ids=sorted(retry_ids)
+        )
+        raise self.retry(
+            kwargs={
+                'completed': {
+                    job_id: result
+                    for job_id, result in completed.items()
+                    if job_id not in retry_ids
+                }
+            },
+            countdown=60  # Wait 1 minute before retry
+        )
+    
+    return [completed[job_id] for job_id in job_ids]
+
+
+@celery_app.task(queue='video_processing')
+def aggregate_batch_results(
+    pack_results: List[Any],
+    batch_id: str,
+    job_ids: List[str]
+) -> Dict[str, Any]:
+    """Summarize the results of a dispatched video batch."""
+    
+    # Flatten per-pack result lists back into job order
+    results = [
+        result
+        for pack in pack_results
+        for result in (pack if isinstance(pack, list) else [pack])
+    ]
+    
+    results = [
+        result if isinstance(result, dict) else {
+            'success': False,
+            'job_id': job_id,
+            'error': f"Unexpected job result: {result!r}"
+        }
+        for job_id, result in zip(job_ids, results)
+    ]
+    
+    total_jobs = len(job_ids)
+    successful_jobs = sum(1 for r in results if r.get('success', False))
+    
+    logger.info(
+        "Batch processing completed",
+        batch_id=batch_id,
+        successful_jobs=successful_jobs,
+        total_jobs=total_jobs
+    )
+    
+    return {
+        'batch_id': batch_id,
+        'total_jobs': total_jobs,
+        'successful_jobs': successful_jobs,
+        'failed_jobs': total_jobs - successful_jobs,
+        'results': results
+    }
+
+
 @celery_app.task(
     bind=True,
     queue='video_processing'
@@ -351,7 +900,12 @@ def extract_video_segments(
     segments: List[Dict[str, Any]],
     output_dir: str
 ) -> Dict[str, Any]:
-    """Extract specific segments from a video."""
+    """Extract specific segments from a video.
+    
+    Segments starting on a keyframe are stream-copied; others are
+    re-encoded to start exactly on time, unless the segment sets
+    ``keyframe_snap`` to accept a copy from the preceding keyframe.
+    """
     
     job_id = self.request.id
     
@@ -363,42 +917,70 @@ def extract_video_segments(
     )
     
     try:
-        import ffmpeg
+        keyframes = probe_keyframes(video_path)
         
-        output_paths = []
+        segment_names = [
+            segment.get('name', f"segment_{index}") for index, segment in enumerate(segments)
+        ]
+        out_dir = Path(output_dir)
+        segment_paths = [out_dir / f"{name}.mp4" for name in segment_names]
+        # Almost always a single directory; names may still nest subdirectories
+        for segment_dir in {output_path.parent for output_path in segment_paths}:
+            segment_dir.mkdir(parents=True, exist_ok=True)
         
-        for i, segment in enumerate(segments):
-            start_time = segment['start_time']
-            end_time = segment['end_time']
-            segment_name = segment.get('name', f"segment_{i}")
-            
-            output_path = Path(output_dir) / f"{segment_name}.mp4"
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+        # Cut every stream-copyable segment in a single ffmpeg pass
+        copy_indices = [
+            index for index, segment in enumerate(segments)
+            if not _needs_reencode(
+                keyframes, segment['start_time'], segment.get('keyframe_snap', False)
+            )
+        ]
+        extracted: List[Optional[str]] = [None] * len(segments)
+        
+        if len(copy_indices) > 1:
+            try:
+                _extract_segments_copy(video_path, [
+                    (
+                        _copy_start(keyframes, segments[index]['start_time']),
+                        segments[index]['end_time'],
+                        segment_paths[index]
+                    )
+                    for index in copy_indices
+                ])
+                for index in copy_indices:
+                    if segment_paths[index].exists():
+                        extracted[index] = str(segment_paths[index])
+            except Exception as e:
+                logger.warning(
+                    "Single-pass segment copy failed, cutting segments individually",
+                    job_id=job_id,
+                    error=str(e)
+                )
+        
+        def extract(index: int) -> Optional[str]:
+            segment = segments[index]
+            segment_name = segment_names[index]
+            output_path = segment_paths[index]
             
             try:
                 # Extract segment using ffmpeg
-                (
-                    ffmpeg
-                    .input(video_path, ss=start_time, t=end_time - start_time)
-                    .output(
-                        str(output_path),
-                        vcodec='libx264',
-                        acodec='aac',
-                        preset='fast'
-                    )
-                    .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
+                _extract_segment(
+                    video_path,
+                    segment['start_time'],
+                    segment['end_time'],
+                    output_path,
+                    keyframes,
+                    keyframe_snap=segment.get('keyframe_snap', False)
                 )
                 
                 if output_path.exists():
-                    output_paths.append(str(output_path))
-                    
                     logger.info(
                         "Segment extracted",
                         job_id=job_id,
                         segment_name=segment_name,
                         output_path=str(output_path)
                     )
+                    return str(output_path)
                 
             except Exception as e:
                 logger.error(
@@ -407,6 +989,18 @@ def extract_video_segments(
                     segment_name=segment_name,
                     error=str(e)
                 )
+            return None
+        
+        # Re-encoded (and any uncopied) segments: each ffmpeg child runs
+        # outside the GIL, so these are cut concurrently
+        pending = [index for index, path in enumerate(extracted) if path is None]
+        if pending:
+            max_workers = min(len(pending), get_settings().video_processing.max_concurrent_processes)
+            with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+                for index, path in zip(pending, executor.map(extract, pending)):
+                    extracted[index] = path
+        
+        output_paths = [path for path in extracted if path is not None]
         
         return {
             'success': True,
@@ -452,17 +1046,8 @@ def generate_video_thumbnails(
     )
     
     try:
-        import cv2
-        
-        cap = cv2.VideoCapture(video_path)
-        
-        if not cap.isOpened():
-            raise RuntimeError(f"Could not open video: {video_path}")
-        
         # Get video properties
-        fps = cap.get(cv2.CAP_PROP_FPS)
-        frame_count = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
-        duration = frame_count / fps if fps > 0 else 0
+        fps, duration = probe_video(video_path)
         
         # Determine timestamps
         if timestamp_list:
@@ -471,35 +1056,23 @@ def generate_video_thumbnails(
             # Evenly distributed timestamps
             timestamps = [duration * i / thumbnail_count for i in range(thumbnail_count)]
         
-        output_dir = Path(output_dir)
-        output_dir.mkdir(parents=True, exist_ok=True)
+        Path(output_dir).mkdir(parents=True, exist_ok=True)
         
-        thumbnail_paths = []
+        # Plain string paths: one concatenation each, no Path normalisation
+        prefix = os.path.join(output_dir, 'thumbnail_')
+        planned_paths = [
+            f"{prefix}{i}_{int(timestamp)}.jpg" for i, timestamp in enumerate(timestamps)
+        ]
         
-        for i, timestamp in enumerate(timestamps):
-            # Seek to timestamp
-            frame_number = int(timestamp * fps)
-            cap.set(cv2.CAP_PROP_POS_FRAMES, frame_number)
-            
-            ret, frame = cap.read()
-            if ret:
-                thumbnail_path = output_dir / f"thumbnail_{i}_{int(timestamp)}.jpg"
-                
-                # Save frame as JPEG
-                cv2.imwrite(str(thumbnail_path), frame, [
-                    cv2.IMWRITE_JPEG_QUALITY, 90
-                ])
-                
-                thumbnail_paths.append(str(thumbnail_path))
-                
-                logger.debug(
-                    "Thumbnail generated",
-                    job_id=job_id,
-                    timestamp=timestamp,
-                    path=str(thumbnail_path)
+        if timestamps:
+            if len(timestamps) >= THUMBNAIL_SELECT_MIN_COUNT:
+                _extract_thumbnails_select(
+                    video_path, [int(timestamp * fps) for timestamp in timestamps], planned_paths
                 )
+            else:
+                _extract_thumbnails_seek(video_path, timestamps, planned_paths)
         
-        cap.release()
+        thumbnail_paths = [path for path in planned_paths if os.path.exists(path)]
         
         logger.info(
             "Thumbnail generation completed",
@@ -534,19 +1107,20 @@ def health_check_video_processing(self) -> Dict[str, Any]:
     try:
         # Check GPU availability
         engine = get_video_engine()
-        gpu_status = await engine.get_processing_queue_status()
+        gpu_status = get_worker_loop().run_until_complete(
+            engine.get_processing_queue_status()
+        )
         
         # Check system resources
-        import psutil
-        
+        now = time.time()
         return {
             'status': 'healthy',
             'worker_id': self.request.hostname,
             'gpu_status': gpu_status,
-            'cpu_percent': psutil.cpu_percent(),
+            'cpu_percent': psutil.cpu_percent(interval=None),  # since last check
             'memory_percent': psutil.virtual_memory().percent,
-            'disk_usage': psutil.disk_usage('/').percent,
-            'timestamp': time.time()
+            'disk_usage': _disk_usage_percent(int(now // DISK_USAGE_TTL_SECONDS)),
+            'timestamp': now
         }
         
     except Exception as e:
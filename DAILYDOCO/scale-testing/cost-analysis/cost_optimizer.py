@@ -12,20 +12,24 @@ Analyzes and optimizes infrastructure costs at 10M videos/month scale:
 """
 
 import asyncio
-import json
+import heapq
 import math
 import time
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass, asdict
-from decimal import Decimal, ROUND_HALF_UP
-import csv
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import attrgetter
+from dataclasses import dataclass, field, fields
 
-import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
+import orjson
+import pyarrow as pa
+import pyarrow.csv
+import pyarrow.feather
+import matplotlib
+import matplotlib.style
+from matplotlib.figure import Figure
 from loguru import logger
 from rich.console import Console
 from rich.table import Table
@@ -33,7 +37,219 @@ from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
 console = Console()
 
-@dataclass
+# Charts are only ever written to files
+matplotlib.use("Agg")
+
+# Style shared by every report chart
+CHART_STYLE = "seaborn-v0_8"
+
+# Charts are viewed on screen, so save them at screen resolution with fast,
+# light PNG compression
+CHART_DPI = 120
+CHART_PIL_KWARGS = {"compress_level": 1}
+
+# Cloud providers with pricing tables, in table row order
+PROVIDERS = ("aws", "gcp", "azure", "multi")
+PROVIDER_INDEX = {provider: i for i, provider in enumerate(PROVIDERS)}
+
+# Cost breakdown components, in table column order
+COMPONENTS = (
+    "gpu_compute",
+    "cpu_compute",
+    "permanent_storage",
+    "temp_storage",
+    "bandwidth",
+    "database",
+    "queue",
+)
+COMPONENT_INDEX = {component: i for i, component in enumerate(COMPONENTS)}
+
+# Resource requirements, in requirement matrix column order
+REQUIREMENT_KEYS = (
+    "gpu_hours",
+    "cpu_hours",
+    "temp_storage_gb",
+    "permanent_storage_gb",
+    "upload_bandwidth_gb",
+    "cdn_bandwidth_gb",
+    "database_hours",
+    "queue_operations",
+)
+REQUIREMENT_INDEX = {key: i for i, key in enumerate(REQUIREMENT_KEYS)}
+
+# Video processing assumptions
+AVG_VIDEO_LENGTH_MINUTES = 15
+PROCESSING_TIME_MULTIPLIER = 1.5  # Sub-2x realtime target
+CPU_HOURS_PER_VIDEO = 0.1  # For metadata, API calls, etc.
+AVG_RAW_VIDEO_SIZE_GB = 2.0  # 15 min at 1080p
+AVG_PROCESSED_VIDEO_SIZE_GB = 0.5  # Compressed
+DATABASE_HOURS_PER_MONTH = 24 * 30  # Always on
+QUEUE_OPERATIONS_PER_VIDEO = 10
+
+# Resource requirements that scale with monthly volume, per video, and the
+# fixed monthly ones, in REQUIREMENT_KEYS order
+REQUIREMENTS_PER_VIDEO = np.array([
+    (AVG_VIDEO_LENGTH_MINUTES / 60) * PROCESSING_TIME_MULTIPLIER,  # GPU hours
+    CPU_HOURS_PER_VIDEO,
+    AVG_RAW_VIDEO_SIZE_GB * 1.5,  # Temp space
+    AVG_PROCESSED_VIDEO_SIZE_GB,  # Permanent storage
+    AVG_PROCESSED_VIDEO_SIZE_GB,  # Upload bandwidth
+    AVG_PROCESSED_VIDEO_SIZE_GB * 3,  # CDN bandwidth, 3x for global distribution
+    0.0,
+    QUEUE_OPERATIONS_PER_VIDEO,
+])
+FIXED_REQUIREMENTS = np.array([0.0, 0.0, 0.0, 0.0, 0.0, 0.0, DATABASE_HOURS_PER_MONTH, 0.0])
+
+# Requirement column billed by each component
+COMPONENT_USAGE = np.array([
+    REQUIREMENT_KEYS.index(key) for key in (
+        "gpu_hours",
+        "cpu_hours",
+        "permanent_storage_gb",
+        "temp_storage_gb",
+        "cdn_bandwidth_gb",
+        "database_hours",
+        "queue_operations",
+    )
+])
+
+# Volume discount tiers of a component that gets no discount (never mutated)
+NO_DISCOUNT: Dict[float, float] = {}
+
+def discount_tiers(volume_discounts: Optional[Dict[float, float]]) -> Tuple[np.ndarray, np.ndarray]:
+    """Split volume discount tiers into sorted thresholds and their rates.
+    
+    The rates lead with a 1.0 sentinel, so the rate for a usage is the one at
+    the count of thresholds it exceeds.
+    """
+    thresholds = sorted(volume_discounts or {})
+    rates = [1.0] + [volume_discounts[threshold] for threshold in thresholds]
+    return np.array(thresholds, dtype=np.float64), np.array(rates, dtype=np.float64)
+
+# Report table columns, with the result attributes that fill them
+SUMMARY_COLUMNS = (
+    "scenario",
+    "monthly_volume",
+    "total_monthly_cost",
+    "cost_per_video",
+    "projected_savings",
+    "optimized_cost_per_video",
+    "meets_target",
+)
+summary_row = attrgetter(
+    "scenario_name",
+    "monthly_volume",
+    "total_monthly_cost",
+    "cost_per_video",
+    "projected_savings",
+    "optimized_cost_per_video",
+    "meets_target",
+)
+
+OPTIMIZATION_COLUMNS = (
+    "component",
+    "current_cost",
+    "savings",
+    "savings_percent",
+    "strategy",
+    "effort",
+    "risk",
+    "timeline",
+)
+optimization_row = attrgetter(
+    "component",
+    "current_cost",
+    "savings",
+    "savings_percent",
+    "optimization_strategy",
+    "implementation_effort",
+    "risk_level",
+    "timeline",
+)
+
+# Arrow column types of the summary (with per-component costs) and
+# recommendation tables, so writing them skips type inference
+SUMMARY_SCHEMA = pa.schema(
+    list(zip(SUMMARY_COLUMNS, (
+        pa.string(),
+        pa.int64(),
+        pa.float64(),
+        pa.float64(),
+        pa.float64(),
+        pa.float64(),
+        pa.bool_(),
+    )))
+    + [(component, pa.float64()) for component in COMPONENTS]
+)
+OPTIMIZATION_SCHEMA = pa.schema(
+    [("scenario", pa.string())]
+    + list(zip(OPTIMIZATION_COLUMNS, (
+        pa.string(),
+        pa.float64(),
+        pa.float64(),
+        pa.float64(),
+        pa.string(),
+        pa.string(),
+        pa.string(),
+        pa.string(),
+    )))
+)
+
+# Optimization recommendations, one (component, costed COMPONENTS, cost
+# threshold, savings percent, strategy, effort, risk, timeline) rule each. A
+# rule applies when the summed cost of its components exceeds the threshold.
+OPT_RULES = (
+    (
+        "GPU Compute", ("gpu_compute",), 100000, 25.0,
+        "Use preemptible/spot instances, optimize GPU utilization to 80%+, implement intelligent batching",
+        "medium", "low", "weeks",
+    ),
+    (
+        "Storage", ("permanent_storage", "temp_storage"), 50000, 35.0,
+        "Implement intelligent compression, lifecycle policies, deduplication, and cold storage tiers",
+        "medium", "low", "weeks",
+    ),
+    (
+        "Bandwidth", ("bandwidth",), 30000, 30.0,
+        "Optimize CDN caching, implement video compression, use regional CDN optimization",
+        "medium", "low", "weeks",
+    ),
+    (
+        "Multi-Cloud Strategy", COMPONENTS, -math.inf, 20.0,
+        "Implement multi-cloud architecture using best provider for each service",
+        "high", "medium", "months",
+    ),
+    (
+        "Reserved Instances", ("gpu_compute", "cpu_compute"), 75000, 40.0,
+        "Purchase 1-3 year reserved instances for baseline compute capacity",
+        "low", "low", "immediate",
+    ),
+)
+OPT_RULE_COMPONENTS = np.array([
+    [component in rule[1] for component in COMPONENTS] for rule in OPT_RULES
+], dtype=np.float64)
+OPT_RULE_THRESHOLDS = np.array([rule[2] for rule in OPT_RULES], dtype=np.float64)
+OPT_RULE_RATES = np.array([rule[3] / 100 for rule in OPT_RULES])
+
+# Rules each provider is eligible for; multi-cloud setups are already multi-cloud
+OPT_RULES_APPLY_TO = {
+    provider: np.array([
+        not (provider == "multi" and rule[0] == "Multi-Cloud Strategy") for rule in OPT_RULES
+    ])
+    for provider in PROVIDERS
+}
+
+def records_table(records: List[Tuple[Any, ...]], schema: pa.Schema) -> pa.Table:
+    """Columnar Arrow table from row tuples, one value per schema field each"""
+    return pa.table(
+        {column: [record[i] for record in records] for i, column in enumerate(schema.names)},
+        schema=schema
+    )
+
+# Scenario analyses kept per optimizer, keyed by (volume, provider, optimized)
+ANALYSIS_CACHE_SIZE = 128
+
+@dataclass(slots=True, frozen=True)
 class CostModel:
     """Infrastructure cost model"""
     component: str
@@ -42,9 +258,9 @@ class CostModel:
     fixed_cost: float = 0.0  # Fixed monthly cost
     scaling_factor: float = 1.0  # Cost scaling with volume
     min_commitment: float = 0.0  # Minimum commitment discount
-    volume_discounts: Dict[int, float] = None  # Volume discount tiers
+    volume_discounts: Dict[int, float] = field(default_factory=dict, hash=False)  # Volume discount tiers
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CostOptimization:
     """Cost optimization recommendation"""
     component: str
@@ -57,19 +273,52 @@ class CostOptimization:
     risk_level: str  # "low", "medium", "high"
     timeline: str  # "immediate", "weeks", "months"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class CostAnalysisResult:
     """Cost analysis result"""
     scenario_name: str
     monthly_volume: int
     total_monthly_cost: float
     cost_per_video: float
-    cost_breakdown: Dict[str, float]
-    optimizations: List[CostOptimization]
+    # Left out of == and hash(): arrays and lists are unhashable, and the
+    # totals already summarize them
+    cost_breakdown: np.ndarray = field(compare=False)  # Monthly cost per component, in COMPONENTS order
+    optimizations: List[CostOptimization] = field(compare=False)
     projected_savings: float
     optimized_cost_per_video: float
     meets_target: bool
     timestamp: datetime
+    
+    def breakdown_dict(self) -> Dict[str, float]:
+        """Cost breakdown keyed by component name, for serialization"""
+        return dict(zip(COMPONENTS, self.cost_breakdown.tolist()))
+        
+    def to_json_dict(self) -> Dict[str, Any]:
+        """Flat dict of the result's fields, for orjson serialization.
+        
+        The optimizations stay dataclasses, which orjson encodes natively.
+        """
+        return {
+            **dict(zip(RESULT_FIELDS, result_values(self))),
+            "cost_breakdown": self.breakdown_dict(),
+        }
+
+# Result field names in declaration order, with a getter for their values
+RESULT_FIELDS = tuple(f.name for f in fields(CostAnalysisResult))
+result_values = attrgetter(*RESULT_FIELDS)
+
+class ScenarioSpec(NamedTuple):
+    """Cost analysis scenario; the fields after the name are its cache key"""
+    name: str
+    volume: int
+    provider: str
+    optimized: bool = False
+
+class ScenarioCosts(NamedTuple):
+    """Cached costing of one (volume, provider, optimized) scenario"""
+    total_monthly_cost: float
+    cost_breakdown: np.ndarray  # Read-only, in COMPONENTS order
+    optimizations: Tuple[CostOptimization, ...]
 
 class CostOptimizer:
     """Comprehensive cost optimization analysis system"""
@@ -79,6 +328,7 @@ class CostOptimizer:
         self.output_dir.mkdir(exist_ok=True)
         self.target_cost_per_video = 0.10
         self.monthly_volume_target = 10_000_000
+        self.scenario_costs: Dict[Tuple[int, str, bool], ScenarioCosts] = {}
         self.setup_logging()
         self.initialize_cost_models()
         
@@ -88,7 +338,8 @@ class CostOptimizer:
             self.output_dir / "cost_optimization.log",
             rotation="100 MB",
             level="INFO",
-            format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}"
+            format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {message}",
+            enqueue=True  # Write and rotate from loguru's worker thread
         )
         
     def initialize_cost_models(self):
@@ -171,6 +422,11 @@ class CostOptimizer:
                 unit_cost=0.35,  # Per hour
                 unit_type="hour"
             ),
+            "queue_pubsub": CostModel(
+                component="Pub/Sub",
+                unit_cost=0.0000004,  # Per request - similar to SQS
+                unit_type="request"
+            ),
         }
         
         # Azure pricing
@@ -196,395 +452,283 @@ class CostOptimizer:
                 unit_cost=0.087,  # Per GB
                 unit_type="gb"
             ),
+            "database_postgresql": CostModel(
+                component="Azure Database for PostgreSQL",
+                unit_cost=0.38,  # Per hour
+                unit_type="hour"
+            ),
+            "queue_servicebus": CostModel(
+                component="Service Bus",
+                unit_cost=0.0000005,  # Per request
+                unit_type="request"
+            ),
+        }
+        
+        self.initialize_cost_tables()
+        
+    def initialize_cost_tables(self):
+        """Pack each provider's pricing rules into arrays indexed [provider, component]"""
+        aws = self.aws_cost_models
+        gcp = self.gcp_cost_models
+        azure = self.azure_cost_models
+        
+        # One (unit cost, fixed cost, optimized factor, volume discount tiers)
+        # rule per component, in COMPONENTS order. The optimized factor and the
+        # volume discount (the rate of the highest tier the usage exceeds) only
+        # apply to optimized scenarios.
+        pricing = {
+            "aws": [
+                (aws["compute_gpu"].unit_cost, 0.0, 1.0, {10000: aws["compute_gpu"].volume_discounts[10000]}),
+                (aws["compute_cpu"].unit_cost, 0.0, 0.8, NO_DISCOUNT),  # Spot instances
+                (aws["storage_s3"].unit_cost, 0.0, 0.7, NO_DISCOUNT),  # Better compression
+                (aws["storage_ebs"].unit_cost, 0.0, 0.6, NO_DISCOUNT),  # Better temp management
+                (aws["bandwidth_cloudfront"].unit_cost, 0.0, 1.0,
+                 {1000000: aws["bandwidth_cloudfront"].volume_discounts[1000000]}),
+                (aws["database_rds"].unit_cost, aws["database_rds"].fixed_cost, 1.0, NO_DISCOUNT),
+                (aws["queue_sqs"].unit_cost, 0.0, 1.0, NO_DISCOUNT),
+            ],
+            "gcp": [
+                (gcp["compute_gpu"].unit_cost, 0.0, 0.75, NO_DISCOUNT),  # Preemptible instances
+                (gcp["compute_cpu"].unit_cost, 0.0, 0.7, NO_DISCOUNT),  # Preemptible instances
+                (gcp["storage_gcs"].unit_cost, 0.0, 1.0, NO_DISCOUNT),
+                (gcp["storage_gcs"].unit_cost * 2, 0.0, 1.0, NO_DISCOUNT),  # Higher tier for temp
+                (gcp["bandwidth_cdn"].unit_cost, 0.0, 1.0, {1000000: gcp["bandwidth_cdn"].volume_discounts[1000000]}),
+                (gcp["database_cloudsql"].unit_cost, 0.0, 1.0, NO_DISCOUNT),
+                (gcp["queue_pubsub"].unit_cost, 0.0, 1.0, NO_DISCOUNT),
+            ],
+            "azure": [
+                (azure["compute_gpu"].unit_cost, 0.0, 0.8, NO_DISCOUNT),  # Spot instances
+                (azure["compute_cpu"].unit_cost, 0.0, 0.75, NO_DISCOUNT),  # Spot instances
+                (azure["storage_blob"].unit_cost, 0.0, 1.0, NO_DISCOUNT),
+                (azure["storage_blob"].unit_cost * 1.5, 0.0, 1.0, NO_DISCOUNT),
+                (azure["bandwidth_cdn"].unit_cost, 0.0, 1.0, NO_DISCOUNT),
+                (azure["database_postgresql"].unit_cost, 0.0, 1.0, NO_DISCOUNT),
+                (azure["queue_servicebus"].unit_cost, 0.0, 1.0, NO_DISCOUNT),
+            ],
+            # Best provider for each service
+            "multi": [
+                (gcp["compute_gpu"].unit_cost, 0.0, 0.7, NO_DISCOUNT),  # Preemptible + volume discounts
+                (gcp["compute_cpu"].unit_cost, 0.0, 0.65, NO_DISCOUNT),  # Best preemptible pricing
+                (aws["storage_s3"].unit_cost, 0.0, 0.6, NO_DISCOUNT),  # Intelligent tiering + compression
+                (aws["storage_s3"].unit_cost * 1.2, 0.0, 0.5, NO_DISCOUNT),  # Optimized temp storage
+                (gcp["bandwidth_cdn"].unit_cost, 0.0, 1.0, {1000000: 0.6}),  # Best volume pricing
+                (gcp["database_cloudsql"].unit_cost, 0.0, 1.0, NO_DISCOUNT),
+                (0.0000003, 0.0, 1.0, NO_DISCOUNT),  # Cheapest queue option
+            ],
         }
         
+        rules = [pricing[provider] for provider in PROVIDERS]
+        tables = np.array([[rule[:3] for rule in provider_rules] for provider_rules in rules], dtype=np.float64)
+        self.unit_costs, self.fixed_costs, self.optimized_factors = np.moveaxis(tables, 2, 0)
+        
+        # Tier tables padded to a common depth with thresholds nothing exceeds
+        depth = max(len(rule[3]) for provider_rules in rules for rule in provider_rules)
+        self.discount_thresholds = np.full(tables.shape[:2] + (depth,), np.inf)
+        self.discount_rates = np.ones(tables.shape[:2] + (depth + 1,))
+        for p, provider_rules in enumerate(rules):
+            for c, rule in enumerate(provider_rules):
+                thresholds, rates = discount_tiers(rule[3])
+                self.discount_thresholds[p, c, :len(thresholds)] = thresholds
+                self.discount_rates[p, c, :len(rates)] = rates
+        
     async def run_comprehensive_cost_analysis(self) -> Dict[str, CostAnalysisResult]:
         """Run comprehensive cost analysis across multiple scenarios"""
         console.print("[bold green]💰 Starting DailyDoco Pro Cost Optimization Analysis[/bold green]")
         console.print(f"[yellow]Target: ${self.target_cost_per_video:.3f} per video at {self.monthly_volume_target:,} videos/month[/yellow]")
         
         # Define analysis scenarios
-        scenarios = [
-            {"name": "current_architecture", "volume": self.monthly_volume_target, "provider": "aws"},
-            {"name": "optimized_aws", "volume": self.monthly_volume_target, "provider": "aws", "optimized": True},
-            {"name": "multi_cloud_optimized", "volume": self.monthly_volume_target, "provider": "multi", "optimized": True},
-            {"name": "scale_test_1m", "volume": 1_000_000, "provider": "aws"},
-            {"name": "scale_test_5m", "volume": 5_000_000, "provider": "aws"},
-            {"name": "scale_test_20m", "volume": 20_000_000, "provider": "aws"},
-        ]
+        scenarios = (
+            ScenarioSpec("current_architecture", self.monthly_volume_target, "aws"),
+            ScenarioSpec("optimized_aws", self.monthly_volume_target, "aws", optimized=True),
+            ScenarioSpec("multi_cloud_optimized", self.monthly_volume_target, "multi", optimized=True),
+            ScenarioSpec("scale_test_1m", 1_000_000, "aws"),
+            ScenarioSpec("scale_test_5m", 5_000_000, "aws"),
+            ScenarioSpec("scale_test_20m", 20_000_000, "aws"),
+        )
         
         results = {}
+        run_timestamp = datetime.now()  # Shared by every result of this run
+        
+        descriptions = [f"Analyzing {scenario.name}..." for scenario in scenarios]
         
+        # The analysis is one CPU-bound batch, so redraw explicitly before and
+        # after it rather than from Rich's background refresh thread
         with Progress(
             SpinnerColumn(),
             TextColumn("[progress.description]{task.description}"),
             BarColumn(),
-            console=console
+            console=console,
+            auto_refresh=False
         ) as progress:
             
-            for scenario in scenarios:
-                task = progress.add_task(f"Analyzing {scenario['name']}...", total=1)
+            tasks = [progress.add_task(description, total=1) for description in descriptions]
+            progress.refresh()
+            
+            try:
+                logger.info(f"Starting cost analysis of {len(scenarios)} scenarios")
+                analyses = self.analyze_scenarios(scenarios, run_timestamp)
+            except Exception as e:
+                logger.error(f"Cost analysis failed: {e}")
+                analyses = []
                 
-                try:
-                    logger.info(f"Starting cost analysis: {scenario['name']}")
-                    result = await self.analyze_scenario_cost(scenario)
-                    results[scenario['name']] = result
-                    
-                    status = "✅ MEETS TARGET" if result.meets_target else "❌ OVER TARGET"
-                    logger.info(f"Completed {scenario['name']}: ${result.cost_per_video:.3f}/video - {status}")
-                    progress.update(task, completed=1)
-                    
-                except Exception as e:
-                    logger.error(f"Cost analysis {scenario['name']} failed: {e}")
-                    progress.update(task, completed=1)
+            for scenario, task, result in zip(scenarios, tasks, analyses):
+                results[scenario.name] = result
+                
+                status = "✅ MEETS TARGET" if result.meets_target else "❌ OVER TARGET"
+                logger.info("Completed {}: ${:.3f}/video - {}", scenario.name, result.cost_per_video, status)
+                progress.update(task, completed=1)
+                
+            for task in tasks[len(analyses):]:
+                progress.update(task, completed=1)
+            progress.refresh()
                     
-        await self.generate_cost_report(results)
+        self.generate_cost_report(results)
         return results
         
-    async def analyze_scenario_cost(self, scenario: Dict[str, Any]) -> CostAnalysisResult:
+    def analyze_scenario_cost(self, scenario: ScenarioSpec, run_timestamp: Optional[datetime] = None) -> CostAnalysisResult:
         """Analyze cost for a specific scenario"""
-        scenario_name = scenario["name"]
-        monthly_volume = scenario["volume"]
-        provider = scenario["provider"]
-        optimized = scenario.get("optimized", False)
-        
-        logger.info(f"Analyzing cost scenario: {scenario_name}")
-        
-        # Calculate resource requirements
-        resource_requirements = await self.calculate_resource_requirements(monthly_volume)
-        
-        # Calculate costs based on provider
-        if provider == "aws":
-            cost_breakdown = await self.calculate_aws_costs(resource_requirements, optimized)
-        elif provider == "gcp":
-            cost_breakdown = await self.calculate_gcp_costs(resource_requirements, optimized)
-        elif provider == "azure":
-            cost_breakdown = await self.calculate_azure_costs(resource_requirements, optimized)
-        elif provider == "multi":
-            cost_breakdown = await self.calculate_multi_cloud_costs(resource_requirements, optimized)
-        else:
-            raise ValueError(f"Unknown provider: {provider}")
-            
-        # Calculate total costs
-        total_monthly_cost = sum(cost_breakdown.values())
-        cost_per_video = total_monthly_cost / monthly_volume if monthly_volume > 0 else 0
-        
-        # Generate optimization recommendations
-        optimizations = await self.generate_optimizations(cost_breakdown, resource_requirements, provider)
-        
-        # Calculate projected savings
-        projected_savings = sum(opt.savings for opt in optimizations)
-        optimized_cost_per_video = (total_monthly_cost - projected_savings) / monthly_volume if monthly_volume > 0 else 0
-        
-        # Check if meets target
-        meets_target = optimized_cost_per_video <= self.target_cost_per_video
-        
-        return CostAnalysisResult(
-            scenario_name=scenario_name,
-            monthly_volume=monthly_volume,
-            total_monthly_cost=total_monthly_cost,
-            cost_per_video=cost_per_video,
-            cost_breakdown=cost_breakdown,
-            optimizations=optimizations,
-            projected_savings=projected_savings,
-            optimized_cost_per_video=optimized_cost_per_video,
-            meets_target=meets_target,
-            timestamp=datetime.now()
-        )
-        
-    async def calculate_resource_requirements(self, monthly_volume: int) -> Dict[str, float]:
-        """Calculate infrastructure resource requirements"""
-        
-        # Video processing assumptions
-        avg_video_length_minutes = 15
-        processing_time_multiplier = 1.5  # Sub-2x realtime target
+        return self.analyze_scenarios([scenario], run_timestamp)[0]
         
-        # GPU requirements for video processing
-        gpu_hours_per_video = (avg_video_length_minutes / 60) * processing_time_multiplier
-        total_gpu_hours = monthly_volume * gpu_hours_per_video
+    def analyze_scenarios(self, scenarios: Sequence[ScenarioSpec], run_timestamp: Optional[datetime] = None) -> List[CostAnalysisResult]:
+        """Analyze cost for several scenarios, costing the uncached ones in one array pass.
         
-        # CPU requirements for general processing
-        cpu_hours_per_video = 0.1  # For metadata, API calls, etc.
-        total_cpu_hours = monthly_volume * cpu_hours_per_video
+        Every result is stamped with ``run_timestamp``, defaulting to now.
+        """
+        if run_timestamp is None:
+            run_timestamp = datetime.now()
+            
+        keys = [scenario[1:] for scenario in scenarios]
+        self.cost_scenarios(keys)
         
-        # Storage requirements
-        avg_raw_video_size_gb = 2.0  # 15 min at 1080p
-        avg_processed_video_size_gb = 0.5  # Compressed
-        temp_storage_gb = monthly_volume * avg_raw_video_size_gb * 1.5  # Temp space
-        permanent_storage_gb = monthly_volume * avg_processed_video_size_gb
+        results = []
+        for scenario, key in zip(scenarios, keys):
+            scenario_name = scenario.name
+            monthly_volume = scenario.volume
+            
+            logger.info("Analyzing cost scenario: {}", scenario_name)
+            
+            # Most recently used keys sit at the end of the cache
+            costs = self.scenario_costs[key] = self.scenario_costs.pop(key)
+            total_monthly_cost = costs.total_monthly_cost
+            cost_per_video = total_monthly_cost / monthly_volume if monthly_volume > 0 else 0
+            optimizations = list(costs.optimizations)
+            
+            # Calculate projected savings
+            projected_savings = sum(opt.savings for opt in optimizations)
+            optimized_cost_per_video = (total_monthly_cost - projected_savings) / monthly_volume if monthly_volume > 0 else 0
+            
+            # Check if meets target
+            meets_target = optimized_cost_per_video <= self.target_cost_per_video
+            
+            results.append(CostAnalysisResult(
+                scenario_name=scenario_name,
+                monthly_volume=monthly_volume,
+                total_monthly_cost=total_monthly_cost,
+                cost_per_video=cost_per_video,
+                cost_breakdown=costs.cost_breakdown,
+                optimizations=optimizations,
+                projected_savings=projected_savings,
+                optimized_cost_per_video=optimized_cost_per_video,
+                meets_target=meets_target,
+                timestamp=run_timestamp
+            ))
+            
+        # Evict least recently used analyses
+        while len(self.scenario_costs) > ANALYSIS_CACHE_SIZE:
+            del self.scenario_costs[next(iter(self.scenario_costs))]
+            
+        return results
         
-        # Bandwidth requirements
-        upload_bandwidth_gb = monthly_volume * avg_processed_video_size_gb
-        cdn_bandwidth_gb = upload_bandwidth_gb * 3  # 3x for global distribution
+    def cost_scenarios(self, keys: List[Tuple[int, str, bool]]):
+        """Cost the (volume, provider, optimized) scenarios missing from the cache"""
+        missing = [key for key in dict.fromkeys(keys) if key not in self.scenario_costs]
+        if not missing:
+            return
+            
+        volumes, providers, optimized = zip(*missing)
+        requirements = self.requirements_matrix(volumes)
+        costs = self.cost_matrix(requirements, providers, optimized)
+        costs.setflags(write=False)  # Rows are shared by every result of a scenario
+        totals = costs.sum(axis=1)
+        
+        for key, scenario_requirements, scenario_costs, total_monthly_cost in zip(
+            missing, requirements, costs, totals.tolist()
+        ):
+            # Generate optimization recommendations
+            optimizations = self.generate_optimizations(scenario_costs, scenario_requirements, key[1])
+            self.scenario_costs[key] = ScenarioCosts(
+                total_monthly_cost, scenario_costs, tuple(optimizations)
+            )
+            
+    def requirements_matrix(self, monthly_volumes: List[int]) -> np.ndarray:
+        """Resource requirements per monthly volume, one REQUIREMENT_KEYS row each"""
+        volumes = np.asarray(monthly_volumes, dtype=np.float64)
+        return volumes[:, None] * REQUIREMENTS_PER_VIDEO + FIXED_REQUIREMENTS
+        
+    def cost_matrix(self, requirements: np.ndarray, providers: List[str], optimized: List[bool]) -> np.ndarray:
+        """Monthly cost per scenario, one COMPONENTS row per requirements row"""
+        try:
+            rows = np.array([PROVIDER_INDEX[provider] for provider in providers], dtype=np.intp)
+        except KeyError as e:
+            raise ValueError(f"Unknown provider: {e.args[0]}") from None
+            
+        usage = requirements[:, COMPONENT_USAGE]
+        # Row-wise searchsorted: the count of thresholds each usage exceeds
+        tiers = (usage[:, :, None] > self.discount_thresholds[rows]).sum(axis=2)
+        discounts = np.take_along_axis(self.discount_rates[rows], tiers[:, :, None], axis=2)[:, :, 0]
+        factors = discounts * self.optimized_factors[rows]
+        factors = np.where(np.asarray(optimized, dtype=bool)[:, None], factors, 1.0)
         
-        # Database requirements
-        database_hours = 24 * 30  # Always on
+        return usage * self.unit_costs[rows] * factors + self.fixed_costs[rows]
         
-        # Queue operations
-        queue_operations = monthly_volume * 10  # 10 operations per video
+    def calculate_resource_requirements(self, monthly_volume: int) -> np.ndarray:
+        """Calculate infrastructure resource requirements, in REQUIREMENT_KEYS order"""
+        return self.requirements_matrix([monthly_volume])[0]
         
-        return {
-            "gpu_hours": total_gpu_hours,
-            "cpu_hours": total_cpu_hours,
-            "temp_storage_gb": temp_storage_gb,
-            "permanent_storage_gb": permanent_storage_gb,
-            "upload_bandwidth_gb": upload_bandwidth_gb,
-            "cdn_bandwidth_gb": cdn_bandwidth_gb,
-            "database_hours": database_hours,
-            "queue_operations": queue_operations,
-        }
+    def calculate_provider_costs(self, provider: str, requirements: np.ndarray, optimized: bool = False) -> np.ndarray:
+        """Calculate one provider's infrastructure costs, in COMPONENTS order"""
+        return self.cost_matrix(requirements[None, :], [provider], [optimized])[0]
         
-    async def calculate_aws_costs(self, requirements: Dict[str, float], optimized: bool = False) -> Dict[str, float]:
+    def calculate_aws_costs(self, requirements: np.ndarray, optimized: bool = False) -> np.ndarray:
         """Calculate AWS infrastructure costs"""
-        costs = {}
-        
-        # GPU compute costs
-        gpu_model = self.aws_cost_models["compute_gpu"]
-        gpu_cost = requirements["gpu_hours"] * gpu_model.unit_cost
-        if optimized and requirements["gpu_hours"] > 10000:
-            gpu_cost *= gpu_model.volume_discounts.get(10000, 0.9)
-        costs["gpu_compute"] = gpu_cost
-        
-        # CPU compute costs
-        cpu_model = self.aws_cost_models["compute_cpu"]
-        cpu_cost = requirements["cpu_hours"] * cpu_model.unit_cost
-        if optimized:
-            cpu_cost *= 0.8  # Spot instances
-        costs["cpu_compute"] = cpu_cost
-        
-        # Storage costs
-        s3_model = self.aws_cost_models["storage_s3"]
-        ebs_model = self.aws_cost_models["storage_ebs"]
-        
-        costs["permanent_storage"] = requirements["permanent_storage_gb"] * s3_model.unit_cost
-        costs["temp_storage"] = requirements["temp_storage_gb"] * ebs_model.unit_cost
-        
-        if optimized:
-            # Intelligent tiering and compression
-            costs["permanent_storage"] *= 0.7  # Better compression
-            costs["temp_storage"] *= 0.6  # Better temp management
-            
-        # Bandwidth costs
-        cdn_model = self.aws_cost_models["bandwidth_cloudfront"]
-        cdn_cost = requirements["cdn_bandwidth_gb"] * cdn_model.unit_cost
-        if optimized and requirements["cdn_bandwidth_gb"] > 1000000:
-            cdn_cost *= cdn_model.volume_discounts.get(1000000, 0.8)
-        costs["bandwidth"] = cdn_cost
-        
-        # Database costs
-        db_model = self.aws_cost_models["database_rds"]
-        costs["database"] = requirements["database_hours"] * db_model.unit_cost + db_model.fixed_cost
-        
-        # Queue costs
-        queue_model = self.aws_cost_models["queue_sqs"]
-        costs["queue"] = requirements["queue_operations"] * queue_model.unit_cost
+        return self.calculate_provider_costs("aws", requirements, optimized)
         
-        return costs
-        
-    async def calculate_gcp_costs(self, requirements: Dict[str, float], optimized: bool = False) -> Dict[str, float]:
+    def calculate_gcp_costs(self, requirements: np.ndarray, optimized: bool = False) -> np.ndarray:
         """Calculate GCP infrastructure costs"""
-        costs = {}
-        
-        # GPU compute costs (typically lower than AWS)
-        gpu_model = self.gcp_cost_models["compute_gpu"]
-        gpu_cost = requirements["gpu_hours"] * gpu_model.unit_cost
-        if optimized:
-            gpu_cost *= 0.75  # Preemptible instances
-        costs["gpu_compute"] = gpu_cost
-        
-        # CPU compute costs
-        cpu_model = self.gcp_cost_models["compute_cpu"]
-        cpu_cost = requirements["cpu_hours"] * cpu_model.unit_cost
-        if optimized:
-            cpu_cost *= 0.7  # Preemptible instances
-        costs["cpu_compute"] = cpu_cost
-        
-        # Storage costs
-        storage_model = self.gcp_cost_models["storage_gcs"]
-        costs["permanent_storage"] = requirements["permanent_storage_gb"] * storage_model.unit_cost
-        costs["temp_storage"] = requirements["temp_storage_gb"] * storage_model.unit_cost * 2  # Higher tier for temp
-        
-        # Bandwidth costs
-        cdn_model = self.gcp_cost_models["bandwidth_cdn"]
-        cdn_cost = requirements["cdn_bandwidth_gb"] * cdn_model.unit_cost
-        if optimized and requirements["cdn_bandwidth_gb"] > 1000000:
-            cdn_cost *= cdn_model.volume_discounts.get(1000000, 0.75)
-        costs["bandwidth"] = cdn_cost
-        
-        # Database costs
-        db_model = self.gcp_cost_models["database_cloudsql"]
-        costs["database"] = requirements["database_hours"] * db_model.unit_cost
-        
-        # Queue costs (using Pub/Sub)
-        costs["queue"] = requirements["queue_operations"] * 0.0000004  # Similar to SQS
-        
-        return costs
-        
-    async def calculate_azure_costs(self, requirements: Dict[str, float], optimized: bool = False) -> Dict[str, float]:
-        """Calculate Azure infrastructure costs"""
-        costs = {}
-        
-        # GPU compute costs
-        gpu_model = self.azure_cost_models["compute_gpu"]
-        gpu_cost = requirements["gpu_hours"] * gpu_model.unit_cost
-        if optimized:
-            gpu_cost *= 0.8  # Spot instances
-        costs["gpu_compute"] = gpu_cost
-        
-        # CPU compute costs
-        cpu_model = self.azure_cost_models["compute_cpu"]
-        cpu_cost = requirements["cpu_hours"] * cpu_model.unit_cost
-        if optimized:
-            cpu_cost *= 0.75  # Spot instances
-        costs["cpu_compute"] = cpu_cost
-        
-        # Storage costs
-        storage_model = self.azure_cost_models["storage_blob"]
-        costs["permanent_storage"] = requirements["permanent_storage_gb"] * storage_model.unit_cost
-        costs["temp_storage"] = requirements["temp_storage_gb"] * storage_model.unit_cost * 1.5
-        
-        # Bandwidth costs
-        cdn_model = self.azure_cost_models["bandwidth_cdn"]
-        costs["bandwidth"] = requirements["cdn_bandwidth_gb"] * cdn_model.unit_cost
-        
-        # Database costs
-        costs["database"] = requirements["database_hours"] * 0.38  # Azure Database for PostgreSQL
-        
-        # Queue costs
-        costs["queue"] = requirements["queue_operations"] * 0.0000005  # Service Bus
-        
-        return costs
-        
-    async def calculate_multi_cloud_costs(self, requirements: Dict[str, float], optimized: bool = False) -> Dict[str, float]:
-        """Calculate multi-cloud optimized costs"""
-        
-        # Optimize by using best provider for each service
-        costs = {}
-        
-        # Use GCP for GPU compute (typically cheapest)
-        gcp_gpu_model = self.gcp_cost_models["compute_gpu"]
-        gpu_cost = requirements["gpu_hours"] * gcp_gpu_model.unit_cost
-        if optimized:
-            gpu_cost *= 0.7  # Preemptible + volume discounts
-        costs["gpu_compute"] = gpu_cost
-        
-        # Use GCP for CPU compute
-        gcp_cpu_model = self.gcp_cost_models["compute_cpu"]
-        cpu_cost = requirements["cpu_hours"] * gcp_cpu_model.unit_cost
-        if optimized:
-            cpu_cost *= 0.65  # Best preemptible pricing
-        costs["cpu_compute"] = cpu_cost
-        
-        # Use AWS S3 for storage (best ecosystem)
-        aws_storage_model = self.aws_cost_models["storage_s3"]
-        costs["permanent_storage"] = requirements["permanent_storage_gb"] * aws_storage_model.unit_cost
-        costs["temp_storage"] = requirements["temp_storage_gb"] * aws_storage_model.unit_cost * 1.2
-        
-        if optimized:
-            costs["permanent_storage"] *= 0.6  # Intelligent tiering + compression
-            costs["temp_storage"] *= 0.5  # Optimized temp storage
-            
-        # Use best CDN pricing (GCP at volume)
-        gcp_cdn_model = self.gcp_cost_models["bandwidth_cdn"]
-        cdn_cost = requirements["cdn_bandwidth_gb"] * gcp_cdn_model.unit_cost
-        if optimized and requirements["cdn_bandwidth_gb"] > 1000000:
-            cdn_cost *= 0.6  # Best volume pricing
-        costs["bandwidth"] = cdn_cost
+        return self.calculate_provider_costs("gcp", requirements, optimized)
         
-        # Use GCP for database
-        gcp_db_model = self.gcp_cost_models["database_cloudsql"]
-        costs["database"] = requirements["database_hours"] * gcp_db_model.unit_cost
-        
-        # Use cheapest queue option
-        costs["queue"] = requirements["queue_operations"] * 0.0000003  # Optimized pricing
+    def calculate_azure_costs(self, requirements: np.ndarray, optimized: bool = False) -> np.ndarray:
+        """Calculate Azure infrastructure costs"""
+        return self.calculate_provider_costs("azure", requirements, optimized)
         
-        return costs
+    def calculate_multi_cloud_costs(self, requirements: np.ndarray, optimized: bool = False) -> np.ndarray:
+        """Calculate multi-cloud optimized costs, using the best provider for each service"""
+        return self.calculate_provider_costs("multi", requirements, optimized)
         
-    async def generate_optimizations(self, cost_breakdown: Dict[str, float], requirements: Dict[str, float], provider: str) -> List[CostOptimization]:
+    def generate_optimizations(self, cost_breakdown: np.ndarray, requirements: np.ndarray, provider: str) -> List[CostOptimization]:
         """Generate cost optimization recommendations"""
-        optimizations = []
-        
-        # GPU optimization
-        if cost_breakdown.get("gpu_compute", 0) > 100000:  # If GPU costs are high
-            gpu_savings = cost_breakdown["gpu_compute"] * 0.25  # 25% savings possible
-            optimizations.append(CostOptimization(
-                component="GPU Compute",
-                current_cost=cost_breakdown["gpu_compute"],
-                optimized_cost=cost_breakdown["gpu_compute"] - gpu_savings,
-                savings=gpu_savings,
-                savings_percent=25.0,
-                optimization_strategy="Use preemptible/spot instances, optimize GPU utilization to 80%+, implement intelligent batching",
-                implementation_effort="medium",
-                risk_level="low",
-                timeline="weeks"
-            ))
-            
-        # Storage optimization
-        storage_cost = cost_breakdown.get("permanent_storage", 0) + cost_breakdown.get("temp_storage", 0)
-        if storage_cost > 50000:
-            storage_savings = storage_cost * 0.35  # 35% savings possible
-            optimizations.append(CostOptimization(
-                component="Storage",
-                current_cost=storage_cost,
-                optimized_cost=storage_cost - storage_savings,
-                savings=storage_savings,
-                savings_percent=35.0,
-                optimization_strategy="Implement intelligent compression, lifecycle policies, deduplication, and cold storage tiers",
-                implementation_effort="medium",
-                risk_level="low",
-                timeline="weeks"
-            ))
-            
-        # Bandwidth optimization
-        if cost_breakdown.get("bandwidth", 0) > 30000:
-            bandwidth_savings = cost_breakdown["bandwidth"] * 0.30  # 30% savings possible
-            optimizations.append(CostOptimization(
-                component="Bandwidth",
-                current_cost=cost_breakdown["bandwidth"],
-                optimized_cost=cost_breakdown["bandwidth"] - bandwidth_savings,
-                savings=bandwidth_savings,
-                savings_percent=30.0,
-                optimization_strategy="Optimize CDN caching, implement video compression, use regional CDN optimization",
-                implementation_effort="medium",
-                risk_level="low",
-                timeline="weeks"
-            ))
-            
-        # Multi-cloud optimization
-        if provider != "multi":
-            total_current = sum(cost_breakdown.values())
-            multi_cloud_savings = total_current * 0.20  # 20% savings from multi-cloud
-            optimizations.append(CostOptimization(
-                component="Multi-Cloud Strategy",
-                current_cost=total_current,
-                optimized_cost=total_current - multi_cloud_savings,
-                savings=multi_cloud_savings,
-                savings_percent=20.0,
-                optimization_strategy="Implement multi-cloud architecture using best provider for each service",
-                implementation_effort="high",
-                risk_level="medium",
-                timeline="months"
-            ))
-            
-        # Reserved instances optimization
-        compute_cost = cost_breakdown.get("gpu_compute", 0) + cost_breakdown.get("cpu_compute", 0)
-        if compute_cost > 75000:
-            reserved_savings = compute_cost * 0.40  # 40% savings with reserved instances
-            optimizations.append(CostOptimization(
-                component="Reserved Instances",
-                current_cost=compute_cost,
-                optimized_cost=compute_cost - reserved_savings,
-                savings=reserved_savings,
-                savings_percent=40.0,
-                optimization_strategy="Purchase 1-3 year reserved instances for baseline compute capacity",
-                implementation_effort="low",
-                risk_level="low",
-                timeline="immediate"
-            ))
-            
-        return optimizations
+        current_costs = (cost_breakdown * OPT_RULE_COMPONENTS).sum(axis=1)
+        applies = (current_costs > OPT_RULE_THRESHOLDS) & OPT_RULES_APPLY_TO[provider]
+        savings = current_costs * OPT_RULE_RATES
+        
+        current_costs = current_costs.tolist()
+        savings = savings.tolist()
+        return [
+            CostOptimization(
+                component=OPT_RULES[i][0],
+                current_cost=current_costs[i],
+                optimized_cost=current_costs[i] - savings[i],
+                savings=savings[i],
+                savings_percent=OPT_RULES[i][3],
+                optimization_strategy=OPT_RULES[i][4],
+                implementation_effort=OPT_RULES[i][5],
+                risk_level=OPT_RULES[i][6],
+                timeline=OPT_RULES[i][7]
+            )
+            for i in np.flatnonzero(applies).tolist()
+        ]
         
-    async def generate_cost_report(self, results: Dict[str, CostAnalysisResult]) -> None:
+    def generate_cost_report(self, results: Dict[str, CostAnalysisResult]) -> None:
         """Generate comprehensive cost analysis report"""
         logger.info("Generating cost analysis report")
         
@@ -597,7 +741,13 @@ class CostOptimizer:
         table.add_column("Savings", style="blue")
         table.add_column("Target", style="bold")
         
-        for scenario_name, result in results.items():
+        # Min-heap of the five largest (savings, -position, optimization)
+        # entries, filled in the same pass over the results as the table; the
+        # negated position keeps earlier optimizations ahead on equal savings
+        top_entries = []
+        position = 0
+        
+        for result in results.values():
             volume = f"{result.monthly_volume:,}"
             total_cost = f"${result.total_monthly_cost:,.0f}"
             cost_per_video = f"${result.cost_per_video:.3f}"
@@ -605,7 +755,7 @@ class CostOptimizer:
             target_status = "✅ MEETS" if result.meets_target else "❌ OVER"
             
             table.add_row(
-                scenario_name.replace("_", " ").title(),
+                result.scenario_name.replace("_", " ").title(),
                 volume,
                 total_cost,
                 cost_per_video,
@@ -613,48 +763,168 @@ class CostOptimizer:
                 target_status
             )
             
+            for opt in result.optimizations:
+                position -= 1
+                entry = (opt.savings, position, opt)
+                if len(top_entries) < 5:
+                    heapq.heappush(top_entries, entry)
+                else:
+                    heapq.heappushpop(top_entries, entry)
+                    
         console.print(table)
         
-        # Generate cost breakdown charts
-        await self.generate_cost_visualizations(results)
+        # Rasterizing the charts dominates the report, so both render in
+        # worker processes while the summary and data files are written
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            # Generate cost breakdown charts
+            logger.info("Generating cost visualizations")
+            charts = [executor.submit(
+                render_cost_charts,
+                results,
+                self.target_cost_per_video,
+                self.output_dir / "cost_analysis_charts.png"
+            )]
+            
+            # Generate optimization summary
+            console.print("\n[bold blue]💡 Top Optimization Opportunities:[/bold blue]")
+            
+            # Largest savings first
+            top_optimizations = [opt for _, _, opt in sorted(top_entries, reverse=True)]
+            
+            for i, opt in enumerate(top_optimizations, 1):
+                console.print(f"{i}. [yellow]{opt.component}[/yellow]: ${opt.savings:,.0f} savings ({opt.savings_percent:.1f}%)")
+                console.print(f"   Strategy: {opt.optimization_strategy}")
+                console.print(f"   Effort: {opt.implementation_effort}, Risk: {opt.risk_level}, Timeline: {opt.timeline}\n")
+                
+            # Save detailed results
+            self.save_detailed_results(results)
+            
+            # Generate cost projections
+            projections = self.generate_cost_projections(results)
+            charts.append(executor.submit(
+                render_projection_chart,
+                projections,
+                self.output_dir / "cost_projections.png"
+            ))
+            
+            for chart in charts:
+                chart.result()
+                
+        console.print(f"[green]📊 Full cost analysis saved to: {self.output_dir}[/green]")
         
-        # Generate optimization summary
-        console.print("\n[bold blue]💡 Top Optimization Opportunities:[/bold blue]")
+    def save_detailed_results(self, results: Dict[str, CostAnalysisResult]) -> None:
+        """Save detailed cost analysis results"""
         
-        all_optimizations = []
-        for result in results.values():
-            all_optimizations.extend(result.optimizations)
+        # The files are independent, so they are written concurrently; the
+        # Arrow writers and file writes release the GIL
+        with ThreadPoolExecutor(max_workers=3) as writer:
+            writes = []
             
-        # Sort by savings amount
-        top_optimizations = sorted(all_optimizations, key=lambda x: x.savings, reverse=True)[:5]
-        
-        for i, opt in enumerate(top_optimizations, 1):
-            console.print(f"{i}. [yellow]{opt.component}[/yellow]: ${opt.savings:,.0f} savings ({opt.savings_percent:.1f}%)")
-            console.print(f"   Strategy: {opt.optimization_strategy}")
-            console.print(f"   Effort: {opt.implementation_effort}, Risk: {opt.risk_level}, Timeline: {opt.timeline}\n")
+            # Save JSON results; timestamps pass through to str() as before
+            writes.append(writer.submit(
+                (self.output_dir / "cost_analysis_results.json").write_bytes,
+                orjson.dumps(
+                    {name: result.to_json_dict() for name, result in results.items()},
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_PASSTHROUGH_DATETIME
+                )
+            ))
             
-        # Save detailed results
-        await self.save_detailed_results(results)
-        
-        # Generate cost projections
-        await self.generate_cost_projections(results)
+            # Save CSV summary, with the cost breakdown flattened into columns,
+            # and a Feather copy for the dashboard and downstream analytics
+            summary = records_table(
+                [(*summary_row(result), *result.cost_breakdown.tolist()) for result in results.values()],
+                SUMMARY_SCHEMA
+            )
+            writes.append(writer.submit(
+                pyarrow.csv.write_csv, summary, self.output_dir / "cost_analysis_summary.csv"
+            ))
+            writes.append(writer.submit(
+                pyarrow.feather.write_feather,
+                summary,
+                self.output_dir / "cost_analysis_summary.feather",
+                compression="zstd"
+            ))
+            
+            # Save optimization recommendations
+            opt_records = [
+                (name, *optimization_row(opt))
+                for name, result in results.items()
+                for opt in result.optimizations
+            ]
+            
+            if opt_records:
+                recommendations = records_table(opt_records, OPTIMIZATION_SCHEMA)
+                writes.append(writer.submit(
+                    pyarrow.csv.write_csv, recommendations, self.output_dir / "optimization_recommendations.csv"
+                ))
+                writes.append(writer.submit(
+                    pyarrow.feather.write_feather,
+                    recommendations,
+                    self.output_dir / "optimization_recommendations.feather",
+                    compression="zstd"
+                ))
+                
+            # Surface any write error
+            for write in writes:
+                write.result()
+                
+    def generate_cost_projections(self, results: Dict[str, CostAnalysisResult]) -> Dict[str, Dict[str, List[float]]]:
+        """Generate and save future cost projections"""
+        logger.info("Generating cost projections")
         
-        console.print(f"[green]📊 Full cost analysis saved to: {self.output_dir}[/green]")
+        # Project costs for next 24 months
+        months = np.arange(1, 25)
+        volume_growth_rate = 0.15  # 15% monthly growth
         
-    async def generate_cost_visualizations(self, results: Dict[str, CostAnalysisResult]) -> None:
-        """Generate cost visualization charts"""
-        logger.info("Generating cost visualizations")
+        projections = {}
         
-        # Set up plotting
-        plt.style.use('seaborn-v0_8')
-        fig, axes = plt.subplots(2, 2, figsize=(16, 12))
+        # Only project main scenarios, all of them in one array pass
+        projected = [(name, result) for name, result in results.items() if "scale_test" not in name]
+        if projected:
+            names, projected_results = zip(*projected)
+            
+            # Calculate volume growth, one row of months per scenario
+            base_volumes = np.array([result.monthly_volume for result in projected_results], dtype=np.float64)
+            volumes = base_volumes[:, None] * (1 + volume_growth_rate) ** (months - 1)
+            
+            # Calculate cost with volume discounts
+            costs_per_video = np.array([
+                result.optimized_cost_per_video if result.optimizations else result.cost_per_video
+                for result in projected_results
+            ])
+            
+            # Apply volume discounts: 20% at 50M+ videos, 10% at 20M+ videos
+            discounts = np.select([volumes > 50_000_000, volumes > 20_000_000], [0.8, 0.9], default=1.0)
+            costs = volumes * (costs_per_video[:, None] * discounts)
+            
+            month_numbers = months.tolist()
+            for scenario_name, monthly_volumes, monthly_costs in zip(names, volumes.tolist(), costs.tolist()):
+                projections[scenario_name] = {
+                    "months": month_numbers,
+                    "volumes": monthly_volumes,
+                    "costs": monthly_costs
+                }
+                
+        # Save projections
+        (self.output_dir / "cost_projections.json").write_bytes(
+            orjson.dumps(projections, option=orjson.OPT_INDENT_2)
+        )
+            
+        return projections
+
+def render_cost_charts(results: Dict[str, CostAnalysisResult], target_cost_per_video: float, path: Path) -> None:
+    """Render the cost visualization charts to a PNG file"""
+    with matplotlib.style.context(CHART_STYLE):
+        fig = Figure(figsize=(16, 12), layout="tight")
+        axes = fig.subplots(2, 2)
         
         # Cost per video comparison
         scenarios = list(results.keys())
         costs_per_video = [results[s].cost_per_video for s in scenarios]
         
         axes[0, 0].bar(scenarios, costs_per_video)
-        axes[0, 0].axhline(y=self.target_cost_per_video, color='r', linestyle='--', label=f'Target (${self.target_cost_per_video:.3f})')
+        axes[0, 0].axhline(y=target_cost_per_video, color='r', linestyle='--', label=f'Target (${target_cost_per_video:.3f})')
         axes[0, 0].set_title('Cost Per Video by Scenario')
         axes[0, 0].set_ylabel('Cost ($)')
         axes[0, 0].tick_params(axis='x', rotation=45)
@@ -663,10 +933,9 @@ class CostOptimizer:
         # Cost breakdown for main scenario
         main_scenario = "current_architecture"
         if main_scenario in results:
-            breakdown = results[main_scenario].cost_breakdown
-            axes[0, 1].pie(breakdown.values(), labels=breakdown.keys(), autopct='%1.1f%%')
+            axes[0, 1].pie(results[main_scenario].cost_breakdown, labels=COMPONENTS, autopct='%1.1f%%')
             axes[0, 1].set_title('Cost Breakdown - Current Architecture')
-            
+        
         # Savings potential
         scenario_names = []
         savings_amounts = []
@@ -674,136 +943,45 @@ class CostOptimizer:
             if result.projected_savings > 0:
                 scenario_names.append(name)
                 savings_amounts.append(result.projected_savings)
-                
+        
         if savings_amounts:
             axes[1, 0].bar(scenario_names, savings_amounts)
             axes[1, 0].set_title('Projected Monthly Savings')
             axes[1, 0].set_ylabel('Savings ($)')
             axes[1, 0].tick_params(axis='x', rotation=45)
-            
+        
         # Volume vs cost scaling
         scale_scenarios = [s for s in scenarios if "scale_test" in s]
         if scale_scenarios:
             volumes = [results[s].monthly_volume for s in scale_scenarios]
             costs = [results[s].cost_per_video for s in scale_scenarios]
-            
+        
             axes[1, 1].plot(volumes, costs, 'bo-')
-            axes[1, 1].axhline(y=self.target_cost_per_video, color='r', linestyle='--', label='Target')
+            axes[1, 1].axhline(y=target_cost_per_video, color='r', linestyle='--', label='Target')
             axes[1, 1].set_title('Cost Scaling with Volume')
             axes[1, 1].set_xlabel('Monthly Volume')
             axes[1, 1].set_ylabel('Cost Per Video ($)')
             axes[1, 1].legend()
-            
-        plt.tight_layout()
-        plt.savefig(self.output_dir / "cost_analysis_charts.png", dpi=300, bbox_inches='tight')
-        plt.close()
-        
-    async def save_detailed_results(self, results: Dict[str, CostAnalysisResult]) -> None:
-        """Save detailed cost analysis results"""
-        
-        # Save JSON results
-        with open(self.output_dir / "cost_analysis_results.json", "w") as f:
-            json.dump(
-                {name: asdict(result) for name, result in results.items()},
-                f,
-                indent=2,
-                default=str
-            )
-            
-        # Save CSV summary
-        summary_data = []
-        for name, result in results.items():
-            summary_data.append({
-                "scenario": name,
-                "monthly_volume": result.monthly_volume,
-                "total_monthly_cost": result.total_monthly_cost,
-                "cost_per_video": result.cost_per_video,
-                "projected_savings": result.projected_savings,
-                "optimized_cost_per_video": result.optimized_cost_per_video,
-                "meets_target": result.meets_target
-            })
-            
-        df_summary = pd.DataFrame(summary_data)
-        df_summary.to_csv(self.output_dir / "cost_analysis_summary.csv", index=False)
         
-        # Save optimization recommendations
-        opt_data = []
-        for name, result in results.items():
-            for opt in result.optimizations:
-                opt_data.append({
-                    "scenario": name,
-                    "component": opt.component,
-                    "current_cost": opt.current_cost,
-                    "savings": opt.savings,
-                    "savings_percent": opt.savings_percent,
-                    "strategy": opt.optimization_strategy,
-                    "effort": opt.implementation_effort,
-                    "risk": opt.risk_level,
-                    "timeline": opt.timeline
-                })
-                
-        if opt_data:
-            df_opt = pd.DataFrame(opt_data)
-            df_opt.to_csv(self.output_dir / "optimization_recommendations.csv", index=False)
-            
-    async def generate_cost_projections(self, results: Dict[str, CostAnalysisResult]) -> None:
-        """Generate future cost projections"""
-        logger.info("Generating cost projections")
-        
-        # Project costs for next 24 months
-        months = range(1, 25)
-        volume_growth_rate = 0.15  # 15% monthly growth
-        
-        projections = {}
-        
-        for scenario_name, result in results.items():
-            if "scale_test" not in scenario_name:  # Only project main scenarios
-                monthly_costs = []
-                monthly_volumes = []
-                
-                for month in months:
-                    # Calculate volume growth
-                    projected_volume = result.monthly_volume * (1 + volume_growth_rate) ** (month - 1)
-                    monthly_volumes.append(projected_volume)
-                    
-                    # Calculate cost with volume discounts
-                    cost_per_video = result.optimized_cost_per_video if result.optimizations else result.cost_per_video
-                    
-                    # Apply volume discounts
-                    if projected_volume > 50_000_000:
-                        cost_per_video *= 0.8  # 20% discount at 50M+ videos
-                    elif projected_volume > 20_000_000:
-                        cost_per_video *= 0.9  # 10% discount at 20M+ videos
-                        
-                    monthly_cost = projected_volume * cost_per_video
-                    monthly_costs.append(monthly_cost)
-                    
-                projections[scenario_name] = {
-                    "months": list(months),
-                    "volumes": monthly_volumes,
-                    "costs": monthly_costs
-                }
-                
-        # Save projections
-        with open(self.output_dir / "cost_projections.json", "w") as f:
-            json.dump(projections, f, indent=2)
-            
-        # Create projection visualization
-        plt.figure(figsize=(12, 8))
+        fig.savefig(path, dpi=CHART_DPI, bbox_inches='tight', pil_kwargs=CHART_PIL_KWARGS)
+
+def render_projection_chart(projections: Dict[str, Dict[str, List[float]]], path: Path) -> None:
+    """Render the cost projection chart to a PNG file"""
+    with matplotlib.style.context(CHART_STYLE):
+        fig = Figure(figsize=(12, 8), layout="tight")
+        ax = fig.subplots()
         
         for scenario_name, projection in projections.items():
-            plt.plot(projection["months"], projection["costs"], label=scenario_name, linewidth=2)
-            
-        plt.title("24-Month Cost Projections")
-        plt.xlabel("Month")
-        plt.ylabel("Monthly Cost ($)")
-        plt.legend()
-        plt.grid(True, alpha=0.3)
-        plt.ticklabel_format(style='plain', axis='y')
+            ax.plot(projection["months"], projection["costs"], label=scenario_name, linewidth=2)
+        
+        ax.set_title("24-Month Cost Projections")
+        ax.set_xlabel("Month")
+        ax.set_ylabel("Monthly Cost ($)")
+        ax.legend()
+        ax.grid(True, alpha=0.3)
+        ax.ticklabel_format(style='plain', axis='y')
         
-        plt.tight_layout()
-        plt.savefig(self.output_dir / "cost_projections.png", dpi=300, bbox_inches='tight')
-        plt.close()
+        fig.savefig(path, dpi=CHART_DPI, bbox_inches='tight', pil_kwargs=CHART_PIL_KWARGS)
 
 async def main():
     """Main entry point for cost optimization analysis"""
@@ -815,17 +993,21 @@ async def main():
         # Print summary
         console.print("\n[bold green]💰 Cost Optimization Analysis Complete![/bold green]")
         
-        # Find best scenario
-        best_scenario = min(results.items(), key=lambda x: x[1].optimized_cost_per_video)
-        best_name, best_result = best_scenario
-        
+        # Find best scenario and total potential savings in one pass
+        best_name, best_result = None, None
+        best_cost_per_video = math.inf
+        total_savings = 0.0
+        for name, result in results.items():
+            total_savings += result.projected_savings
+            if result.optimized_cost_per_video < best_cost_per_video:
+                best_cost_per_video = result.optimized_cost_per_video
+                best_name, best_result = name, result
+                
         console.print(f"\n[bold blue]🏆 Best Cost Scenario: {best_name.replace('_', ' ').title()}[/bold blue]")
         console.print(f"Cost per video: ${best_result.optimized_cost_per_video:.3f}")
         console.print(f"Monthly cost at 10M videos: ${best_result.optimized_cost_per_video * 10_000_000:,.0f}")
         console.print(f"Target met: {'✅ YES' if best_result.meets_target else '❌ NO'}")
         
-        # Calculate total potential savings
-        total_savings = sum(result.projected_savings for result in results.values())
         console.print(f"\n[yellow]💡 Total Optimization Potential: ${total_savings:,.0f}/month[/yellow]")
         
         # ROI analysis
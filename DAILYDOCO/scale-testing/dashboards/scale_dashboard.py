@@ -12,13 +12,14 @@ Real-time monitoring dashboard for scale testing results:
 """
 
 import asyncio
-import json
+from collections import deque
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Tuple, Any
 import threading
 
 import streamlit as st
+import orjson
 import pandas as pd
 import numpy as np
 import plotly.graph_objects as go
@@ -34,9 +35,217 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Parsed result files, kept across reruns; the modification time is part of
+# the cache key, so a rewritten file is parsed again on the next rerun
+@st.cache_data(max_entries=4)
+def load_results_file(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a JSON results file"""
+    return orjson.loads(Path(path).read_bytes())
+
+@st.cache_data(max_entries=4)
+def load_feather_file(path: str, mtime: float) -> pd.DataFrame:
+    """Read a Feather table"""
+    return pd.read_feather(path)
+
+# Chart figures, rebuilt only when a component's result changes
+@st.cache_resource(max_entries=16)
+def build_performance_figures(result: Dict[str, Any]) -> Tuple[Optional[go.Figure], Optional[go.Figure]]:
+    """Build the performance chart pair for a component result"""
+    left = right = None
+    
+    # Videos per second chart
+    test_names = list(result.keys())
+    videos_per_sec = [result[test].get("videos_per_second", 0) for test in test_names]
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=[name.replace("_", " ").title() for name in test_names],
+        y=videos_per_sec,
+        marker_color='lightblue',
+        text=[f"{v:.1f}" for v in videos_per_sec],
+        textposition='auto',
+    ))
+    fig.add_hline(y=4.0, line_dash="dash", line_color="red", 
+                 annotation_text="Target: 4 videos/sec")
+    fig.update_layout(
+        title="Videos Per Second by Test",
+        xaxis_title="Test Type",
+        yaxis_title="Videos/Second"
+    )
+    left = fig
+    
+    # Resource utilization
+    if "concurrent_video_processing" in result:
+        concurrent_data = result["concurrent_video_processing"]
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=["CPU Usage", "Memory Usage", "GPU Usage"],
+            y=[
+                concurrent_data.get("cpu_usage_percent", 0),
+                concurrent_data.get("memory_usage_mb", 0) / 10,  # Scale for visibility
+                result.get("gpu_cluster_simulation", {}).get("gpu_usage_percent", 0)
+            ],
+            mode='markers+lines',
+            marker=dict(size=10),
+            line=dict(color='orange')
+        ))
+        fig.update_layout(
+            title="Resource Utilization",
+            xaxis_title="Resource Type",
+            yaxis_title="Usage %"
+        )
+        right = fig
+    
+    return left, right
+
+@st.cache_resource(max_entries=16)
+def build_scalability_figures(result: Dict[str, Any]) -> Tuple[Optional[go.Figure], Optional[go.Figure]]:
+    """Build the scalability chart pair for a component result"""
+    left = right = None
+    
+    # Pod scaling visualization
+    if "kubernetes_pod_scaling" in result:
+        pod_data = result["kubernetes_pod_scaling"]
+        
+        fig = go.Figure()
+        fig.add_trace(go.Scatter(
+            x=[0, pod_data.get("scale_up_time", 0)],
+            y=[pod_data.get("initial_pods", 0), pod_data.get("final_pods", 0)],
+            mode='lines+markers',
+            marker=dict(size=10),
+            line=dict(color='green', width=3)
+        ))
+        fig.update_layout(
+            title="Kubernetes Pod Scaling",
+            xaxis_title="Time (seconds)",
+            yaxis_title="Number of Pods"
+        )
+        left = fig
+    
+    # Database scaling success rates
+    db_tests = [test for test in result.keys() if "database" in test]
+    if db_tests:
+        success_rates = [result[test].get("success_rate", 0) for test in db_tests]
+        
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            x=[test.replace("_", " ").title() for test in db_tests],
+            y=[rate * 100 for rate in success_rates],
+            marker_color='lightgreen',
+            text=[f"{rate:.1%}" for rate in success_rates],
+            textposition='auto',
+        ))
+        fig.add_hline(y=99.5, line_dash="dash", line_color="red",
+                     annotation_text="Target: 99.5%")
+        fig.update_layout(
+            title="Database Scaling Success Rates",
+            xaxis_title="Test Type",
+            yaxis_title="Success Rate (%)"
+        )
+        right = fig
+    
+    return left, right
+
+@st.cache_resource(max_entries=16)
+def build_cost_figures(result: Dict[str, Any]) -> Tuple[Optional[go.Figure], Optional[go.Figure]]:
+    """Build the cost chart pair for a component result"""
+    left = right = None
+    
+    # Cost per video comparison
+    scenarios = list(result.keys())
+    costs_per_video = [result[scenario].get("cost_per_video", 0) for scenario in scenarios]
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=[scenario.replace("_", " ").title() for scenario in scenarios],
+        y=costs_per_video,
+        marker_color=['red' if cost > 0.10 else 'green' for cost in costs_per_video],
+        text=[f"${cost:.3f}" for cost in costs_per_video],
+        textposition='auto',
+    ))
+    fig.add_hline(y=0.10, line_dash="dash", line_color="blue",
+                 annotation_text="Target: $0.10/video")
+    fig.update_layout(
+        title="Cost Per Video by Scenario",
+        xaxis_title="Scenario",
+        yaxis_title="Cost ($)"
+    )
+    left = fig
+    
+    # Monthly cost savings
+    if "optimized_aws" in result and "current_architecture" in result:
+        current_cost = result["current_architecture"].get("total_monthly_cost", 0)
+        optimized_cost = result["optimized_aws"].get("total_monthly_cost", 0)
+        savings = current_cost - optimized_cost
+        
+        fig = go.Figure()
+        fig.add_trace(go.Bar(
+            x=["Current", "Optimized", "Savings"],
+            y=[current_cost, optimized_cost, savings],
+            marker_color=['red', 'green', 'blue'],
+            text=[f"${cost:,.0f}" for cost in [current_cost, optimized_cost, savings]],
+            textposition='auto',
+        ))
+        fig.update_layout(
+            title="Monthly Cost Analysis",
+            xaxis_title="Category",
+            yaxis_title="Cost ($)"
+        )
+        right = fig
+    
+    return left, right
+
+@st.cache_resource(max_entries=16)
+def build_reliability_figures(result: Dict[str, Any]) -> Tuple[Optional[go.Figure], Optional[go.Figure]]:
+    """Build the reliability chart pair for a component result"""
+    left = right = None
+    
+    # Recovery time comparison
+    scenarios = list(result.keys())
+    recovery_times = [result[scenario].get("recovery_time", 0) for scenario in scenarios]
+    
+    fig = go.Figure()
+    fig.add_trace(go.Bar(
+        x=[scenario.replace("_", " ").title() for scenario in scenarios],
+        y=recovery_times,
+        marker_color=['green' if time <= 120 else 'orange' if time <= 300 else 'red' for time in recovery_times],
+        text=[f"{time:.1f}s" for time in recovery_times],
+        textposition='auto',
+    ))
+    fig.add_hline(y=120, line_dash="dash", line_color="blue",
+                 annotation_text="Target: 120s")
+    fig.update_layout(
+        title="Recovery Times by Failure Scenario",
+        xaxis_title="Failure Type",
+        yaxis_title="Recovery Time (seconds)"
+    )
+    left = fig
+    
+    # Success rate donut chart
+    successful_scenarios = sum(1 for scenario in result.values() if scenario.get("success", False))
+    total_scenarios = len(result)
+    
+    fig = go.Figure(data=[go.Pie(
+        labels=['Successful', 'Failed'],
+        values=[successful_scenarios, total_scenarios - successful_scenarios],
+        hole=0.4,
+        marker_colors=['green', 'red']
+    )])
+    fig.update_layout(
+        title="Reliability Test Success Rate",
+        annotations=[dict(text=f"{successful_scenarios}/{total_scenarios}", x=0.5, y=0.5, font_size=20, showarrow=False)]
+    )
+    right = fig
+    
+    return left, right
+
 class ScaleDashboard:
     """Real-time scale testing dashboard"""
     
+    # Columnar copy of the cost summary, written by the cost optimization run
+    COST_SUMMARY_FILE = Path("cost_optimization") / "cost_analysis_summary.feather"
+    
     def __init__(self, results_dir: Path = Path("results")):
         self.results_dir = results_dir
         self.refresh_interval = 30  # seconds
@@ -46,11 +255,18 @@ class ScaleDashboard:
         master_results_file = self.results_dir / "master_scale_test_results.json"
         
         if master_results_file.exists():
-            with open(master_results_file, 'r') as f:
-                return json.load(f)
+            return load_results_file(str(master_results_file), master_results_file.stat().st_mtime)
         else:
             return self.generate_sample_data()
             
+    def load_cost_summary(self) -> Optional[pd.DataFrame]:
+        """Load the per-scenario cost summary table, if the cost run wrote one"""
+        summary_file = self.results_dir / self.COST_SUMMARY_FILE
+        
+        if summary_file.exists():
+            return load_feather_file(str(summary_file), summary_file.stat().st_mtime)
+        return None
+        
     def generate_sample_data(self) -> Dict[str, Any]:
         """Generate sample data for demonstration"""
         return {
@@ -265,202 +481,48 @@ class ScaleDashboard:
         # Real-time Updates
         self.render_real_time_section()
         
+    def render_figure_pair(self, figures: Tuple[Optional[go.Figure], Optional[go.Figure]]):
+        """Render a pair of charts side by side, skipping missing ones"""
+        for column, fig in zip(st.columns(2), figures):
+            if fig is not None:
+                with column:
+                    st.plotly_chart(fig, use_container_width=True)
+                    
     def render_performance_charts(self, performance_data: Dict[str, Any]):
         """Render performance visualization charts"""
         result = performance_data.get("result", {})
         
-        col1, col2 = st.columns(2)
+        self.render_figure_pair(build_performance_figures(result))
         
-        with col1:
-            # Videos per second chart
-            test_names = list(result.keys())
-            videos_per_sec = [result[test].get("videos_per_second", 0) for test in test_names]
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=[name.replace("_", " ").title() for name in test_names],
-                y=videos_per_sec,
-                marker_color='lightblue',
-                text=[f"{v:.1f}" for v in videos_per_sec],
-                textposition='auto',
-            ))
-            fig.add_hline(y=4.0, line_dash="dash", line_color="red", 
-                         annotation_text="Target: 4 videos/sec")
-            fig.update_layout(
-                title="Videos Per Second by Test",
-                xaxis_title="Test Type",
-                yaxis_title="Videos/Second"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-        with col2:
-            # Resource utilization
-            if "concurrent_video_processing" in result:
-                concurrent_data = result["concurrent_video_processing"]
-                
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=["CPU Usage", "Memory Usage", "GPU Usage"],
-                    y=[
-                        concurrent_data.get("cpu_usage_percent", 0),
-                        concurrent_data.get("memory_usage_mb", 0) / 10,  # Scale for visibility
-                        result.get("gpu_cluster_simulation", {}).get("gpu_usage_percent", 0)
-                    ],
-                    mode='markers+lines',
-                    marker=dict(size=10),
-                    line=dict(color='orange')
-                ))
-                fig.update_layout(
-                    title="Resource Utilization",
-                    xaxis_title="Resource Type",
-                    yaxis_title="Usage %"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-                
     def render_scalability_charts(self, scalability_data: Dict[str, Any]):
         """Render scalability visualization charts"""
         result = scalability_data.get("result", {})
         
-        col1, col2 = st.columns(2)
+        self.render_figure_pair(build_scalability_figures(result))
         
-        with col1:
-            # Pod scaling visualization
-            if "kubernetes_pod_scaling" in result:
-                pod_data = result["kubernetes_pod_scaling"]
-                
-                fig = go.Figure()
-                fig.add_trace(go.Scatter(
-                    x=[0, pod_data.get("scale_up_time", 0)],
-                    y=[pod_data.get("initial_pods", 0), pod_data.get("final_pods", 0)],
-                    mode='lines+markers',
-                    marker=dict(size=10),
-                    line=dict(color='green', width=3)
-                ))
-                fig.update_layout(
-                    title="Kubernetes Pod Scaling",
-                    xaxis_title="Time (seconds)",
-                    yaxis_title="Number of Pods"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-                
-        with col2:
-            # Database scaling success rates
-            db_tests = [test for test in result.keys() if "database" in test]
-            if db_tests:
-                success_rates = [result[test].get("success_rate", 0) for test in db_tests]
-                
-                fig = go.Figure()
-                fig.add_trace(go.Bar(
-                    x=[test.replace("_", " ").title() for test in db_tests],
-                    y=[rate * 100 for rate in success_rates],
-                    marker_color='lightgreen',
-                    text=[f"{rate:.1%}" for rate in success_rates],
-                    textposition='auto',
-                ))
-                fig.add_hline(y=99.5, line_dash="dash", line_color="red",
-                             annotation_text="Target: 99.5%")
-                fig.update_layout(
-                    title="Database Scaling Success Rates",
-                    xaxis_title="Test Type",
-                    yaxis_title="Success Rate (%)"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-                
     def render_cost_charts(self, cost_data: Dict[str, Any]):
         """Render cost analysis charts"""
-        result = cost_data.get("result", {})
+        # Prefer the cost run's Feather summary over the master results JSON
+        summary = self.load_cost_summary()
+        if summary is not None:
+            result = {
+                row.scenario: {
+                    "cost_per_video": row.cost_per_video,
+                    "total_monthly_cost": row.total_monthly_cost
+                }
+                for row in summary.itertuples(index=False)
+            }
+        else:
+            result = cost_data.get("result", {})
         
-        col1, col2 = st.columns(2)
+        self.render_figure_pair(build_cost_figures(result))
         
-        with col1:
-            # Cost per video comparison
-            scenarios = list(result.keys())
-            costs_per_video = [result[scenario].get("cost_per_video", 0) for scenario in scenarios]
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=[scenario.replace("_", " ").title() for scenario in scenarios],
-                y=costs_per_video,
-                marker_color=['red' if cost > 0.10 else 'green' for cost in costs_per_video],
-                text=[f"${cost:.3f}" for cost in costs_per_video],
-                textposition='auto',
-            ))
-            fig.add_hline(y=0.10, line_dash="dash", line_color="blue",
-                         annotation_text="Target: $0.10/video")
-            fig.update_layout(
-                title="Cost Per Video by Scenario",
-                xaxis_title="Scenario",
-                yaxis_title="Cost ($)"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-        with col2:
-            # Monthly cost savings
-            if "optimized_aws" in result and "current_architecture" in result:
-                current_cost = result["current_architecture"].get("total_monthly_cost", 0)
-                optimized_cost = result["optimized_aws"].get("total_monthly_cost", 0)
-                savings = current_cost - optimized_cost
-                
-                fig = go.Figure()
-                fig.add_trace(go.Bar(
-                    x=["Current", "Optimized", "Savings"],
-                    y=[current_cost, optimized_cost, savings],
-                    marker_color=['red', 'green', 'blue'],
-                    text=[f"${cost:,.0f}" for cost in [current_cost, optimized_cost, savings]],
-                    textposition='auto',
-                ))
-                fig.update_layout(
-                    title="Monthly Cost Analysis",
-                    xaxis_title="Category",
-                    yaxis_title="Cost ($)"
-                )
-                st.plotly_chart(fig, use_container_width=True)
-                
     def render_reliability_charts(self, reliability_data: Dict[str, Any]):
         """Render reliability analysis charts"""
         result = reliability_data.get("result", {})
         
-        col1, col2 = st.columns(2)
+        self.render_figure_pair(build_reliability_figures(result))
         
-        with col1:
-            # Recovery time comparison
-            scenarios = list(result.keys())
-            recovery_times = [result[scenario].get("recovery_time", 0) for scenario in scenarios]
-            
-            fig = go.Figure()
-            fig.add_trace(go.Bar(
-                x=[scenario.replace("_", " ").title() for scenario in scenarios],
-                y=recovery_times,
-                marker_color=['green' if time <= 120 else 'orange' if time <= 300 else 'red' for time in recovery_times],
-                text=[f"{time:.1f}s" for time in recovery_times],
-                textposition='auto',
-            ))
-            fig.add_hline(y=120, line_dash="dash", line_color="blue",
-                         annotation_text="Target: 120s")
-            fig.update_layout(
-                title="Recovery Times by Failure Scenario",
-                xaxis_title="Failure Type",
-                yaxis_title="Recovery Time (seconds)"
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
-        with col2:
-            # Success rate donut chart
-            successful_scenarios = sum(1 for scenario in result.values() if scenario.get("success", False))
-            total_scenarios = len(result)
-            
-            fig = go.Figure(data=[go.Pie(
-                labels=['Successful', 'Failed'],
-                values=[successful_scenarios, total_scenarios - successful_scenarios],
-                hole=0.4,
-                marker_colors=['green', 'red']
-            )])
-            fig.update_layout(
-                title="Reliability Test Success Rate",
-                annotations=[dict(text=f"{successful_scenarios}/{total_scenarios}", x=0.5, y=0.5, font_size=20, showarrow=False)]
-            )
-            st.plotly_chart(fig, use_container_width=True)
-            
     def render_real_time_section(self):
         """Render real-time monitoring section"""
         st.header("🔄 Real-Time Monitoring")
@@ -491,9 +553,17 @@ class ScaleDashboard:
         # Real-time chart placeholder
         chart_placeholder = st.empty()
         
-        # Generate sample real-time data
-        timestamps = [datetime.now() - timedelta(minutes=i) for i in range(30, 0, -1)]
-        values = [np.random.randint(60, 95) for _ in timestamps]
+        # Rolling window of (timestamp, value) samples kept across reruns,
+        # seeded once per session and advanced by one sample per rerun
+        if "performance_samples" not in st.session_state:
+            now = datetime.now()
+            st.session_state.performance_samples = deque(
+                ((now - timedelta(minutes=i), np.random.randint(60, 95)) for i in range(30, 0, -1)),
+                maxlen=30
+            )
+        samples = st.session_state.performance_samples
+        samples.append((datetime.now(), np.random.randint(60, 95)))
+        timestamps, values = zip(*samples)
         
         fig = go.Figure()
         fig.add_trace(go.Scatter(